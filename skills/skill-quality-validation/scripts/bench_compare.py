@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Performance Regression Gate for bench_validate.py Results
+
+Compares two bench_validate.py result files (or the two most recent runs in
+a --history directory) and fails when either tool got slower per file, or
+when any single check got slower, by more than the noise allows.
+
+A metric counts as regressed when head - base exceeds the largest of:
+    threshold  - relative slowdown (default 10% of base)
+    noise      - sigma x combined standard deviation of the --repeat samples
+    floor      - absolute minimum (--min-file-ms / --min-check-us), so that
+                 sub-microsecond checks never fail the gate on jitter alone
+
+Runs are matched by corpus size and tool. Both files should come from the
+same machine and seed; differing meta is reported but not fatal.
+
+Usage:
+    python bench_compare.py base.json head.json
+    python bench_compare.py --history .bench-history
+    python bench_compare.py --history .bench-history --base-commit 3ede82d
+    python bench_compare.py --history .bench-history --list
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+TOOLS = ('validate_skill_file', 'sync_checker')
+PER_FILE = 'per_file'
+META_KEYS = ('python', 'platform', 'seed', 'validator_version')
+
+
+@dataclass
+class Comparison:
+    """One metric of one tool at one corpus size.
+
+    Per-file metrics are mean ms per file; per-check metrics are µs per file.
+    """
+    size: int
+    tool: str
+    metric: str
+    unit: str
+    base: Optional[float]
+    head: Optional[float]
+    allowed: float
+    status: str  # 'ok', 'regressed', 'improved', 'new', 'removed'
+
+    @property
+    def delta(self) -> Optional[float]:
+        if self.base is None or self.head is None:
+            return None
+        return self.head - self.base
+
+    @property
+    def percent(self) -> Optional[float]:
+        if self.delta is None or not self.base:
+            return None
+        return self.delta / self.base * 100
+
+
+def load_results(path: Path) -> Dict:
+    data = json.loads(path.read_text(encoding='utf-8'))
+    if 'runs' not in data or 'meta' not in data:
+        raise ValueError(f"{path} is not a bench_validate.py result file")
+    return data
+
+
+def history_files(history_dir: Path) -> List[Path]:
+    """History entries, oldest first (file names start with a timestamp)"""
+    return sorted(history_dir.glob('*.json'))
+
+
+def commit_of(path: Path) -> str:
+    return path.stem.split('-', 1)[1] if '-' in path.stem else ''
+
+
+def pick_from_history(history_dir: Path, base_commit: Optional[str] = None) -> Tuple[Path, Path]:
+    """Return (base, head): head is the newest entry, base the one before it
+    or the newest entry recorded at base_commit."""
+    entries = history_files(history_dir)
+    if len(entries) < 2:
+        raise ValueError(f"{history_dir} needs at least two stored runs (found {len(entries)})")
+    head = entries[-1]
+    if base_commit is None:
+        return entries[-2], head
+    candidates = [e for e in entries[:-1] if commit_of(e).startswith(base_commit[:10])]
+    if not candidates:
+        raise ValueError(f"No stored run for commit {base_commit} in {history_dir}")
+    return candidates[-1], head
+
+
+def _stdev(samples: List[float]) -> float:
+    return statistics.stdev(samples) if len(samples) >= 2 else 0.0
+
+
+def _allowed(base: float, base_sd: float, head_sd: float,
+             threshold: float, sigma: float, floor: float) -> float:
+    return max(threshold * base, sigma * math.hypot(base_sd, head_sd), floor)
+
+
+def _classify(base: float, head: float, allowed: float) -> str:
+    if head - base > allowed:
+        return 'regressed'
+    if base - head > allowed:
+        return 'improved'
+    return 'ok'
+
+
+def compare_tool(size: int, tool: str, base: Dict, head: Dict, threshold: float,
+                 sigma: float, min_file_ms: float, min_check_us: float) -> List[Comparison]:
+    """Compare the per-file mean and every per-check cost of one tool"""
+    comparisons = []
+    base_samples = base.get('samples', {})
+    head_samples = head.get('samples', {})
+
+    base_mean = base['per_file']['mean_ms']
+    head_mean = head['per_file']['mean_ms']
+    allowed = _allowed(
+        base_mean,
+        _stdev(base_samples.get('per_file_mean_ms', [])),
+        _stdev(head_samples.get('per_file_mean_ms', [])),
+        threshold, sigma, min_file_ms,
+    )
+    comparisons.append(Comparison(size, tool, PER_FILE, 'ms/file', base_mean, head_mean,
+                                  allowed, _classify(base_mean, head_mean, allowed)))
+
+    # Summed ms over the corpus -> µs per file, so different sizes read alike
+    scale = 1000.0 / size if size else 0.0
+    base_checks = base.get('per_check_ms', {})
+    head_checks = head.get('per_check_ms', {})
+    for name in sorted(set(base_checks) | set(head_checks)):
+        if name not in head_checks:
+            comparisons.append(Comparison(size, tool, name, 'µs/file',
+                                          base_checks[name] * scale, None, 0.0, 'removed'))
+            continue
+        if name not in base_checks:
+            comparisons.append(Comparison(size, tool, name, 'µs/file',
+                                          None, head_checks[name] * scale, 0.0, 'new'))
+            continue
+        base_us = base_checks[name] * scale
+        head_us = head_checks[name] * scale
+        allowed = _allowed(
+            base_us,
+            _stdev(base_samples.get('per_check_ms', {}).get(name, [])) * scale,
+            _stdev(head_samples.get('per_check_ms', {}).get(name, [])) * scale,
+            threshold, sigma, min_check_us,
+        )
+        comparisons.append(Comparison(size, tool, name, 'µs/file', base_us, head_us,
+                                      allowed, _classify(base_us, head_us, allowed)))
+    return comparisons
+
+
+def compare_results(base: Dict, head: Dict, threshold: float = 0.10, sigma: float = 3.0,
+                    min_file_ms: float = 0.05, min_check_us: float = 20.0) -> List[Comparison]:
+    """Compare every (size, tool) pair present in both result files"""
+    head_runs = {run['size']: run for run in head['runs']}
+    comparisons = []
+    for base_run in base['runs']:
+        head_run = head_runs.get(base_run['size'])
+        if head_run is None:
+            continue
+        for tool in TOOLS:
+            if tool in base_run and tool in head_run:
+                comparisons.extend(compare_tool(
+                    base_run['size'], tool, base_run[tool], head_run[tool],
+                    threshold, sigma, min_file_ms, min_check_us,
+                ))
+    return comparisons
+
+
+def meta_mismatches(base: Dict, head: Dict) -> List[str]:
+    return [
+        f"{key}: {base['meta'].get(key)} -> {head['meta'].get(key)}"
+        for key in META_KEYS
+        if base['meta'].get(key) != head['meta'].get(key)
+    ]
+
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def format_text_report(base: Dict, head: Dict, comparisons: List[Comparison],
+                       show_all: bool = False) -> str:
+    icons = {'ok': '✅', 'regressed': '❌', 'improved': '⚡', 'new': '🆕', 'removed': '➖'}
+    lines = []
+    lines.append("=" * 88)
+    lines.append(f"Benchmark comparison: {(base['meta'].get('commit') or 'unknown')[:10]} -> "
+                 f"{(head['meta'].get('commit') or 'unknown')[:10]}")
+    lines.append("=" * 88)
+    for mismatch in meta_mismatches(base, head):
+        lines.append(f"⚠️  meta differs, {mismatch}")
+
+    shown = [c for c in comparisons if show_all or c.metric == PER_FILE or c.status != 'ok']
+    lines.append(f"  {'':2} {'skills':>6}  {'tool':<20} {'metric':<28} {'base':>9} {'head':>9} "
+                 f"{'delta':>8} {'allowed':>8}")
+    for comp in shown:
+        percent = f"{comp.percent:+.0f}%" if comp.percent is not None else "-"
+        lines.append(
+            f"  {icons[comp.status]} {comp.size:>6}  {comp.tool:<20} {comp.metric[:28]:<28} "
+            f"{_fmt(comp.base):>9} {_fmt(comp.head):>9} {percent:>8} {_fmt(comp.allowed):>8}"
+        )
+
+    regressed = [c for c in comparisons if c.status == 'regressed']
+    improved = [c for c in comparisons if c.status == 'improved']
+    lines.append("")
+    lines.append(f"Compared {len(comparisons)} metrics: {len(regressed)} regressed, "
+                 f"{len(improved)} improved")
+    lines.append("❌ FAIL: performance regression" if regressed else "✅ PASS: no regression")
+    lines.append("=" * 88)
+    return "\n".join(lines)
+
+
+def format_json_report(base: Dict, head: Dict, comparisons: List[Comparison]) -> str:
+    data = {
+        'base_commit': base['meta'].get('commit'),
+        'head_commit': head['meta'].get('commit'),
+        'meta_mismatches': meta_mismatches(base, head),
+        'regressed': any(c.status == 'regressed' for c in comparisons),
+        'comparisons': [
+            dict(asdict(c), delta=c.delta, percent=c.percent) for c in comparisons
+        ],
+    }
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fail when bench_validate.py results show a per-file or per-check regression',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python bench_compare.py base.json head.json
+  python bench_compare.py --history .bench-history
+  python bench_compare.py --history .bench-history --base-commit 3ede82d
+  python bench_compare.py --history .bench-history --list
+
+Exit codes:
+  0 - no regression
+  1 - at least one metric regressed
+  2 - missing or unreadable result files
+        """
+    )
+    parser.add_argument('files', nargs='*', metavar='RESULT',
+                        help='Base and head result JSON files')
+    parser.add_argument('--history', metavar='DIR',
+                        help='Compare the newest run in DIR against the one before it')
+    parser.add_argument('--base-commit', help='With --history, compare against this commit instead')
+    parser.add_argument('--list', action='store_true', help='With --history, list stored runs')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Allowed relative slowdown (default: 0.10)')
+    parser.add_argument('--sigma', type=float, default=3.0,
+                        help='Allowed slowdown in combined standard deviations (default: 3.0)')
+    parser.add_argument('--min-file-ms', type=float, default=0.05,
+                        help='Never flag per-file changes below this (default: 0.05 ms)')
+    parser.add_argument('--min-check-us', type=float, default=20.0,
+                        help='Never flag per-check changes below this (default: 20 µs/file)')
+    parser.add_argument('--all', action='store_true', help='Show unchanged per-check rows too')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+
+    args = parser.parse_args()
+
+    try:
+        if args.history:
+            history_dir = Path(args.history)
+            if args.list:
+                for entry in history_files(history_dir):
+                    print(entry.name)
+                exit(0)
+            base_path, head_path = pick_from_history(history_dir, args.base_commit)
+        elif len(args.files) == 2:
+            base_path, head_path = Path(args.files[0]), Path(args.files[1])
+        else:
+            parser.error('give two result files or --history DIR')
+        base = load_results(base_path)
+        head = load_results(head_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        exit(2)
+
+    comparisons = compare_results(
+        base, head,
+        threshold=args.threshold, sigma=args.sigma,
+        min_file_ms=args.min_file_ms, min_check_us=args.min_check_us,
+    )
+    if args.json:
+        print(format_json_report(base, head, comparisons))
+    else:
+        print(format_text_report(base, head, comparisons, show_all=args.all))
+
+    exit(1 if any(c.status == 'regressed' for c in comparisons) else 0)
+
+
+if __name__ == "__main__":
+    main()
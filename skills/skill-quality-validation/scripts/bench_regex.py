@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regex Micro-Benchmark for validate_skill.py
+
+Times every pattern in skill_corpus.REGEX_REGISTRY against a corpus of
+SKILL.md files and reports the per-check regex cost, so expensive patterns
+can be spotted (and tuned) without profiling a whole validation run.
+
+Each pattern is applied to the input its scope describes:
+    text  - the whole document (finditer)
+    line  - every line of the document (search)
+    title - every heading title outside code fences (match)
+
+Usage:
+    python bench_regex.py skills/
+    python bench_regex.py skills/ dotnet/ --repeat 20 --top 10
+    python bench_regex.py skills/ --json
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from skill_corpus import REGEX_REGISTRY, MarkdownDocument, RegexEntry
+from validate_skill import find_skill_files  # registers the validator patterns
+
+
+@dataclass
+class PatternTiming:
+    """Accumulated cost of one registered pattern"""
+    name: str
+    check_id: str
+    scope: str
+    total_seconds: float
+    matches: int
+    files: int
+
+    @property
+    def micros_per_file(self) -> float:
+        return self.total_seconds * 1_000_000 / self.files if self.files else 0.0
+
+
+def check_id_for(name: str) -> str:
+    """'2.3.2.basic' -> '2.3.2', 'tokenizer.fence' -> 'tokenizer'"""
+    return name.rsplit('.', 1)[0] if '.' in name else name
+
+
+def _inputs_for(entry: RegexEntry, doc: MarkdownDocument) -> List[str]:
+    if entry.scope == 'line':
+        return doc.lines
+    if entry.scope == 'title':
+        return [h.title for h in doc.headings]
+    return [doc.content]
+
+
+def time_pattern(entry: RegexEntry, doc: MarkdownDocument, repeat: int) -> Tuple[float, int]:
+    """Return (seconds per run, match count) for one pattern on one document"""
+    inputs = _inputs_for(entry, doc)
+    pattern = entry.pattern
+    find = pattern.search if entry.scope == 'line' else pattern.match
+    matches = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if entry.scope == 'text':
+            matches = sum(1 for _m in pattern.finditer(inputs[0]))
+        else:
+            matches = sum(1 for item in inputs if find(item))
+    return (time.perf_counter() - start) / repeat, matches
+
+
+def benchmark(files: List[Path], repeat: int = 5) -> List[PatternTiming]:
+    """Time every registered pattern over every file"""
+    timings: Dict[str, PatternTiming] = {
+        name: PatternTiming(name, check_id_for(name), entry.scope, 0.0, 0, 0)
+        for name, entry in REGEX_REGISTRY.items()
+    }
+    for file_path in files:
+        doc = MarkdownDocument(file_path.read_text(encoding='utf-8'))
+        for name, entry in REGEX_REGISTRY.items():
+            seconds, matches = time_pattern(entry, doc, repeat)
+            timing = timings[name]
+            timing.total_seconds += seconds
+            timing.matches += matches
+            timing.files += 1
+    return sorted(timings.values(), key=lambda t: t.total_seconds, reverse=True)
+
+
+def per_check(timings: List[PatternTiming]) -> Dict[str, float]:
+    """Sum pattern cost by check ID (µs per file), most expensive first"""
+    totals: Dict[str, float] = {}
+    for timing in timings:
+        totals[timing.check_id] = totals.get(timing.check_id, 0.0) + timing.micros_per_file
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_text_report(timings: List[PatternTiming], file_count: int, top: int) -> str:
+    lines = []
+    lines.append("=" * 80)
+    lines.append(f"Regex micro-benchmark ({file_count} files, {len(timings)} patterns)")
+    lines.append("=" * 80)
+    lines.append("")
+    lines.append("Per check (µs/file):")
+    for check_id, micros in per_check(timings).items():
+        lines.append(f"  {check_id:<28} {micros:>10.1f}")
+    lines.append("")
+    lines.append(f"Slowest patterns (top {top}):")
+    lines.append(f"  {'pattern':<34} {'scope':<6} {'µs/file':>10} {'matches':>9}")
+    for timing in timings[:top]:
+        lines.append(
+            f"  {timing.name:<34} {timing.scope:<6} {timing.micros_per_file:>10.1f} {timing.matches:>9}"
+        )
+    lines.append("=" * 80)
+    return "\n".join(lines)
+
+
+def format_json_report(timings: List[PatternTiming], file_count: int) -> str:
+    data = {
+        'files': file_count,
+        'per_check_us_per_file': per_check(timings),
+        'patterns': [
+            dict(asdict(timing), micros_per_file=timing.micros_per_file) for timing in timings
+        ],
+    }
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time every validate_skill.py regex against a SKILL.md corpus',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python bench_regex.py skills/
+  python bench_regex.py skills/ dotnet/ --repeat 20 --top 10
+  python bench_regex.py skills/ --json
+        """
+    )
+    parser.add_argument('paths', nargs='+', metavar='PATH',
+                        help='SKILL.md files or directories to scan recursively')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per pattern per file (default: 5)')
+    parser.add_argument('--top', type=int, default=15,
+                        help='Number of slowest patterns to list (default: 15)')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+
+    args = parser.parse_args()
+
+    files = find_skill_files(args.paths, recursive=True)
+    if not files:
+        print("❌ Error: no SKILL.md files found", file=sys.stderr)
+        exit(2)
+
+    timings = benchmark(files, repeat=max(1, args.repeat))
+    if args.json:
+        print(format_json_report(timings, len(files)))
+    else:
+        print(format_text_report(timings, len(files), args.top))
+
+
+if __name__ == "__main__":
+    main()
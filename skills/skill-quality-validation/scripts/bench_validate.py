@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic Corpus Benchmark for validate_skill.py and check_sync.py
+
+Builds reproducible synthetic skill corpora with TemplateGenerator
+(skill-template-generator) and times validate_skill_file and
+SyncChecker.check over them, end to end and per check.
+
+Each generated skill varies:
+    steps        - workflow step count (1-15)
+    table rows   - rows in an extra comparison table (0-200)
+    fences       - extra fenced code blocks (0-40)
+    JA density   - share of EN prose lines carrying Japanese text (W5 load)
+
+The same --seed always produces byte-identical corpora.
+
+Usage:
+    python bench_validate.py
+    python bench_validate.py --sizes 100 1000 10000 --output bench.json
+    python bench_validate.py --sizes 1000 --corpus-dir /tmp/corpus --keep-corpus
+    python bench_validate.py --sizes 100 1000 --repeat 5 --history .bench-history
+
+Runs stored with --history are compared with bench_compare.py.
+
+Version: 1.1.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SKILLS_DIR = SCRIPTS_DIR.parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(SKILLS_DIR / "skill-template-generator" / "scripts"))
+sys.path.insert(0, str(SKILLS_DIR / "skills-revise-skill" / "scripts"))
+
+from generate_template import TemplateGenerator
+from check_sync import SyncChecker
+from skill_corpus import DOCUMENT_MEMO
+from validate_skill import VALIDATOR_VERSION, Profiler, validate_skill_file
+
+DEFAULT_SIZES = [100, 1000, 10000]
+FIXED_DATE = "2026-01-01"
+
+# Methods SyncChecker.check() runs, timed individually
+SYNC_CHECKS = ['_check_frontmatter', '_check_sections', '_check_patterns', '_check_examples', '_check_tables']
+
+JA_PHRASES = ['基礎と型を守る', '設定を確認する', '成長の複利', '報連相を徹底', '通知を追加', '文字化け修正']
+
+
+@dataclass
+class SkillShape:
+    """Generation parameters of one synthetic skill"""
+    name: str
+    steps: int
+    table_rows: int
+    fences: int
+    ja_density: float
+
+
+# --- Corpus generation ---
+
+
+def random_shape(rng: random.Random, index: int) -> SkillShape:
+    return SkillShape(
+        name=f"bench-skill-{index:05d}",
+        steps=rng.randint(1, 15),
+        table_rows=rng.choice([0, 5, 20, 200]),
+        fences=rng.choice([0, 2, 10, 40]),
+        ja_density=rng.choice([0.0, 0.0, 0.05, 0.2]),
+    )
+
+
+def _extra_blocks(shape: SkillShape, japanese: bool) -> str:
+    label = "比較" if japanese else "Comparison"
+    parts = [f"\n## {label}\n\n"]
+    if shape.table_rows:
+        parts.append("| Option | When | Cost |\n|--------|------|------|\n")
+        parts.extend(f"| option-{r} | case {r} | {r % 7} |\n" for r in range(shape.table_rows))
+    for f in range(shape.fences):
+        parts.append(f"\n```python\n# example {f}\nvalue = compute({f})\n```\n")
+    return "".join(parts)
+
+
+def _sprinkle_japanese(content: str, density: float, rng: random.Random) -> str:
+    if not density:
+        return content
+    lines = content.split('\n')
+    for i, line in enumerate(lines):
+        if line.startswith('- ') and rng.random() < density:
+            lines[i] = f"{line} ({rng.choice(JA_PHRASES)})"
+    return '\n'.join(lines)
+
+
+def render_skill(shape: SkillShape, rng: random.Random) -> Tuple[str, str]:
+    """Return (SKILL.md, SKILL.ja.md) for one synthetic skill"""
+    generator = TemplateGenerator()
+    generator.skill_name = shape.name
+    generator.description = f"Benchmark skill {shape.name} for validator scaling measurements."
+    generator.tags = ["benchmark", "synthetic", f"steps-{shape.steps}"]
+    generator.step_count = shape.steps
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    en = generator.generate_skill_md().replace(today, FIXED_DATE)
+    ja = generator.generate_skill_ja_md().replace(today, FIXED_DATE)
+
+    en_head, en_tail = en.split("## Best Practices", 1)
+    en = en_head + _extra_blocks(shape, japanese=False) + "\n## Best Practices" + en_tail
+    ja_head, ja_tail = ja.split("## Best Practices", 1)
+    ja = ja_head + _extra_blocks(shape, japanese=True) + "\n## Best Practices" + ja_tail
+    return _sprinkle_japanese(en, shape.ja_density, rng), ja
+
+
+def build_corpus(root: Path, size: int, seed: int = 42) -> List[SkillShape]:
+    """Write `size` skills (EN + references/SKILL.ja.md) under root/skills"""
+    rng = random.Random(seed)
+    shapes = []
+    for index in range(size):
+        shape = random_shape(rng, index)
+        en, ja = render_skill(shape, rng)
+        skill_dir = root / "skills" / shape.name
+        (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(en, encoding='utf-8')
+        (skill_dir / "references" / "SKILL.ja.md").write_text(ja, encoding='utf-8')
+        shapes.append(shape)
+    return shapes
+
+
+# --- Measurement ---
+
+
+def _distribution(seconds: List[float]) -> Dict[str, float]:
+    ordered = sorted(seconds)
+    if not ordered:
+        return {'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+    return {
+        'mean_ms': round(statistics.mean(ordered) * 1000, 4),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 4),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        'max_ms': round(ordered[-1] * 1000, 4),
+    }
+
+
+def time_validator(root: Path, shapes: List[SkillShape]) -> Dict:
+    """validate_skill_file end to end per file, plus the profiler's per-check totals"""
+    profiler = Profiler()
+    per_file = []
+    for shape in shapes:
+        skill_file = str(root / "skills" / shape.name / "SKILL.md")
+        DOCUMENT_MEMO.clear()  # measure cold reads and tokenizing, as in a fresh CI run
+        started = time.perf_counter()
+        validate_skill_file(skill_file, profiler=profiler)
+        per_file.append((time.perf_counter() - started, shape))
+
+    slowest = sorted(per_file, key=lambda item: item[0], reverse=True)[:10]
+    return {
+        'total_s': round(sum(s for s, _ in per_file), 4),
+        'per_file': _distribution([s for s, _ in per_file]),
+        'per_stage_ms': {
+            stage: round(seconds * 1000, 3) for (stage,), seconds, _ in profiler.by_stage()
+        },
+        'per_check_ms': {
+            f"{validator}:{check_id}": round(seconds * 1000, 3)
+            for (validator, check_id), seconds, _ in profiler.by_check()
+        },
+        'slowest_files': [
+            dict(asdict(shape), ms=round(seconds * 1000, 3)) for seconds, shape in slowest
+        ],
+    }
+
+
+def time_sync_checker(root: Path, shapes: List[SkillShape]) -> Dict:
+    """SyncChecker construction + check() per skill, and each _check_* method"""
+    per_file = []
+    per_check: Dict[str, float] = {name: 0.0 for name in ['parse'] + SYNC_CHECKS}
+    for shape in shapes:
+        skill_dir = root / "skills" / shape.name
+        DOCUMENT_MEMO.clear()
+        started = time.perf_counter()
+        checker = SyncChecker(skill_dir)
+        per_check['parse'] += time.perf_counter() - started
+        for name in SYNC_CHECKS:
+            setattr(checker, name, _timed(getattr(checker, name), per_check, name))
+        checker.check()
+        per_file.append(time.perf_counter() - started)
+
+    return {
+        'total_s': round(sum(per_file), 4),
+        'per_file': _distribution(per_file),
+        'per_check_ms': {name: round(seconds * 1000, 3) for name, seconds in per_check.items()},
+    }
+
+
+def _timed(method, totals: Dict[str, float], name: str):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            totals[name] += time.perf_counter() - started
+    return wrapper
+
+
+def _combine_repeats(measurements: List[Dict]) -> Dict:
+    """Keep the median-total repeat as the headline numbers and every repeat as samples.
+
+    bench_compare.py uses the samples to estimate run-to-run noise.
+    """
+    ordered = sorted(measurements, key=lambda m: m['total_s'])
+    combined = dict(ordered[len(ordered) // 2])
+    combined['samples'] = {
+        'per_file_mean_ms': [m['per_file']['mean_ms'] for m in measurements],
+        'per_check_ms': {
+            name: [m['per_check_ms'].get(name, 0.0) for m in measurements]
+            for name in combined['per_check_ms']
+        },
+    }
+    return combined
+
+
+def git_commit() -> Optional[str]:
+    """HEAD commit of the checkout this script lives in (None outside git)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=SCRIPTS_DIR,
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def save_to_history(results: Dict, history_dir: Path) -> Path:
+    """Store results as <timestamp>-<commit>.json so runs sort chronologically"""
+    history_dir.mkdir(parents=True, exist_ok=True)
+    stamp = results['meta']['timestamp'].replace(':', '').replace('-', '')
+    commit = (results['meta'].get('commit') or 'nogit')[:10]
+    path = history_dir / f"{stamp}-{commit}.json"
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+def run_benchmark(sizes: List[int], seed: int = 42, corpus_dir: Optional[Path] = None,
+                  keep_corpus: bool = False, verbose: bool = False, repeat: int = 1) -> Dict:
+    """Generate one corpus per size and time both tools over it `repeat` times"""
+    base = corpus_dir or Path(tempfile.mkdtemp(prefix="skill-bench-"))
+    runs = []
+    try:
+        for size in sizes:
+            root = base / f"corpus-{size}"
+            if root.exists():
+                shutil.rmtree(root)
+            started = time.perf_counter()
+            shapes = build_corpus(root, size, seed=seed)
+            if verbose:
+                print(f"Generated {size} skills in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+            runs.append({
+                'size': size,
+                'validate_skill_file': _combine_repeats([time_validator(root, shapes) for _ in range(repeat)]),
+                'sync_checker': _combine_repeats([time_sync_checker(root, shapes) for _ in range(repeat)]),
+            })
+            if verbose:
+                print(f"Measured {size} skills", file=sys.stderr)
+    finally:
+        if not keep_corpus:
+            # Only remove what this run generated, never a caller-supplied directory
+            targets = [base] if corpus_dir is None else [base / f"corpus-{size}" for size in sizes]
+            for target in targets:
+                shutil.rmtree(target, ignore_errors=True)
+
+    return {
+        'meta': {
+            'validator_version': VALIDATOR_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'commit': git_commit(),
+            'seed': seed,
+            'sizes': sizes,
+            'repeat': repeat,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        },
+        'runs': runs,
+    }
+
+
+def format_text_summary(results: Dict) -> str:
+    lines = []
+    lines.append("=" * 72)
+    lines.append(f"Synthetic corpus benchmark (validator {results['meta']['validator_version']}, "
+                 f"seed {results['meta']['seed']})")
+    lines.append("=" * 72)
+    lines.append(f"  {'skills':>7}  {'tool':<20} {'total s':>9} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for run in results['runs']:
+        for tool in ('validate_skill_file', 'sync_checker'):
+            data = run[tool]
+            dist = data['per_file']
+            lines.append(
+                f"  {run['size']:>7}  {tool:<20} {data['total_s']:>9.2f} "
+                f"{dist['mean_ms']:>9.2f} {dist['p95_ms']:>9.2f} {dist['max_ms']:>9.2f}"
+            )
+    last = results['runs'][-1]['validate_skill_file']['per_check_ms'] if results['runs'] else {}
+    if last:
+        lines.append("")
+        lines.append("Slowest checks in the largest corpus (ms, summed):")
+        for name, ms in sorted(last.items(), key=lambda item: item[1], reverse=True)[:10]:
+            lines.append(f"  {name:<32} {ms:>10.1f}")
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark validate_skill.py and check_sync.py on synthetic corpora',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python bench_validate.py
+  python bench_validate.py --sizes 100 1000 10000 --output bench.json
+  python bench_validate.py --sizes 1000 --corpus-dir /tmp/corpus --keep-corpus
+  python bench_validate.py --sizes 100 1000 --repeat 5 --history .bench-history
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Corpus sizes to generate (default: 100 1000 10000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--corpus-dir', help='Where to generate corpora (default: temporary directory)')
+    parser.add_argument('--keep-corpus', action='store_true', help='Do not delete generated corpora')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timing passes per corpus; their spread is the noise estimate (default: 3)')
+    parser.add_argument('--output', '-o', help='Write results JSON to this file')
+    parser.add_argument('--history', metavar='DIR',
+                        help='Also store results in DIR for bench_compare.py')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show progress on stderr')
+
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        args.sizes,
+        seed=args.seed,
+        corpus_dir=Path(args.corpus_dir) if args.corpus_dir else None,
+        keep_corpus=args.keep_corpus,
+        verbose=args.verbose,
+        repeat=max(1, args.repeat),
+    )
+    print(format_text_summary(results))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Results written to: {args.output}")
+    if args.history:
+        print(f"Stored in history: {save_to_history(results, Path(args.history))}")
+
+
+if __name__ == "__main__":
+    main()
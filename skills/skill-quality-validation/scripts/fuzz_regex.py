@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regex ReDoS Fuzzer for validate_skill.py
+
+Feeds every pattern in skill_corpus.REGEX_REGISTRY adversarial Markdown at
+growing sizes and records each pattern's worst-case time. A pattern whose
+time grows faster than its input is reported as superlinear and the run
+exits 1, so a backtracking pattern is caught before a broken SKILL.md hangs
+CI.
+
+Adversarial cases:
+    unclosed_fence      - a fence that never closes, full of headings and fences
+    heading_flood       - thousands of "##" headings
+    heading_whitespace  - headings padded with huge whitespace runs
+    long_table_row      - one table row with thousands of (escaped) cells
+    unclosed_parens     - "API (" repeated, no closing parenthesis anywhere
+    unclosed_bold       - "**Key" repeated, no closing "**"
+    frontmatter_runs    - frontmatter keys with long runs and no values
+    random.<seed>       - seeded mix of all of the above fragments
+
+Growth is measured as the exponent k in time ~ size^k between the smallest
+and largest input; timings below --floor are too small to judge and pass.
+The tokenizer (MarkdownDocument) is timed as the "document" entry.
+
+Usage:
+    python fuzz_regex.py
+    python fuzz_regex.py --sizes 1000 2000 4000 8000 --seeds 5
+    python fuzz_regex.py --pattern "4.2.*" --json
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import fnmatch
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_regex import check_id_for, time_pattern
+from skill_corpus import REGEX_REGISTRY, MarkdownDocument, RegexEntry
+import validate_skill  # registers the validator patterns
+
+DEFAULT_SIZES = (1000, 2000, 4000, 8000)
+DEFAULT_MAX_EXPONENT = 1.5
+DEFAULT_FLOOR = 0.002  # seconds; below this at the largest size, growth is noise
+DOCUMENT = 'document'
+
+FRONTMATTER = "---\nname: fuzz\ndescription: fuzz\n---\n# Fuzz\n\n"
+
+# Building blocks of the adversarial cases, also mixed by random_case
+FRAGMENTS = (
+    "```python\n",
+    "~~~\n",
+    "``\n",
+    "## Step 1: Pattern 2: Anti-Patterns\n",
+    "## When to Use\n",
+    "### Overview",
+    "#",
+    " " * 64,
+    "\t",
+    "| a \\| b ",
+    "|---",
+    "|",
+    "API (",
+    "(API",
+    ")",
+    "**Key",
+    "**",
+    ":",
+    "name:",
+    "description: '",
+    "  key:",
+    "- ",
+    "1. ",
+    "> **Values**",
+    "基礎と型",
+    "（",
+    "Glossary Last Updated: 2026-",
+    "\n",
+)
+
+
+def _frontmatter_runs(n: int) -> str:
+    return ("---\n" + "name:" + " " * n + "'\n" + "description:" * n + "\n"
+            + "  key:" * n + "\n---\n")
+
+
+ADVERSARIAL_CASES: Dict[str, Callable[[int], str]] = {
+    'unclosed_fence': lambda n: FRONTMATTER + "```python\n" + "## Pattern 1: Hidden\n~~~\n``\n" * n,
+    'heading_flood': lambda n: FRONTMATTER + "## Step 1: Pattern 2: Anti-Patterns\n" * n,
+    'heading_whitespace': lambda n: (FRONTMATTER + "## Spaced" + " " * (8 * n) + "Title\n"
+                                     + "#" + " \t" * (4 * n) + "\n" + "## x" + " " * (8 * n) + "\n"),
+    'long_table_row': lambda n: (FRONTMATTER + "|" + " a \\| b |" * n + "\n"
+                                 + "|" + ":---:|" * n + "\n" + "|" * (4 * n) + "\n"),
+    'unclosed_parens': lambda n: FRONTMATTER + "API (" * n + "\n" + "(" * (4 * n) + "\n",
+    'unclosed_bold': lambda n: FRONTMATTER + "**Key" * n + "\n" + "**" + "x" * (4 * n) + "\n",
+    'frontmatter_runs': _frontmatter_runs,
+}
+
+
+def random_case(seed: int) -> Callable[[int], str]:
+    """Seeded generator mixing FRAGMENTS; the same seed and size give the same text"""
+    def generate(n: int) -> str:
+        rng = random.Random(seed)
+        return FRONTMATTER + "".join(rng.choice(FRAGMENTS) for _ in range(2 * n))
+    return generate
+
+
+def fuzz_cases(seeds: int = 3) -> Dict[str, Callable[[int], str]]:
+    cases = dict(ADVERSARIAL_CASES)
+    for seed in range(seeds):
+        cases[f'random.{seed}'] = random_case(seed)
+    return cases
+
+
+@dataclass
+class FuzzResult:
+    """Worst case seen for one pattern across every case and size"""
+    name: str
+    check_id: str
+    scope: str
+    worst_case: str
+    worst_chars: int
+    worst_seconds: float
+    exponent: float
+    exponent_case: str
+    superlinear: bool
+
+
+def growth_exponent(points: List[Tuple[int, float]], floor: float) -> float:
+    """k in seconds ~ chars^k between the first and last point (0.0 if too fast to judge)"""
+    (small_chars, small_seconds), (large_chars, large_seconds) = points[0], points[-1]
+    if large_seconds < floor or large_chars <= small_chars:
+        return 0.0
+    return math.log(large_seconds / max(small_seconds, 1e-9)) / math.log(large_chars / small_chars)
+
+
+def _best_of(measure: Callable[[], float], repeat: int) -> float:
+    return min(measure() for _ in range(repeat))
+
+
+def _time_document(text: str) -> float:
+    start = time.perf_counter()
+    MarkdownDocument(text)
+    return time.perf_counter() - start
+
+
+def fuzz(entries: Optional[Dict[str, RegexEntry]] = None,
+         cases: Optional[Dict[str, Callable[[int], str]]] = None,
+         sizes: Tuple[int, ...] = DEFAULT_SIZES, repeat: int = 3,
+         max_exponent: float = DEFAULT_MAX_EXPONENT, floor: float = DEFAULT_FLOOR,
+         limit: float = 5.0, include_document: bool = True) -> List[FuzzResult]:
+    """Time every entry on every case at every size, worst growth first
+
+    Sizes stop growing for an entry once one run takes longer than limit
+    seconds, so a catastrophic pattern cannot hang the fuzzer itself.
+    """
+    entries = REGEX_REGISTRY if entries is None else entries
+    cases = fuzz_cases() if cases is None else cases
+    names = ([DOCUMENT] if include_document else []) + list(entries)
+    # name -> case -> [(chars, seconds)]
+    points: Dict[str, Dict[str, List[Tuple[int, float]]]] = {name: {} for name in names}
+    for case, generate in cases.items():
+        over_limit = set()
+        for size in sorted(sizes):
+            text = generate(size)
+            doc = MarkdownDocument(text)
+            for name in names:
+                if name in over_limit:
+                    continue
+                if name == DOCUMENT:
+                    seconds = _best_of(lambda: _time_document(text), repeat)
+                else:
+                    entry = entries[name]
+                    seconds = _best_of(lambda: time_pattern(entry, doc, 1)[0], repeat)
+                points[name].setdefault(case, []).append((len(text), seconds))
+                if seconds > limit:
+                    over_limit.add(name)
+
+    results = []
+    for name in names:
+        scope = 'text' if name == DOCUMENT else entries[name].scope
+        worst_case, worst_chars, worst_seconds = '', 0, 0.0
+        exponent, exponent_case = 0.0, ''
+        for case, series in points[name].items():
+            chars, seconds = series[-1]
+            if seconds > worst_seconds:
+                worst_case, worst_chars, worst_seconds = case, chars, seconds
+            case_exponent = growth_exponent(series, floor)
+            if case_exponent > exponent:
+                exponent, exponent_case = case_exponent, case
+        results.append(FuzzResult(
+            name=name, check_id=check_id_for(name), scope=scope,
+            worst_case=worst_case, worst_chars=worst_chars, worst_seconds=worst_seconds,
+            exponent=exponent, exponent_case=exponent_case,
+            superlinear=exponent > max_exponent or worst_seconds > limit,
+        ))
+    return sorted(results, key=lambda r: (r.superlinear, r.exponent, r.worst_seconds), reverse=True)
+
+
+def format_text_report(results: List[FuzzResult], max_exponent: float, top: int) -> str:
+    flagged = [r for r in results if r.superlinear]
+    lines = []
+    lines.append("=" * 80)
+    lines.append(f"Regex ReDoS fuzz ({len(results)} patterns, max growth exponent {max_exponent:g})")
+    lines.append("=" * 80)
+    lines.append("")
+    lines.append(f"  {'pattern':<30} {'scope':<6} {'worst ms':>9} {'case':<20} {'growth':>7}")
+    for result in results[:top]:
+        marker = "❌" if result.superlinear else "✅"
+        lines.append(
+            f"{marker} {result.name:<30} {result.scope:<6} {result.worst_seconds * 1000:>9.2f} "
+            f"{(result.exponent_case or result.worst_case):<20} {result.exponent:>7.2f}"
+        )
+    lines.append("")
+    if flagged:
+        lines.append(f"❌ Superlinear: {', '.join(r.name for r in flagged)}")
+    else:
+        lines.append("✅ Every pattern grows at most linearly")
+    lines.append("=" * 80)
+    return "\n".join(lines)
+
+
+def format_json_report(results: List[FuzzResult], max_exponent: float) -> str:
+    data = {
+        'max_exponent': max_exponent,
+        'superlinear': [r.name for r in results if r.superlinear],
+        'patterns': [asdict(result) for result in results],
+    }
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fuzz every validate_skill.py regex with adversarial Markdown and flag superlinear growth',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fuzz_regex.py
+  python fuzz_regex.py --sizes 1000 2000 4000 8000 --seeds 5
+  python fuzz_regex.py --pattern "4.2.*" --json
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Case sizes in repeated units (default: 1000 2000 4000 8000)')
+    parser.add_argument('--seeds', type=int, default=3,
+                        help='Number of random mixed cases (default: 3)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the fastest is kept (default: 3)')
+    parser.add_argument('--pattern', action='append', metavar='GLOB',
+                        help='Only fuzz registry names matching GLOB (repeatable)')
+    parser.add_argument('--max-exponent', type=float, default=DEFAULT_MAX_EXPONENT,
+                        help='Growth exponent above which a pattern fails (default: 1.5)')
+    parser.add_argument('--floor', type=float, default=DEFAULT_FLOOR * 1000, metavar='MS',
+                        help='Ignore growth when the largest case runs faster than MS (default: 2)')
+    parser.add_argument('--top', type=int, default=20,
+                        help='Number of patterns to list (default: 20)')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+
+    args = parser.parse_args()
+
+    if len(args.sizes) < 2 or min(args.sizes) <= 0:
+        parser.error('--sizes needs at least two positive sizes')
+    entries = REGEX_REGISTRY
+    if args.pattern:
+        entries = {name: entry for name, entry in REGEX_REGISTRY.items()
+                   if any(fnmatch.fnmatchcase(name, glob) for glob in args.pattern)}
+        if not entries:
+            print(f"❌ Error: no pattern matches {', '.join(args.pattern)}", file=sys.stderr)
+            exit(2)
+
+    results = fuzz(entries, fuzz_cases(max(0, args.seeds)), tuple(args.sizes),
+                   repeat=max(1, args.repeat), max_exponent=args.max_exponent,
+                   floor=args.floor / 1000, include_document=not args.pattern)
+    if args.json:
+        print(format_json_report(results, args.max_exponent))
+    else:
+        print(format_text_report(results, args.max_exponent, args.top))
+
+    exit(1 if any(r.superlinear for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
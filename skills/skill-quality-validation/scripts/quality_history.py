@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SKILL.md Quality Trends Across Git History
+
+Walks the first-parent history of the skill trees and records, for every
+commit that touched a SKILL.md or SKILL.ja.md, the validation result of each
+skill in a local SQLite store. Pass rate and score trends per skill and per
+check are then answered from the store without re-running anything.
+
+Most blobs are unchanged between commits, so results are memoized by what
+the checks actually read: the EN blob SHA, the JA blob SHA (1.12 looks for
+it) and the folder name (1.3). Each unique combination is validated once,
+its blobs streamed from a single `git cat-file --batch` process; reruns
+only validate what the previous backfill has not seen. A rerun over other
+PATHs adds their skills to commits already recorded. One store holds one
+first-parent history; a --rev that diverges from it is refused.
+
+Only check results and scores are stored. Warnings depend on the glossary,
+PHILOSOPHY.md and file dates of the moment and are left out of the trend.
+
+Usage:
+    python quality_history.py backfill
+    python quality_history.py backfill skills/ dotnet/ --since 2026-01-01
+    python quality_history.py trend
+    python quality_history.py trend --skill skill-quality-validation
+    python quality_history.py trend --check 1.12
+    python quality_history.py checks
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from skill_corpus import JA_NAME, GitBlobReader, GitError, git_toplevel, run_git
+from validate_skill import VALIDATOR_VERSION, validate_skill_in_memory
+
+DEFAULT_DB = '.quality-history.db'
+BLOB_MODES = ('100644', '100755')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    sha TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,          -- position in the path-filtered first-parent history
+    committed_at INTEGER NOT NULL  -- unix time
+);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,          -- validator version, EN blob, JA blob, folder name
+    score INTEGER NOT NULL,
+    max_score INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checks (
+    key TEXT NOT NULL,
+    check_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checks_by_key ON checks (key);
+CREATE TABLE IF NOT EXISTS snapshots (
+    commit_sha TEXT NOT NULL,
+    path TEXT NOT NULL,            -- repo-relative SKILL.md
+    skill TEXT NOT NULL,           -- folder name
+    key TEXT NOT NULL,
+    PRIMARY KEY (commit_sha, path)
+);
+"""
+
+
+@dataclass
+class HistoryCommit:
+    sha: str
+    committed_at: int
+    changes: List[Tuple[str, str, str]]  # (status, path, new blob sha)
+
+
+@dataclass
+class BackfillStats:
+    commits_seen: int = 0
+    commits_recorded: int = 0  # commits newly stored or given snapshots of new roots
+    snapshots: int = 0
+    validated: int = 0  # unique (EN, JA, folder) combinations validated in this run
+    memo_hits: int = 0
+    blobs_read: int = 0
+    elapsed_s: float = 0.0
+
+
+def open_store(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def iter_history(repo_root: str, rev: str = 'HEAD') -> Iterator[HistoryCommit]:
+    """First-parent commits touching SKILL.md / SKILL.ja.md, oldest first, with their raw diffs"""
+    output = run_git([
+        '-c', 'core.quotePath=false', 'log', '--first-parent', '--reverse', '--raw',
+        '--no-renames', '--no-abbrev', '--diff-merges=first-parent',
+        '--format=commit %H %ct', rev, '--', '*SKILL.md', '*' + JA_NAME,
+    ], repo_root).decode('utf-8')
+
+    commit: Optional[HistoryCommit] = None
+    for line in output.splitlines():
+        if line.startswith('commit '):
+            if commit is not None:
+                yield commit
+            _, sha, committed_at = line.split()
+            commit = HistoryCommit(sha, int(committed_at), [])
+        elif line.startswith(':') and commit is not None:
+            meta, path = line.split('\t', 1)
+            _, new_mode, _, new_sha, status = meta.split()
+            if new_mode in BLOB_MODES or status == 'D':
+                commit.changes.append((status, path, new_sha))
+    if commit is not None:
+        yield commit
+
+
+def _under(path: str, roots: List[str]) -> bool:
+    return not roots or any(path.startswith(root + '/') for root in roots)
+
+
+def skills_in_tree(tree: Dict[str, str], roots: List[str]) -> List[Tuple[str, str, Optional[str]]]:
+    """(SKILL.md path, EN blob, JA blob) for every skill in a tree snapshot"""
+    skills = []
+    for path, sha in sorted(tree.items()):
+        directory, name = posixpath.split(path)
+        if name != 'SKILL.md' or posixpath.basename(directory) == 'references' or not _under(path, roots):
+            continue
+        ja_sha = tree.get(posixpath.join(directory, 'references', JA_NAME)) or tree.get(posixpath.join(directory, JA_NAME))
+        skills.append((path, sha, ja_sha))
+    return skills
+
+
+def result_key(skill_file: str, en_sha: str, ja_sha: Optional[str]) -> str:
+    folder = posixpath.basename(posixpath.dirname(skill_file))
+    return f"{VALIDATOR_VERSION}:{en_sha}:{ja_sha or '-'}:{folder}"
+
+
+def _validate_blobs(reader: GitBlobReader, skill_file: str, en_sha: str,
+                    ja_sha: Optional[str]):
+    content = reader.read(en_sha).decode('utf-8')
+    ja_content = reader.read(ja_sha).decode('utf-8') if ja_sha else None
+    return validate_skill_in_memory(content, ja_content, file_path=skill_file)
+
+
+def backfill(repo_root: str, connection: sqlite3.Connection, roots: Optional[List[str]] = None,
+             rev: str = 'HEAD', since: Optional[str] = None,
+             progress: Optional[Callable[[BackfillStats], None]] = None) -> BackfillStats:
+    """Record every not-yet-stored skill snapshot of rev's history (optionally only since a date)
+
+    Work is decided per (commit, SKILL.md path), so a later run over other
+    roots adds their skills to commits that are already recorded. The store
+    keeps one history: a rev whose first-parent order disagrees with the
+    recorded commits is refused with ValueError (use another --db).
+    """
+    started = time.perf_counter()
+    roots = [r.strip('/') for r in roots or [] if r.strip('/') not in ('', '.')]
+    since_ts = int(datetime.strptime(since, '%Y-%m-%d').timestamp()) if since else None
+    stats = BackfillStats()
+
+    recorded = dict(connection.execute("SELECT sha, seq FROM commits"))
+    sha_at = {seq: sha for sha, seq in recorded.items()}
+    stored: Dict[str, set] = {}
+    for commit_sha, path in connection.execute("SELECT commit_sha, path FROM snapshots"):
+        stored.setdefault(commit_sha, set()).add(path)
+    known = {row[0] for row in connection.execute("SELECT key FROM results")}
+    tree: Dict[str, str] = {}
+
+    with GitBlobReader(repo_root) as reader, connection:
+        for seq, commit in enumerate(iter_history(repo_root, rev)):
+            stats.commits_seen += 1
+            # The tree is replayed from the first commit even when only recent ones are recorded
+            for status, path, sha in commit.changes:
+                if status == 'D':
+                    tree.pop(path, None)
+                else:
+                    tree[path] = sha
+            if recorded.get(commit.sha, seq) != seq or sha_at.get(seq, commit.sha) != commit.sha:
+                raise ValueError(f"{rev} does not follow the history recorded in this store "
+                                 f"(commit {commit.sha[:10]}); use a separate --db")
+            if since_ts is not None and commit.committed_at < since_ts:
+                continue
+
+            rows = []
+            done = stored.get(commit.sha, ())
+            for skill_file, en_sha, ja_sha in skills_in_tree(tree, roots):
+                if skill_file in done:
+                    continue
+                key = result_key(skill_file, en_sha, ja_sha)
+                if key in known:
+                    stats.memo_hits += 1
+                else:
+                    report = _validate_blobs(reader, skill_file, en_sha, ja_sha)
+                    connection.execute(
+                        "INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+                        (key, report.total_score, report.total_max_score,
+                         report.overall_percentage, int(report.overall_passed)),
+                    )
+                    connection.executemany(
+                        "INSERT INTO checks VALUES (?, ?, ?, ?)",
+                        [(key, check.id, category.name, int(check.passed))
+                         for category in report.categories for check in category.checks],
+                    )
+                    known.add(key)
+                    stats.validated += 1
+                rows.append((commit.sha, skill_file, posixpath.basename(posixpath.dirname(skill_file)), key))
+
+            if commit.sha in recorded and not rows:
+                continue
+            if commit.sha not in recorded:
+                connection.execute("INSERT INTO commits VALUES (?, ?, ?)", (commit.sha, seq, commit.committed_at))
+            connection.executemany("INSERT INTO snapshots VALUES (?, ?, ?, ?)", rows)
+            stats.commits_recorded += 1
+            stats.snapshots += len(rows)
+            if progress is not None:
+                progress(stats)
+        stats.blobs_read = reader.requests
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+
+# --- Trend queries ---
+
+@dataclass
+class TrendPoint:
+    """Aggregate of one commit: pass rate over skills (or over one check) and mean score"""
+    commit: str
+    committed_at: int
+    skills: int
+    passed: int
+    mean_percentage: Optional[float]
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.skills * 100 if self.skills else 0.0
+
+
+def query_trend(connection: sqlite3.Connection, skill: Optional[str] = None,
+                check: Optional[str] = None) -> List[TrendPoint]:
+    """One point per recorded commit, oldest first.
+
+    skill limits the aggregate to that folder name; check reports the pass
+    rate of that check id instead of the overall result (mean score is then
+    the skills' overall score, for context).
+    """
+    where = "WHERE s.skill = ?" if skill else ""
+    params: Tuple = (skill,) if skill else ()
+    if check:
+        passed = "SUM(COALESCE((SELECT MAX(k.passed) FROM checks k WHERE k.key = s.key AND k.check_id = ?), 0))"
+        params = (check,) + params
+    else:
+        passed = "SUM(r.passed)"
+    rows = connection.execute(f"""
+        SELECT c.sha, c.committed_at, COUNT(*), {passed}, AVG(r.percentage)
+        FROM snapshots s
+        JOIN commits c ON c.sha = s.commit_sha
+        JOIN results r ON r.key = s.key
+        {where}
+        GROUP BY c.sha
+        ORDER BY c.seq
+    """, params).fetchall()
+    return [TrendPoint(*row) for row in rows]
+
+
+def query_checks(connection: sqlite3.Connection) -> List[Dict]:
+    """Per-check pass rate at the first and the latest recorded commit"""
+    bounds = connection.execute("SELECT MIN(seq), MAX(seq) FROM commits").fetchone()
+    if bounds[0] is None:
+        return []
+    rates: Dict[str, Dict] = {}
+    for label, seq in (('first', bounds[0]), ('latest', bounds[1])):
+        for check_id, category, passed, total in connection.execute("""
+            SELECT k.check_id, k.category, SUM(k.passed), COUNT(*)
+            FROM snapshots s
+            JOIN commits c ON c.sha = s.commit_sha
+            JOIN checks k ON k.key = s.key
+            WHERE c.seq = ?
+            GROUP BY k.check_id, k.category
+        """, (seq,)):
+            entry = rates.setdefault(check_id, {'check': check_id, 'category': category,
+                                                'first': None, 'latest': None})
+            entry[label] = passed / total * 100
+    return sorted(rates.values(), key=lambda e: [(0, int(p), '') if p.isdigit() else (1, 0, p)
+                                                 for p in e['check'].split('.')])
+
+
+def _changed_points(points: List[TrendPoint]) -> List[TrendPoint]:
+    """First, last, and every point whose pass count or mean score moved"""
+    shown = []
+    for i, point in enumerate(points):
+        previous = points[i - 1] if i else None
+        if (previous is None or i == len(points) - 1
+                or (point.skills, point.passed) != (previous.skills, previous.passed)
+                or round(point.mean_percentage or 0, 1) != round(previous.mean_percentage or 0, 1)):
+            shown.append(point)
+    return shown
+
+
+def format_trend_text(points: List[TrendPoint], title: str, show_all: bool = False) -> str:
+    lines = []
+    lines.append("=" * 72)
+    lines.append(title)
+    lines.append("=" * 72)
+    if not points:
+        lines.append("No recorded commits (run backfill first)")
+        return "\n".join(lines)
+    lines.append(f"  {'date':<10}  {'commit':<10}  {'skills':>6}  {'passed':>6}  {'pass rate':>9}  {'mean score':>10}")
+    previous = None
+    for point in points if show_all else _changed_points(points):
+        day = datetime.fromtimestamp(point.committed_at).strftime('%Y-%m-%d')
+        arrow = ''
+        if previous is not None and point.pass_rate != previous.pass_rate:
+            arrow = ' ↑' if point.pass_rate > previous.pass_rate else ' ↓'
+        mean = f"{point.mean_percentage:.1f}%" if point.mean_percentage is not None else "-"
+        lines.append(f"  {day:<10}  {point.commit[:10]:<10}  {point.skills:>6}  {point.passed:>6}  "
+                     f"{point.pass_rate:>8.1f}%  {mean:>10}{arrow}")
+        previous = point
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+def format_checks_text(rows: List[Dict]) -> str:
+    lines = []
+    lines.append("=" * 72)
+    lines.append("Per-check pass rate: first recorded commit -> latest")
+    lines.append("=" * 72)
+    for row in rows:
+        first = f"{row['first']:.0f}%" if row['first'] is not None else "-"
+        latest = f"{row['latest']:.0f}%" if row['latest'] is not None else "-"
+        icon = '✅' if row['latest'] == 100 else ('❌' if row['latest'] is not None and row['latest'] < 80 else '⚠️ ')
+        lines.append(f"{icon} {row['check']:<6} {row['category'][:30]:<30} {first:>6} -> {latest:>6}")
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Record SKILL.md validation results across git history and report quality trends',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python quality_history.py backfill
+  python quality_history.py backfill skills/ dotnet/ --since 2026-01-01
+  python quality_history.py trend
+  python quality_history.py trend --skill skill-quality-validation --all
+  python quality_history.py trend --check 1.12 --json
+  python quality_history.py checks
+
+Exit codes:
+  0 - success
+  2 - not a git repository, unknown revision, or unreadable store
+        """
+    )
+    parser.add_argument('command', choices=['backfill', 'trend', 'checks'])
+    parser.add_argument('paths', nargs='*', metavar='PATH',
+                        help='backfill: only record skills under these repo-relative directories')
+    parser.add_argument('--db', help=f'SQLite store (default: <repo root>/{DEFAULT_DB})')
+    parser.add_argument('--rev', default='HEAD', help='backfill: history to walk (default: HEAD)')
+    parser.add_argument('--since', metavar='YYYY-MM-DD', help='backfill: only record commits from this date')
+    parser.add_argument('--skill', help='trend: one skill (folder name)')
+    parser.add_argument('--check', help='trend: pass rate of one check id instead of overall')
+    parser.add_argument('--all', action='store_true', help='trend: list every commit, not only changes')
+    parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--verbose', '-v', action='store_true', help='backfill: print progress')
+
+    args = parser.parse_intermixed_args()
+
+    try:
+        repo_root = git_toplevel('.')
+        connection = open_store(args.db or os.path.join(repo_root, DEFAULT_DB))
+        if args.command == 'backfill':
+            def progress(stats: BackfillStats) -> None:
+                print(f"  {stats.commits_recorded} commits, {stats.validated} validated, "
+                      f"{stats.memo_hits} memo hits", file=sys.stderr)
+            prefix = os.path.relpath(os.getcwd(), repo_root)
+            roots = [posixpath.normpath(posixpath.join(prefix.replace(os.sep, '/'), p.replace(os.sep, '/')))
+                     for p in args.paths]
+            stats = backfill(repo_root, connection, roots, rev=args.rev, since=args.since,
+                             progress=progress if args.verbose else None)
+            if args.json:
+                print(json.dumps(stats.__dict__, indent=2))
+            else:
+                print(f"✅ Recorded {stats.commits_recorded} of {stats.commits_seen} commits "
+                      f"({stats.snapshots} skill snapshots) in {stats.elapsed_s:.1f}s")
+                print(f"   Validated {stats.validated} unique blobs, {stats.memo_hits} memo hits, "
+                      f"{stats.blobs_read} blobs read")
+        elif args.command == 'trend':
+            points = query_trend(connection, skill=args.skill, check=args.check)
+            if args.json:
+                print(json.dumps([dict(p.__dict__, pass_rate=p.pass_rate) for p in points], indent=2))
+            else:
+                subject = f"check {args.check}" if args.check else "overall"
+                scope = f"skill {args.skill}" if args.skill else "all skills"
+                print(format_trend_text(points, f"Quality trend: {subject} pass rate, {scope}", args.all))
+        else:
+            rows = query_checks(connection)
+            print(json.dumps(rows, indent=2, ensure_ascii=False) if args.json else format_checks_text(rows))
+    except (GitError, sqlite3.Error, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        exit(2)
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,844 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared SKILL.md Parsing
+
+Single-pass Markdown tokenizer, the precompiled regex registry, an
+in-process document memo and a repository snapshot index shared by
+validate_skill.py and skills-revise-skill/scripts/check_sync.py. Each file
+is read and tokenized at most once per process while its mtime and size
+stay the same, even when both tools run in the same process. Both tools also
+select changed skills from git here (--changed-since / --staged).
+
+Usage:
+    from skill_corpus import load_document, read_text
+    doc = load_document(Path("skills/foo/references/SKILL.ja.md"))
+
+    index = RepoIndex.scan(["skills"])
+    index.ja_file_for("skills/foo/SKILL.md")
+
+    changes = collect_changes(".", staged=True)  # touched skills, as staged
+
+Version: 1.2.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import os
+import posixpath
+import re
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+# --- Precompiled regex registry ---
+# Patterns are compiled once at import and registered by name (prefixed with the
+# check that uses them) so bench_regex.py can time each one.
+
+
+@dataclass(frozen=True)
+class RegexEntry:
+    """Registered pattern plus the input it is applied to"""
+    name: str
+    pattern: 're.Pattern[str]'
+    scope: str  # 'text' = whole document, 'line' = single lines, 'title' = heading titles
+
+
+REGEX_REGISTRY: Dict[str, RegexEntry] = {}
+
+
+def register_regex(name: str, pattern: str, flags: int = 0, scope: str = 'text') -> 're.Pattern[str]':
+    compiled = re.compile(pattern, flags)
+    REGEX_REGISTRY[name] = RegexEntry(name, compiled, scope)
+    return compiled
+
+
+# Tokenizer
+RE_FENCE = register_regex('tokenizer.fence', r'^ {0,3}([`~]{3,})(.*)$', scope='line')
+# Title is stripped by the tokenizer; a lazy `(.+?)\s*$` backtracks quadratically on long blank runs
+RE_HEADING = register_regex('tokenizer.heading', r'^(#{1,6})\s+(.+)$', scope='line')
+RE_LIST_ITEM = register_regex('tokenizer.list_item', r'^(\s*)([-*+]|\d+[.)])\s+(.+)$', scope='line')
+RE_BLOCKQUOTE = register_regex('tokenizer.blockquote', r'^ {0,3}>\s?(.*)$', scope='line')
+RE_FRONTMATTER_DELIMITER = register_regex('tokenizer.frontmatter_delimiter', r'^---\s*$', scope='line')
+RE_TABLE_CELL_SEPARATOR = register_regex('tokenizer.table_cell_separator', r'(?<!\\)\|', scope='line')
+RE_TABLE_DELIMITER_CELL = register_regex('tokenizer.table_delimiter_cell', r'^:?-+:?$', scope='line')
+
+
+# --- Parsed Markdown document (single-pass tokenizer) ---
+# Line numbers in tokens are 0-based indexes into MarkdownDocument.lines.
+
+
+@dataclass
+class Heading:
+    """ATX heading outside fenced code"""
+    level: int
+    title: str
+    line: int
+
+
+@dataclass
+class FenceBlock:
+    """Fenced code block (CommonMark: up to 3 leading spaces, ``` or ~~~)"""
+    start: int  # opening marker line
+    end: int  # closing marker line, or last line when unclosed
+    info: str
+    closed: bool
+    body: str
+
+
+def split_table_row(row: str) -> List[str]:
+    """Cells of one pipe-table row, outer pipes dropped (escaped \\| stays in the cell)"""
+    row = row.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip() for cell in RE_TABLE_CELL_SEPARATOR.split(row)]
+
+
+@dataclass
+class TableBlock:
+    """Run of consecutive pipe-table rows outside fenced code.
+
+    The single table model for every check: shape comes from the header row,
+    and row_count excludes the header and the |---| delimiter row.
+    """
+    start: int
+    end: int  # inclusive
+    rows: List[str]
+
+    @cached_property
+    def header(self) -> List[str]:
+        return split_table_row(self.rows[0])
+
+    @property
+    def columns(self) -> int:
+        return len(self.header)
+
+    @cached_property
+    def has_delimiter(self) -> bool:
+        return len(self.rows) > 1 and all(
+            RE_TABLE_DELIMITER_CELL.match(cell) for cell in split_table_row(self.rows[1])
+        )
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows) - (2 if self.has_delimiter else 1)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(columns, data rows)"""
+        return self.columns, self.row_count
+
+
+@dataclass
+class ListItem:
+    """Bullet or ordered list item outside fenced code"""
+    line: int
+    indent: int
+    marker: str
+    text: str
+
+
+@dataclass
+class Blockquote:
+    """Blockquote line outside fenced code"""
+    line: int
+    text: str
+
+
+class MarkdownDocument:
+    """SKILL.md tokenized once into frontmatter, headings, fences, tables, lists and blockquotes.
+
+    Validators read these tokens instead of rescanning the raw text with
+    separate regex passes.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lines = content.split('\n')
+        self.frontmatter: Optional[str] = None
+        self.body_start = 0  # first line after frontmatter
+        self.headings: List[Heading] = []
+        self.fences: List[FenceBlock] = []
+        self.tables: List[TableBlock] = []
+        self.list_items: List[ListItem] = []
+        self.blockquotes: List[Blockquote] = []
+        self._prose_lines: List[str] = []
+        self._term_scans: Dict[str, 'TermScan'] = {}
+        self._tokenize()
+        self.prose = '\n'.join(self._prose_lines)
+
+    def _tokenize(self):
+        lines = self.lines
+        self._read_frontmatter()
+
+        fence: Optional[Tuple[int, str, int, str]] = None  # (start, char, length, info)
+        table: Optional[TableBlock] = None
+
+        for idx, line in enumerate(lines):
+            # Frontmatter stays in prose (legacy regexes saw it) but yields no block tokens
+            if idx < self.body_start:
+                self._prose_lines.append(line)
+                continue
+
+            fence_match = RE_FENCE.match(line)
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = (idx, marker[0], len(marker), fence_match.group(2).strip())
+                elif marker[0] == fence[1] and len(marker) >= fence[2]:
+                    self._close_fence(fence, idx, closed=True)
+                    fence = None
+                table = None
+                continue
+            if fence is not None:
+                continue
+
+            self._prose_lines.append(line)
+
+            if line.strip().startswith('|'):
+                if table is None:
+                    table = TableBlock(start=idx, end=idx, rows=[])
+                    self.tables.append(table)
+                table.end = idx
+                table.rows.append(line)
+                continue
+            table = None
+
+            heading_match = RE_HEADING.match(line)
+            if heading_match:
+                self.headings.append(Heading(
+                    level=len(heading_match.group(1)),
+                    title=heading_match.group(2).strip(),
+                    line=idx,
+                ))
+                continue
+
+            item_match = RE_LIST_ITEM.match(line)
+            if item_match:
+                self.list_items.append(ListItem(
+                    line=idx,
+                    indent=len(item_match.group(1)),
+                    marker=item_match.group(2),
+                    text=item_match.group(3),
+                ))
+                continue
+
+            quote_match = RE_BLOCKQUOTE.match(line)
+            if quote_match:
+                self.blockquotes.append(Blockquote(line=idx, text=quote_match.group(1)))
+
+        if fence is not None:
+            self._close_fence(fence, len(lines) - 1, closed=False)
+
+    def _read_frontmatter(self):
+        lines = self.lines
+        if not lines or not RE_FRONTMATTER_DELIMITER.match(lines[0]):
+            return
+        # Closing delimiter must be followed by a newline, as in the legacy regex
+        for idx in range(2, len(lines) - 1):
+            if RE_FRONTMATTER_DELIMITER.match(lines[idx]):
+                self.frontmatter = '\n'.join(lines[1:idx])
+                self.body_start = idx + 1
+                return
+
+    def _close_fence(self, fence: Tuple[int, str, int, str], end: int, closed: bool):
+        start, _, _, info = fence
+        body_end = end if closed else end + 1
+        body = '\n'.join(self.lines[start + 1:body_end])
+        self.fences.append(FenceBlock(start=start, end=end, info=info, closed=closed, body=body))
+
+    @property
+    def code_blocks(self) -> List[str]:
+        """Bodies of all fenced code blocks"""
+        return [f.body for f in self.fences]
+
+    def headings_at(self, *levels: int) -> List[Heading]:
+        return [h for h in self.headings if h.level in levels]
+
+    def h2_body(self, heading: Heading) -> str:
+        """Raw text between an H2 heading and the next H2 (or end of file)"""
+        end = len(self.lines)
+        for other in self.headings:
+            if other.line > heading.line and other.level == 2:
+                end = other.line
+                break
+        return '\n'.join(self.lines[heading.line + 1:end])
+
+    def tables_in(self, start: int, end: int) -> List[TableBlock]:
+        """Tables starting within lines [start, end)"""
+        return [t for t in self.tables if start <= t.start < end]
+
+    def scan_terms(self, scanner: 'TermScanner') -> 'TermScan':
+        """scanner run over the whole content, once per document"""
+        scan = self._term_scans.get(scanner.name)
+        if scan is None:
+            scan = self._term_scans[scanner.name] = scanner.scan(self.content)
+        return scan
+
+
+def table_shape_mismatches(en_tables: List[TableBlock], ja_tables: List[TableBlock]
+                           ) -> List[Tuple[int, TableBlock, TableBlock]]:
+    """(1-based table number, EN table, JA table) for tables at the same position whose shape differs"""
+    return [
+        (number, en, ja)
+        for number, (en, ja) in enumerate(zip(en_tables, ja_tables), 1)
+        if en.shape != ja.shape
+    ]
+
+
+# --- Multi-term vocabulary scanner ---
+# Vocabulary checks used to lowercase and rescan the whole file once per term.
+# TermScanner folds every list into one character trie compiled to a single
+# registered regex, so one left-to-right pass finds all terms of all lists,
+# with positions. Like Aho-Corasick it reports overlapping terms: the search
+# restarts one character after each match start, and every shorter term that
+# is a prefix of the match is credited too. The regex engine does the
+# scanning in C, which beats a per-character automaton loop in Python.
+
+
+@dataclass(frozen=True)
+class Vocabulary:
+    """A named term list; whole_words terms only count between word boundaries"""
+    terms: Tuple[str, ...]
+    whole_words: bool = False
+
+
+@dataclass(frozen=True)
+class TermMatch:
+    vocabulary: str
+    term: str  # as listed in the vocabulary
+    start: int  # offset into the scanned text
+    end: int
+    line: int  # 1-based
+    column: int  # 1-based
+
+
+class TermScan:
+    """All matches of one scan, queried per vocabulary"""
+
+    def __init__(self, matches: List[TermMatch]):
+        self.matches = matches
+        self._by_vocabulary: Dict[str, List[TermMatch]] = {}
+        for match in matches:
+            self._by_vocabulary.setdefault(match.vocabulary, []).append(match)
+
+    def of(self, vocabulary: str) -> List[TermMatch]:
+        return self._by_vocabulary.get(vocabulary, [])
+
+    def count(self, vocabulary: str) -> int:
+        return len(self.of(vocabulary))
+
+    def found(self, vocabulary: str) -> set:
+        return {match.term for match in self.of(vocabulary)}
+
+    def lines(self, vocabulary: str) -> List[int]:
+        """Distinct 1-based lines with a match, in order"""
+        return sorted({match.line for match in self.of(vocabulary)})
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+class TermScanner:
+    """Every vocabulary matched in one pass; case-insensitive when ignore_case.
+
+    Built once at import; scan() is safe to call from many threads.
+    """
+
+    def __init__(self, name: str, vocabularies: Dict[str, Vocabulary], ignore_case: bool = True):
+        self.name = name
+        self.vocabularies = vocabularies
+        self.ignore_case = ignore_case
+        # folded term -> [(vocabulary, whole_words, term as listed)]; a term may be in several lists
+        self._owners: Dict[str, List[Tuple[str, bool, str]]] = {}
+        for vocabulary_name, vocabulary in vocabularies.items():
+            for term in vocabulary.terms:
+                key = term.lower() if ignore_case else term
+                self._owners.setdefault(key, []).append((vocabulary_name, vocabulary.whole_words, term))
+        terms = sorted(self._owners)
+        # Longest match first; shorter terms that are its prefixes are credited from here
+        self._prefixes: Dict[str, List[str]] = {
+            term: [other for other in terms if term.startswith(other)] for term in terms
+        }
+        self.pattern = register_regex(name, self._trie_pattern(terms))
+
+    @staticmethod
+    def _trie_pattern(terms: List[str]) -> str:
+        trie: Dict = {}
+        for term in terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+
+        def emit(node: Dict) -> str:
+            # Children before the end marker, so the engine prefers the longest term
+            alternatives = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+            if '' in node:
+                alternatives.append('')
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return '(?:' + '|'.join(alternatives) + ')'
+
+        return emit(trie)
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        folded = text.lower()
+        if len(folded) != len(text):  # e.g. 'İ' lowers to two characters; keep offsets aligned
+            folded = ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+        return folded
+
+    def scan(self, text: str) -> TermScan:
+        folded = self._fold(text)
+        search = self.pattern.search
+        matches: List[TermMatch] = []
+        line, line_start, counted = 1, 0, 0
+        position = 0
+        while True:
+            found = search(folded, position)
+            if found is None:
+                break
+            start = found.start()
+            position = start + 1
+            newlines = folded.count('\n', counted, start)
+            if newlines:
+                line += newlines
+                line_start = folded.rfind('\n', counted, start) + 1
+            counted = start
+            before = folded[start - 1] if start else ''
+            for term in self._prefixes[found.group()]:
+                end = start + len(term)
+                after = folded[end] if end < len(folded) else ''
+                bounded = (not (before and _is_word_char(before) and _is_word_char(term[0]))
+                           and not (after and _is_word_char(after) and _is_word_char(term[-1])))
+                for vocabulary, whole_words, listed in self._owners[term]:
+                    if bounded or not whole_words:
+                        matches.append(TermMatch(vocabulary, listed, start, end,
+                                                 line, start - line_start + 1))
+        return TermScan(matches)
+
+
+# --- In-process document memo ---
+
+
+@dataclass
+class _MemoEntry:
+    stamp: Tuple[int, int]  # (st_mtime_ns, st_size)
+    raw: bytes
+    text: Optional[str] = None
+    document: Optional[MarkdownDocument] = None
+
+
+class DocumentMemo:
+    """Bytes, text and tokenized documents keyed by absolute path, mtime and size.
+
+    A changed mtime or size invalidates the entry, so long-running processes
+    (--watch) see edits. The least recently used entries are dropped beyond
+    max_entries. Safe to share between threads.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, _MemoEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.reads = 0  # file reads performed (memo misses)
+
+    def _entry(self, path: Union[str, Path]) -> _MemoEntry:
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                return entry
+        with open(key, 'rb') as f:
+            entry = _MemoEntry(stamp=stamp, raw=f.read())
+        with self._lock:
+            self.reads += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read_bytes(self, path: Union[str, Path]) -> bytes:
+        return self._entry(path).raw
+
+    def read_text(self, path: Union[str, Path]) -> str:
+        entry = self._entry(path)
+        if entry.text is None:
+            entry.text = entry.raw.decode('utf-8')
+        return entry.text
+
+    def load_document(self, path: Union[str, Path]) -> MarkdownDocument:
+        entry = self._entry(path)
+        if entry.document is None:
+            if entry.text is None:
+                entry.text = entry.raw.decode('utf-8')
+            entry.document = MarkdownDocument(entry.text)
+        return entry.document
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+DOCUMENT_MEMO = DocumentMemo()
+
+
+def read_bytes(path: Union[str, Path]) -> bytes:
+    """Raw file bytes, read at most once per (path, mtime, size)"""
+    return DOCUMENT_MEMO.read_bytes(path)
+
+
+def read_text(path: Union[str, Path]) -> str:
+    """UTF-8 file text, decoded at most once per (path, mtime, size)"""
+    return DOCUMENT_MEMO.read_text(path)
+
+
+def load_document(path: Union[str, Path]) -> MarkdownDocument:
+    """Tokenized document, parsed at most once per (path, mtime, size)"""
+    return DOCUMENT_MEMO.load_document(path)
+
+
+# --- Repository snapshot index ---
+# One os.scandir pass over the roots being validated answers every "does the
+# JA companion exist?" and "where is the glossary?" question from memory. On
+# network-mounted checkouts those per-file stat probes cost more than parsing.
+
+GLOSSARY_DIR = '.github'
+GLOSSARY_NAME = 'copilot-instructions.md'
+PHILOSOPHY_NAME = 'PHILOSOPHY.md'
+JA_NAME = 'SKILL.ja.md'
+
+
+@dataclass
+class SkillEntry:
+    """One skill directory as seen by RepoIndex.scan"""
+    directory: str  # absolute
+    skill_file: str
+    mtime: float  # SKILL.md st_mtime
+    ja_file: Optional[str] = None  # references/SKILL.ja.md, else SKILL.ja.md
+    assets: List[str] = None  # other files in the skill tree, relative to directory
+
+    def __post_init__(self):
+        if self.assets is None:
+            self.assets = []
+
+
+class RepoIndex:
+    """Snapshot of skill directories, JA companions, assets, glossaries and PHILOSOPHY.md.
+
+    Built once at startup; read-only afterwards, so it is safe to share between
+    threads and cheap to hand to worker processes. Paths outside the scanned
+    roots are not covered (callers fall back to probing the disk).
+    SKILL.md discovery mirrors validate_skill.find_skill_files: references/ and
+    hidden directories are never searched for skills.
+    """
+
+    def __init__(self):
+        self.roots: List[str] = []
+        self.skills: Dict[str, SkillEntry] = {}  # skill directory -> entry, in discovery order
+        self.glossaries: Dict[str, str] = {}  # directory holding .github/ -> glossary path
+        self.philosophies: Dict[str, str] = {}  # directory -> PHILOSOPHY.md path
+        self.repo_root: Optional[str] = None  # nearest ancestor with .git
+        self.directories_scanned = 0
+
+    @classmethod
+    def scan(cls, roots: Iterable[Union[str, Path]]) -> 'RepoIndex':
+        index = cls()
+        for root in roots:
+            root = os.path.abspath(root)
+            if not os.path.isdir(root) or index.covers(root):
+                continue
+            index.roots.append(root)
+            index._scan_ancestors(root)
+            index._scan_tree(root)
+        return index
+
+    def _scan_ancestors(self, root: str) -> None:
+        """Glossaries, PHILOSOPHY.md and .git above the root: O(depth) probes once per root"""
+        directory = root
+        while True:
+            if self.repo_root is None and os.path.exists(os.path.join(directory, '.git')):
+                self.repo_root = directory
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return
+            directory = parent
+            glossary = os.path.join(directory, GLOSSARY_DIR, GLOSSARY_NAME)
+            if directory not in self.glossaries and os.path.isfile(glossary):
+                self.glossaries[directory] = glossary
+            philosophy = os.path.join(directory, PHILOSOPHY_NAME)
+            if directory not in self.philosophies and os.path.isfile(philosophy):
+                self.philosophies[directory] = philosophy
+
+    def _scan_tree(self, root: str) -> None:
+        # Depth-first, sorted, pre-order: the same order os.walk gives find_skill_files
+        stack: List[Tuple[str, bool, Optional[SkillEntry]]] = [(root, True, None)]
+        while stack:
+            directory, discover, owner = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            self.directories_scanned += 1
+            files = {e.name: e for e in entries if e.is_file()}
+            subdirs = [e for e in entries if e.is_dir() and not e.is_symlink()]
+            name = os.path.basename(directory)
+
+            if discover and 'SKILL.md' in files:
+                owner = SkillEntry(directory, files['SKILL.md'].path, files['SKILL.md'].stat().st_mtime)
+                self.skills[directory] = owner
+            if owner is not None:
+                if directory == owner.directory and JA_NAME in files and owner.ja_file is None:
+                    owner.ja_file = files[JA_NAME].path
+                if name == 'references' and os.path.dirname(directory) == owner.directory and JA_NAME in files:
+                    owner.ja_file = files[JA_NAME].path  # takes precedence over SKILL.ja.md
+                owner.assets.extend(
+                    os.path.relpath(entry.path, owner.directory) for entry in files.values()
+                    if entry.path != owner.skill_file
+                )
+            if name == GLOSSARY_DIR and GLOSSARY_NAME in files:
+                self.glossaries[os.path.dirname(directory)] = files[GLOSSARY_NAME].path
+            if PHILOSOPHY_NAME in files:
+                self.philosophies[directory] = files[PHILOSOPHY_NAME].path
+
+            for entry in reversed(subdirs):
+                if entry.name == GLOSSARY_DIR:
+                    stack.append((entry.path, False, None))
+                elif not entry.name.startswith('.'):
+                    stack.append((entry.path, discover and entry.name != 'references', owner))
+
+    def covers(self, path: Union[str, Path]) -> bool:
+        path = os.path.abspath(path)
+        return any(path == root or path.startswith(root + os.sep) for root in self.roots)
+
+    def skill(self, skill_path: Union[str, Path]) -> Optional[SkillEntry]:
+        return self.skills.get(os.path.dirname(os.path.abspath(skill_path)))
+
+    def ja_file_for(self, skill_path: Union[str, Path]) -> Optional[str]:
+        entry = self.skill(skill_path)
+        return entry.ja_file if entry is not None else None
+
+    def glossary_for(self, skill_path: Union[str, Path]) -> Optional[str]:
+        """Nearest .github/copilot-instructions.md at or above the skill directory"""
+        return self._nearest(self.glossaries, skill_path)
+
+    def philosophy_for(self, skill_path: Union[str, Path]) -> Optional[str]:
+        """Nearest PHILOSOPHY.md at or above the skill directory"""
+        return self._nearest(self.philosophies, skill_path)
+
+    @staticmethod
+    def _nearest(found: Dict[str, str], skill_path: Union[str, Path]) -> Optional[str]:
+        directory = os.path.dirname(os.path.abspath(skill_path))
+        while True:
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None  # like the find_*_file walks, the filesystem root is not searched
+            if directory in found:
+                return found[directory]
+            directory = parent
+
+    def skill_files_under(self, directory: Union[str, Path]) -> List[str]:
+        """Indexed SKILL.md paths at or below directory, in discovery order"""
+        directory = os.path.abspath(directory)
+        prefix = directory + os.sep
+        return [
+            entry.skill_file for skill_dir, entry in self.skills.items()
+            if skill_dir == directory or skill_dir.startswith(prefix)
+        ]
+
+
+# --- Git-aware change selection ---
+# Pre-commit hooks and CI only need the skills a change touched. Paths come from
+# `git diff --name-only`; contents are streamed from one `git cat-file --batch`
+# process, so staged runs see exactly the blobs being committed.
+
+INDEX_REVISION = ''  # "<rev>:<path>" with an empty rev reads the staged blob
+
+
+class GitError(RuntimeError):
+    """A git command failed (not a repository, unknown ref, ...)"""
+
+
+def run_git(args: List[str], cwd: Union[str, Path]) -> bytes:
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, check=True)
+    except FileNotFoundError:
+        raise GitError("git is not installed")
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise GitError(message[0] if message else f"git {args[0]} failed")
+    return result.stdout
+
+
+def git_toplevel(cwd: Union[str, Path]) -> str:
+    return run_git(['rev-parse', '--show-toplevel'], cwd).decode('utf-8').strip()
+
+
+def changed_paths(repo_root: str, since: Optional[str] = None, staged: bool = False) -> List[str]:
+    """Repo-relative paths touched since a ref.
+
+    staged: index vs since (default HEAD), i.e. what the next commit changes.
+    Otherwise: since vs HEAD, i.e. what the committed history changed.
+    """
+    if staged:
+        args = ['diff', '--cached', '--name-only', '-z', since or 'HEAD']
+    else:
+        args = ['diff', '--name-only', '-z', since, 'HEAD']
+    return [p for p in run_git(args, repo_root).decode('utf-8').split('\0') if p]
+
+
+def skill_file_of(path: str) -> Optional[str]:
+    """The EN SKILL.md owning a repo-relative SKILL.md or SKILL.ja.md (None: neither)"""
+    directory, name = posixpath.split(path)
+    if name == JA_NAME:
+        if posixpath.basename(directory) == 'references':
+            directory = posixpath.dirname(directory)
+        return posixpath.join(directory, 'SKILL.md')
+    if name == 'SKILL.md' and posixpath.basename(directory) != 'references':
+        return path
+    return None
+
+
+class GitBlobReader:
+    """One long-lived `git cat-file --batch` process answering "<rev>:<path>" lookups"""
+
+    def __init__(self, repo_root: str):
+        try:
+            self.process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'], cwd=repo_root,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise GitError("git is not installed")
+        self.requests = 0
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """Blob content for spec, or None when it does not exist"""
+        self.requests += 1
+        self.process.stdin.write(spec.encode('utf-8') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline()
+        if not header:
+            raise GitError("git cat-file exited unexpectedly")
+        # "<spec> missing" / "<spec> ambiguous": spec may contain spaces, so test the suffix
+        if header.rstrip().endswith((b' missing', b' ambiguous')):
+            return None
+        parts = header.split()  # "<oid> <type> <size>"
+        size = int(parts[2])
+        content = self.process.stdout.read(size)
+        self.process.stdout.read(1)  # trailing LF
+        return content if parts[1] == b'blob' else None
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self) -> 'GitBlobReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class ChangedSkill:
+    """A touched skill, with its EN/JA pair as stored at the selected revision"""
+    skill_file: str  # repo-relative
+    content: str
+    ja_file: Optional[str] = None
+    ja_content: Optional[str] = None
+    glossary_file: Optional[str] = None
+    glossary_content: Optional[str] = None
+    philosophy_file: Optional[str] = None
+    philosophy_content: Optional[str] = None
+
+
+@dataclass
+class ChangeSet:
+    """Skills touched by a diff, read from git objects instead of the working tree"""
+    repo_root: str
+    revision: str  # INDEX_REVISION for staged blobs
+    paths: List[str]  # every path the diff reported
+    skills: List[ChangedSkill]
+    blobs_read: int = 0
+
+    def absolute(self, path: str) -> str:
+        return os.path.join(self.repo_root, *path.split('/'))
+
+
+def collect_changes(cwd: Union[str, Path], since: Optional[str] = None,
+                    staged: bool = False) -> ChangeSet:
+    """Touched SKILL.md / SKILL.ja.md files plus their partners, read via one cat-file process.
+
+    A touched JA file brings in its EN SKILL.md and vice versa. Skills whose
+    SKILL.md no longer exists at the revision (deleted) are dropped.
+    """
+    if not staged and not since:
+        raise ValueError("collect_changes needs a ref unless staged")
+    repo_root = git_toplevel(cwd)
+    paths = changed_paths(repo_root, since, staged)
+    revision = INDEX_REVISION if staged else 'HEAD'
+
+    skill_files: List[str] = []
+    for path in paths:
+        skill_file = skill_file_of(path)
+        if skill_file is not None and skill_file not in skill_files:
+            skill_files.append(skill_file)
+
+    skills: List[ChangedSkill] = []
+    with GitBlobReader(repo_root) as reader:
+        texts: Dict[str, Optional[str]] = {}
+
+        def text(path: str) -> Optional[str]:
+            if path not in texts:
+                blob = reader.read(f"{revision}:{path}")
+                texts[path] = blob.decode('utf-8') if blob is not None else None
+            return texts[path]
+
+        def nearest(directory: str, name: str) -> Optional[str]:
+            while True:
+                candidate = posixpath.join(directory, name)
+                if text(candidate) is not None:
+                    return candidate
+                if not directory:
+                    return None
+                directory = posixpath.dirname(directory)
+
+        for skill_file in skill_files:
+            content = text(skill_file)
+            if content is None:
+                continue
+            directory = posixpath.dirname(skill_file)
+            ja_file = next(
+                (c for c in (posixpath.join(directory, 'references', JA_NAME), posixpath.join(directory, JA_NAME))
+                 if text(c) is not None),
+                None,
+            )
+            glossary = nearest(directory, posixpath.join(GLOSSARY_DIR, GLOSSARY_NAME))
+            philosophy = nearest(directory, PHILOSOPHY_NAME)
+            skills.append(ChangedSkill(
+                skill_file, content,
+                ja_file, text(ja_file) if ja_file else None,
+                glossary, text(glossary) if glossary else None,
+                philosophy, text(philosophy) if philosophy else None,
+            ))
+        blobs_read = reader.requests
+    return ChangeSet(repo_root, revision, paths, skills, blobs_read)
@@ -0,0 +1,92 @@
+"""Tests for the benchmark regression gate."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _load_compare_module():
+    compare_path = Path(__file__).resolve().parents[1] / "bench_compare.py"
+    spec = importlib.util.spec_from_file_location("bench_compare", compare_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _results(commit: str, mean_ms: float, checks: dict, mean_samples=None, check_samples=None) -> dict:
+    tool = {
+        "total_s": mean_ms / 10,
+        "per_file": {"mean_ms": mean_ms},
+        "per_check_ms": checks,
+    }
+    if mean_samples is not None:
+        tool["samples"] = {"per_file_mean_ms": mean_samples, "per_check_ms": check_samples or {}}
+    return {
+        "meta": {"commit": commit, "python": "3.12", "platform": "linux", "seed": 42},
+        "runs": [{"size": 100, "validate_skill_file": tool}],
+    }
+
+
+def _statuses(comparisons) -> dict:
+    return {c.metric: c.status for c in comparisons}
+
+
+def test_per_check_slowdown_beyond_threshold_is_a_regression():
+    compare = _load_compare_module()
+    # 100 ms summed over 100 files = 1000 µs/file; 200 ms = 2000 µs/file
+    base = _results("a", 5.0, {"LanguageValidator:4.3.2": 100.0, "WarningValidator:W5": 50.0})
+    head = _results("b", 5.1, {"LanguageValidator:4.3.2": 200.0, "WarningValidator:W5": 50.0})
+
+    statuses = _statuses(compare.compare_results(base, head))
+
+    assert statuses == {
+        "per_file": "ok",
+        "LanguageValidator:4.3.2": "regressed",
+        "WarningValidator:W5": "ok",
+    }
+
+
+def test_noisy_samples_widen_the_allowed_delta():
+    compare = _load_compare_module()
+    base = _results("a", 5.0, {}, mean_samples=[4.0, 5.0, 6.0])
+    head = _results("b", 6.0, {}, mean_samples=[5.0, 6.0, 7.0])
+    quiet_base = _results("a", 5.0, {}, mean_samples=[5.0, 5.0, 5.0])
+    quiet_head = _results("b", 6.0, {}, mean_samples=[6.0, 6.0, 6.0])
+
+    assert _statuses(compare.compare_results(base, head))["per_file"] == "ok"
+    assert _statuses(compare.compare_results(quiet_base, quiet_head))["per_file"] == "regressed"
+
+
+def test_absolute_floor_ignores_tiny_checks_and_reports_new_ones():
+    compare = _load_compare_module()
+    # 0.5 ms -> 1.5 ms summed is +10 µs/file: tripled but below the 20 µs floor
+    base = _results("a", 5.0, {"StructureValidator:1.1": 0.5})
+    head = _results("b", 4.0, {"StructureValidator:1.1": 1.5, "WarningValidator:W6": 3.0})
+
+    statuses = _statuses(compare.compare_results(base, head))
+
+    assert statuses == {
+        "per_file": "improved",
+        "StructureValidator:1.1": "ok",
+        "WarningValidator:W6": "new",
+    }
+
+
+def test_history_picks_latest_two_or_named_base_commit(tmp_path: Path):
+    compare = _load_compare_module()
+    for name in ("20261001T100000-aaaaaaa111", "20261002T100000-bbbbbbb222",
+                 "20261003T100000-ccccccc333"):
+        (tmp_path / f"{name}.json").write_text(json.dumps(_results(name, 1.0, {})), encoding="utf-8")
+
+    base, head = compare.pick_from_history(tmp_path)
+    assert (base.stem[-3:], head.stem[-3:]) == ("222", "333")
+
+    base, head = compare.pick_from_history(tmp_path, base_commit="aaaaaaa")
+    assert (base.stem[-3:], head.stem[-3:]) == ("111", "333")
@@ -0,0 +1,63 @@
+"""Tests for the regex registry micro-benchmark."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _load_validator_module():
+    validator_path = Path(__file__).resolve().parents[1] / "validate_skill.py"
+    spec = importlib.util.spec_from_file_location("validate_skill", validator_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    original_platform = sys.platform
+    try:
+        sys.platform = "linux"
+        spec.loader.exec_module(module)
+    finally:
+        sys.platform = original_platform
+    return module
+
+
+def _load_bench_module():
+    _load_validator_module()
+    bench_path = Path(__file__).resolve().parents[1] / "bench_regex.py"
+    spec = importlib.util.spec_from_file_location("bench_regex", bench_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_registry_patterns_are_precompiled_with_known_scopes():
+    mod = _load_validator_module()
+
+    assert "W5.japanese" in mod.REGEX_REGISTRY
+    assert "tokenizer.table_cell_separator" in mod.REGEX_REGISTRY
+    for entry in mod.REGEX_REGISTRY.values():
+        assert hasattr(entry.pattern, "finditer")
+        assert entry.scope in {"text", "line", "title"}
+
+
+def test_benchmark_reports_every_pattern_grouped_by_check(tmp_path: Path):
+    bench = _load_bench_module()
+    skill = tmp_path / "demo" / "SKILL.md"
+    skill.parent.mkdir()
+    skill.write_text(
+        "---\nname: demo\n---\n\n## When to Use\n\n- Building a basic table\n\n"
+        "| a | b |\n|---|---|\n| 1 | 2 |\n",
+        encoding="utf-8",
+    )
+
+    timings = bench.benchmark([skill], repeat=1)
+    by_name = {t.name: t for t in timings}
+
+    assert set(by_name) == set(_load_validator_module().REGEX_REGISTRY)
+    assert by_name["tokenizer.table_cell_separator"].matches == 3
+    assert by_name["2.3.2.basic"].check_id == "2.3.2"
+    assert "vocabulary" in bench.per_check(timings)
@@ -0,0 +1,65 @@
+"""Tests for the synthetic corpus benchmark harness."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _load_bench_module():
+    bench_path = Path(__file__).resolve().parents[1] / "bench_validate.py"
+    spec = importlib.util.spec_from_file_location("bench_validate", bench_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    original_platform = sys.platform
+    try:
+        sys.platform = "linux"
+        spec.loader.exec_module(module)
+    finally:
+        sys.platform = original_platform
+    return module
+
+
+def test_build_corpus_is_reproducible_for_a_seed(tmp_path: Path):
+    bench = _load_bench_module()
+
+    shapes_a = bench.build_corpus(tmp_path / "a", 5, seed=7)
+    shapes_b = bench.build_corpus(tmp_path / "b", 5, seed=7)
+
+    assert shapes_a == shapes_b
+    for shape in shapes_a:
+        for rel in ("SKILL.md", "references/SKILL.ja.md"):
+            a = (tmp_path / "a" / "skills" / shape.name / rel).read_bytes()
+            b = (tmp_path / "b" / "skills" / shape.name / rel).read_bytes()
+            assert a == b
+
+
+def test_run_benchmark_times_both_tools_per_check(tmp_path: Path):
+    bench = _load_bench_module()
+
+    results = bench.run_benchmark([4], seed=1, corpus_dir=tmp_path)
+
+    run = results["runs"][0]
+    assert run["size"] == 4
+    assert run["validate_skill_file"]["per_file"]["max_ms"] > 0
+    assert "WarningValidator:W5" in run["validate_skill_file"]["per_check_ms"]
+    assert set(run["sync_checker"]["per_check_ms"]) == {"parse", *bench.SYNC_CHECKS}
+    # A caller-supplied directory is kept; only the generated corpus is removed
+    assert tmp_path.exists() and not (tmp_path / "corpus-4").exists()
+
+
+def test_repeats_are_kept_as_samples_and_stored_in_history(tmp_path: Path):
+    bench = _load_bench_module()
+
+    results = bench.run_benchmark([3], seed=1, corpus_dir=tmp_path, repeat=2)
+    stored = bench.save_to_history(results, tmp_path / "history")
+
+    samples = results["runs"][0]["validate_skill_file"]["samples"]
+    assert len(samples["per_file_mean_ms"]) == 2
+    assert all(len(values) == 2 for values in samples["per_check_ms"].values())
+    assert results["meta"]["repeat"] == 2
+    assert stored.parent == tmp_path / "history" and stored.suffix == ".json"
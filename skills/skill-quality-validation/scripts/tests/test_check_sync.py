@@ -0,0 +1,134 @@
+"""Tests for the EN/JA sync checker's repository-wide and changed-only modes."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+
+@lru_cache(maxsize=1)
+def _load_check_sync_module():
+    check_sync_path = Path(__file__).resolve().parents[3] / "skills-revise-skill" / "scripts" / "check_sync.py"
+    spec = importlib.util.spec_from_file_location("check_sync", check_sync_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+TABLE_2X2 = "| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n"
+TABLE_3X1 = "| a | b | c |\n|---|---|---|\n| 1 | 2 | 3 |\n"
+
+
+def _skill(name: str, table: str = TABLE_2X2) -> str:
+    return f"---\nname: {name}\ndescription: Sync fixture\nauthor: T\n---\n## When to Use\n\n{table}"
+
+
+def _write_pair(root: Path, folder: str, en: str, ja: str = None) -> Path:
+    skill_dir = root / folder
+    (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(en, encoding="utf-8")
+    if ja is not None:
+        (skill_dir / "references" / "SKILL.ja.md").write_text(ja, encoding="utf-8")
+    return skill_dir
+
+
+def _build_repo(root: Path) -> None:
+    _write_pair(root, "skills/alpha", _skill("alpha"), _skill("alpha"))
+    _write_pair(root, "skills/beta", _skill("beta"), _skill("beta", TABLE_3X1))
+    _write_pair(root, "skills/gamma", _skill("gamma"), _skill("gamma-ja"))
+    _write_pair(root, "skills/delta", _skill("delta"))  # no JA: not a sync target
+    _write_pair(root, ".hidden/epsilon", _skill("epsilon"), _skill("epsilon"))
+
+
+def _run_main(monkeypatch, capsys, *argv: str):
+    mod = _load_check_sync_module()
+    monkeypatch.setattr(sys, "argv", ["check_sync.py", *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        mod.main()
+    return exit_info.value.code, capsys.readouterr().out
+
+
+def test_all_mode_discovers_ja_skills_and_aggregates_worst_status(tmp_path: Path):
+    mod = _load_check_sync_module()
+    _build_repo(tmp_path)
+
+    skill_dirs = mod.find_skill_directories(tmp_path)
+    assert [d.name for d in skill_dirs] == ["alpha", "beta", "gamma"]
+
+    results = mod.check_many(skill_dirs, workers=2)
+    statuses = {d.name: result["status"] for d, result in results}
+    assert statuses == {"alpha": "FULL SYNC", "beta": "SYNC WITH WARNINGS", "gamma": "PARTIAL SYNC"}
+    assert mod.worst_status(results) == "PARTIAL SYNC"
+    assert mod.worst_status(results[:2]) == "SYNC WITH WARNINGS"
+    assert mod.worst_status([]) == "FULL SYNC"
+
+    beta = dict(results)[skill_dirs[1]]
+    assert beta["warnings"] == [("tables", "Table 1 shape differs: EN=2x2 (line 8), JA=3x1 (line 8)")]
+    assert beta["recommendations"] == ["Align columns/rows of table 1 in references/SKILL.ja.md"]
+
+
+def test_all_mode_exit_codes_and_json_summary(tmp_path: Path, monkeypatch, capsys):
+    _build_repo(tmp_path)
+
+    code, out = _run_main(monkeypatch, capsys, str(tmp_path), "--all", "--json", "-j", "1")
+    data = json.loads(out)
+    assert code == 1
+    assert data["summary"] == {
+        "total": 3,
+        "worst_status": "PARTIAL SYNC",
+        "by_status": {"FULL SYNC": 1, "SYNC WITH WARNINGS": 1, "PARTIAL SYNC": 1, "ERROR": 0},
+    }
+    assert [Path(s["directory"]).name for s in data["skills"]] == ["alpha", "beta", "gamma"]
+
+    shutil.rmtree(tmp_path / "skills" / "gamma")
+    code, out = _run_main(monkeypatch, capsys, str(tmp_path), "--all", "-j", "1")
+    assert code == 0
+    assert "Worst status: SYNC WITH WARNINGS" in out
+    assert out.index("skills/beta") < out.index("skills/alpha")  # most severe first
+
+    code, _ = _run_main(monkeypatch, capsys, str(tmp_path), "--all", "--strict", "-j", "1")
+    assert code == 1
+
+    code, _ = _run_main(monkeypatch, capsys, str(tmp_path / "skills" / "delta"), "--all")
+    assert code == 2
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_staged_mode_checks_only_touched_skills_from_git_blobs(tmp_path: Path, monkeypatch, capsys):
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                       cwd=tmp_path, check=True, capture_output=True)
+
+    _build_repo(tmp_path)
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+
+    beta_ja = tmp_path / "skills" / "beta" / "references" / "SKILL.ja.md"
+    beta_ja.write_text(_skill("beta"), encoding="utf-8")
+    (tmp_path / "skills" / "delta" / "SKILL.md").write_text(_skill("delta") + "\nMore.\n", encoding="utf-8")
+    git("add", ".")
+    beta_ja.write_text(_skill("beta-unstaged"), encoding="utf-8")
+
+    code, out = _run_main(monkeypatch, capsys, str(tmp_path), "--staged", "--json")
+    data = json.loads(out)
+    assert code == 0
+    assert [(Path(s["directory"]).name, s["status"]) for s in data["skills"]] == [("beta", "FULL SYNC")]
+
+    git("commit", "-q", "-m", "beta")
+    code, out = _run_main(monkeypatch, capsys, str(tmp_path), "--changed-since", "HEAD~1")
+    assert code == 0
+    assert "skills/beta" in out and "skills/alpha" not in out
+
+    code, out = _run_main(monkeypatch, capsys, str(tmp_path), "--staged")
+    assert code == 0
+    assert "No changed skills with references/SKILL.ja.md" in out
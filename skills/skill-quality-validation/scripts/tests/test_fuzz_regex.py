@@ -0,0 +1,68 @@
+"""Tests for the regex ReDoS fuzzer."""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _load_validator_module():
+    validator_path = Path(__file__).resolve().parents[1] / "validate_skill.py"
+    spec = importlib.util.spec_from_file_location("validate_skill", validator_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    original_platform = sys.platform
+    try:
+        sys.platform = "linux"
+        spec.loader.exec_module(module)
+    finally:
+        sys.platform = original_platform
+    return module
+
+
+@lru_cache(maxsize=1)
+def _load_fuzz_module():
+    _load_validator_module()
+    scripts = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(scripts))
+    spec = importlib.util.spec_from_file_location("fuzz_regex", scripts / "fuzz_regex.py")
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_fuzzer_flags_backtracking_patterns_it_replaced():
+    fuzz = _load_fuzz_module()
+    entry = fuzz.RegexEntry
+    entries = {
+        "old.acronym": entry("old.acronym", re.compile(r"\b[A-Z]{2,}\b\s*\([^)]+\)|\([A-Z]{2,}\)"), "text"),
+        "old.h2": entry("old.h2", re.compile(r"^##\s+(.+?)\s*$"), "line"),
+        "4.2.3.acronym": fuzz.REGEX_REGISTRY["4.2.3.acronym"],
+        "section.h2": fuzz.REGEX_REGISTRY["section.h2"],
+    }
+    cases = {name: fuzz.ADVERSARIAL_CASES[name] for name in ("unclosed_parens", "heading_whitespace")}
+
+    results = {r.name: r for r in fuzz.fuzz(entries, cases, sizes=(250, 1000), include_document=False)}
+
+    assert results["old.acronym"].superlinear and results["old.acronym"].exponent_case == "unclosed_parens"
+    assert results["old.h2"].superlinear and results["old.h2"].exponent_case == "heading_whitespace"
+    assert not results["4.2.3.acronym"].superlinear
+    assert not results["section.h2"].superlinear
+    assert fuzz.growth_exponent([(100, 0.0001), (400, 0.0016)], floor=0.001) == 2.0
+    assert fuzz.growth_exponent([(100, 0.0), (400, 0.0005)], floor=0.001) == 0.0
+
+
+def test_every_registered_pattern_grows_linearly_on_adversarial_markdown():
+    fuzz = _load_fuzz_module()
+
+    results = fuzz.fuzz(cases=fuzz.fuzz_cases(seeds=1), sizes=(1000, 4000))
+
+    assert {r.name for r in results} == set(fuzz.REGEX_REGISTRY) | {"document"}
+    assert [r.name for r in results if r.superlinear] == []
+    assert fuzz.random_case(7)(50) == fuzz.random_case(7)(50)
@@ -0,0 +1,107 @@
+"""Tests for the git-history quality trend store."""
+
+from __future__ import annotations
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@lru_cache(maxsize=1)
+def _load_history_module():
+    history_path = Path(__file__).resolve().parents[1] / "quality_history.py"
+    spec = importlib.util.spec_from_file_location("quality_history", history_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    original_platform = sys.platform
+    try:
+        sys.platform = "linux"
+        spec.loader.exec_module(module)
+    finally:
+        sys.platform = original_platform
+    return module
+
+
+EN = "---\nname: {0}\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo: Path, files: dict, message: str) -> None:
+    for relative, content in files.items():
+        path = repo / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+def test_backfill_validates_each_unique_blob_once_and_reports_trend(tmp_path: Path):
+    mod = _load_history_module()
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _commit(repo, {"skills/alpha/SKILL.md": EN.format("alpha"),
+                   "skills/beta/SKILL.md": EN.format("beta")}, "add")
+    _commit(repo, {"skills/alpha/references/SKILL.ja.md": EN.format("alpha")}, "ja")
+    _commit(repo, {"README.md": "unrelated\n"}, "docs")
+    _commit(repo, {"skills/beta/SKILL.md": EN.format("beta") + "\nMore.\n"}, "edit")
+
+    connection = mod.open_store(str(tmp_path / "history.db"))
+    stats = mod.backfill(str(repo), connection)
+    # README-only commit is not part of the skill history; 3 commits x 2 skills
+    assert (stats.commits_recorded, stats.snapshots) == (3, 6)
+    # alpha: without and with JA; beta: two EN blobs. Everything else is a memo hit
+    assert (stats.validated, stats.memo_hits) == (4, 2)
+
+    points = mod.query_trend(connection)
+    assert [p.skills for p in points] == [2, 2, 2]
+    ja_trend = mod.query_trend(connection, skill="alpha", check="1.12")
+    assert [p.passed for p in ja_trend] == [0, 1, 1]
+
+    rerun = mod.backfill(str(repo), connection)
+    assert (rerun.commits_recorded, rerun.validated) == (0, 0)
+
+    _commit(repo, {"skills/beta/references/SKILL.ja.md": EN.format("beta")}, "beta ja")
+    incremental = mod.backfill(str(repo), connection)
+    assert (incremental.commits_recorded, incremental.validated, incremental.memo_hits) == (1, 1, 1)
+    checks = {row["check"]: row for row in mod.query_checks(connection)}
+    assert (checks["1.12"]["first"], checks["1.12"]["latest"]) == (0.0, 100.0)
+
+
+def test_backfill_of_other_roots_adds_their_skills_to_recorded_commits(tmp_path: Path):
+    mod = _load_history_module()
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _commit(repo, {"skills/alpha/SKILL.md": EN.format("alpha"),
+                   "dotnet/gamma/SKILL.md": EN.format("gamma")}, "add")
+    _commit(repo, {"dotnet/gamma/SKILL.md": EN.format("gamma") + "\nMore.\n"}, "edit")
+    _commit(repo, {"skills/alpha/SKILL.md": EN.format("alpha") + "\nMore.\n"}, "edit alpha")
+
+    connection = mod.open_store(str(tmp_path / "history.db"))
+    first = mod.backfill(str(repo), connection, ["skills"])
+    assert (first.commits_recorded, first.snapshots) == (3, 3)
+
+    second = mod.backfill(str(repo), connection, ["dotnet"])
+    assert (second.commits_recorded, second.snapshots, second.validated) == (3, 3, 2)
+    assert [p.skills for p in mod.query_trend(connection)] == [2, 2, 2]
+    assert mod.backfill(str(repo), connection).snapshots == 0
+
+    # Another history cannot be merged into the recorded order
+    _git(repo, "checkout", "-q", "-b", "side", "HEAD~1")
+    _commit(repo, {"skills/alpha/SKILL.md": EN.format("alpha") + "\nSide.\n"}, "side")
+    with pytest.raises(ValueError, match="does not follow the history recorded"):
+        mod.backfill(str(repo), connection, rev="side")
+    assert [p.skills for p in mod.query_trend(connection)] == [2, 2, 2]
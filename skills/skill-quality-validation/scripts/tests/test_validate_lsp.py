@@ -0,0 +1,136 @@
+"""Tests for the SKILL.md language server and its incremental validator."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def _load_lsp_module():
+    lsp_path = Path(__file__).resolve().parents[1] / "validate_lsp.py"
+    spec = importlib.util.spec_from_file_location("validate_lsp", lsp_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    original_platform = sys.platform
+    try:
+        # validate_skill is imported here; avoid Win32 stdout re-wrapping.
+        sys.platform = "linux"
+        spec.loader.exec_module(module)
+    finally:
+        sys.platform = original_platform
+    return module
+
+
+SKILL = """---
+name: lsp-skill
+description: Minimal skill used by the language server tests.
+author: Tester
+invocable: true
+---
+
+## When to Use This Skill
+- Editing skills with live diagnostics.
+
+## Workflow: Edit
+
+### Step 1: Write
+Use the editor.
+
+> **Values**: 基礎と型
+
+### Step 2: Check
+Use the validator.
+
+## Notes
+Plain English notes.
+"""
+
+
+def _write_skill(tmp_path: Path, content: str = SKILL) -> Path:
+    skill_dir = tmp_path / "lsp-skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(content, encoding="utf-8")
+    (skill_dir / "references" / "SKILL.ja.md").write_text("# ダミー\n", encoding="utf-8")
+    return skill_dir / "SKILL.md"
+
+
+def test_incremental_validator_matches_full_run_and_rescans_only_edited_section(tmp_path: Path):
+    lsp = _load_lsp_module()
+    validate_skill = sys.modules["validate_skill"]
+    skill_file = _write_skill(tmp_path)
+    engine = lsp.IncrementalValidator(str(skill_file))
+
+    first = engine.validate(SKILL)
+    assert {"W1", "W3"} <= set(engine.rerun)
+
+    edited = SKILL.replace("Plain English notes.", "Plain English notes. 日本語")
+    second = engine.validate(edited)
+
+    assert asdict(first) == asdict(validate_skill.validate_skill_content(SKILL, str(skill_file)))
+    assert asdict(second) == asdict(validate_skill.validate_skill_content(edited, str(skill_file)))
+    # Only the "## Notes" section (line 21) was re-scanned; W1/W3 inputs did not change
+    assert engine.rerun == ["categories", "W2", "W4", "W5@L21"]
+    w5 = next(w for w in second.warnings if w.id == "W5")
+    assert [(loc.line, loc.column) for loc in w5.locations] == [(22, 22)]
+
+
+def _frame(message: dict) -> bytes:
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+def _read_all(data: bytes) -> list:
+    lsp = _load_lsp_module()
+    stream = io.BytesIO(data)
+    messages = []
+    while True:
+        message = lsp.read_message(stream)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_server_publishes_diagnostics_with_line_ranges(tmp_path: Path):
+    lsp = _load_lsp_module()
+    skill_file = _write_skill(tmp_path)
+    uri = skill_file.as_uri()
+    edited = SKILL.replace("Plain English notes.", "Plain 日本語 notes.")
+    requests = b"".join(_frame(m) for m in [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+        {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+        {"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {
+            "textDocument": {"uri": uri, "version": 1, "text": SKILL}}},
+        {"jsonrpc": "2.0", "method": "textDocument/didChange", "params": {
+            "textDocument": {"uri": uri, "version": 2}, "contentChanges": [{"text": edited}]}},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "method": "exit"},
+    ])
+    output = io.BytesIO()
+    server = lsp.SkillLanguageServer(io.BytesIO(requests), output, debounce=0)
+
+    assert server.run() == 0
+
+    messages = _read_all(output.getvalue())
+    assert messages[0]["result"]["capabilities"]["textDocumentSync"]["change"] == lsp.SYNC_FULL
+    opened, changed = [m["params"] for m in messages if m.get("method") == "textDocument/publishDiagnostics"]
+    assert opened["version"] == 1 and changed["version"] == 2
+
+    def by_code(params):
+        return {d["code"]: d for d in params["diagnostics"]}
+
+    # Step 2 has no Values marker: W2 points at its heading (line 18, 0-based 17)
+    w2 = by_code(opened)["W2.2"]
+    assert w2["severity"] == lsp.SEVERITY_WARNING
+    assert w2["range"] == {"start": {"line": 17, "character": 0}, "end": {"line": 17, "character": 17}}
+    assert "W5" not in by_code(opened)
+    assert by_code(changed)["W5"]["range"] == {
+        "start": {"line": 21, "character": 6}, "end": {"line": 21, "character": 9},
+    }
+    assert messages[-1] == {"jsonrpc": "2.0", "id": 2, "result": None}
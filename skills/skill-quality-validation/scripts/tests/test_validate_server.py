@@ -0,0 +1,93 @@
+"""Tests for the Unix-socket validation server."""
+
+from __future__ import annotations
+
+import importlib.util
+import socket
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+
+@lru_cache(maxsize=1)
+def _load_server_module():
+    server_path = Path(__file__).resolve().parents[1] / "validate_server.py"
+    spec = importlib.util.spec_from_file_location("validate_server", server_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+SKILL = """---
+name: served-skill
+description: Minimal skill used by the server tests.
+author: Tester
+invocable: true
+---
+
+## When to Use This Skill
+- Testing the validation server.
+
+### Step 1: Do it
+Use the tool.
+"""
+
+
+def _write_repo(tmp_path: Path) -> Path:
+    skill_dir = tmp_path / "skills" / "served-skill"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(SKILL, encoding="utf-8")
+    (skill_dir / "references" / "SKILL.ja.md").write_text("# ダミー\n", encoding="utf-8")
+    return skill_dir / "SKILL.md"
+
+
+def test_service_validates_paths_buffers_and_skill_names(tmp_path: Path):
+    server = _load_server_module()
+    skill_file = _write_repo(tmp_path)
+    service = server.ValidationService(str(tmp_path))
+
+    by_path = service.handle({"id": 1, "path": str(skill_file)})
+    by_name = service.handle({"id": 2, "method": "validate", "skill": "served-skill"})
+    # An unsaved buffer is validated in place of the file on disk
+    buffer = SKILL + "\n## 日本語の見出し\n"
+    by_content = service.handle({"id": 3, "path": str(skill_file), "content": buffer})
+    missing = service.handle({"id": 4, "path": str(tmp_path / "nope" / "SKILL.md")})
+
+    assert by_path["ok"] and by_path["report"] == by_name["report"]
+    assert "W5" not in {w["id"] for w in by_path["report"]["warnings"]}
+    assert "W5" in {w["id"] for w in by_content["report"]["warnings"]}
+    assert missing == {"id": 4, "ok": False, "error": missing["error"], "elapsed_ms": missing["elapsed_ms"]}
+    assert service.stats()["skills"] == 1
+    assert service.context.skill_registry == {"served-skill": str(skill_file)}
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_server_answers_many_requests_on_one_connection_and_shuts_down(tmp_path: Path):
+    server = _load_server_module()
+    skill_file = _write_repo(tmp_path)
+    socket_path = str(tmp_path / "v.sock")
+    thread = threading.Thread(target=server.serve, args=(socket_path, str(tmp_path)), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if server.socket_in_use(socket_path):
+            break
+        threading.Event().wait(0.05)
+
+    responses = server.request(socket_path, [
+        {"id": 1, "method": "ping"},
+        {"id": 2, "path": str(skill_file), "format": "text"},
+        {"id": 3, "method": "bogus"},
+        {"id": 4, "method": "shutdown"},
+    ])
+    thread.join(timeout=5)
+
+    assert [r["ok"] for r in responses] == [True, True, False, True]
+    assert responses[1]["report"]["file_path"] == str(skill_file)
+    assert "served-skill" in responses[1]["text"] or "SKILL.md" in responses[1]["text"]
+    assert not thread.is_alive()
+    assert not Path(socket_path).exists()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import importlib.util
+import shutil
 import sys
+import time
 from functools import lru_cache
 from pathlib import Path
 
@@ -387,3 +389,704 @@ def test_warning_glossary_stale(tmp_path: Path):
     report = mod.validate_skill_file(str(skill_dir / "SKILL.md"))
     w_ids = [w.id for w in report.warnings]
     assert "W4" in w_ids
+
+
+# --- Repository index tests ---
+
+
+def test_repo_index_answers_ja_glossary_and_discovery_without_probes(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    repo_root = tmp_path / "repo"
+    (repo_root / ".github").mkdir(parents=True)
+    (repo_root / ".github" / "copilot-instructions.md").write_text(
+        "Glossary Last Updated: 2020-01-01\n", encoding="utf-8"
+    )
+    alpha = _write_skill_with_ja(repo_root / "skills", "alpha", en, "# 参照\n")
+    (alpha.parent / "SKILL.ja.md").write_text("# ルート\n", encoding="utf-8")
+    (alpha.parent / "scripts").mkdir()
+    (alpha.parent / "scripts" / "tool.py").write_text("", encoding="utf-8")
+    beta_dir = repo_root / "skills" / "beta"
+    beta_dir.mkdir()
+    (beta_dir / "SKILL.md").write_text(en, encoding="utf-8")
+    for hidden in (repo_root / "skills" / ".cache" / "gamma", alpha.parent / "references" / "delta"):
+        hidden.mkdir(parents=True)
+        (hidden / "SKILL.md").write_text(en, encoding="utf-8")
+
+    index = mod.RepoIndex.scan([repo_root / "skills"])
+
+    assert index.skill_files_under(repo_root / "skills") == [str(alpha), str(beta_dir / "SKILL.md")]
+    assert index.ja_file_for(alpha) == str(alpha.parent / "references" / "SKILL.ja.md")
+    assert index.ja_file_for(beta_dir / "SKILL.md") is None
+    assert sorted(index.skill(alpha).assets) == ["SKILL.ja.md", "references/SKILL.ja.md",
+                                                 "references/delta/SKILL.md", "scripts/tool.py"]
+    # The glossary sits above the scanned root; found once by the ancestor walk
+    assert index.glossary_for(alpha) == str(repo_root / ".github" / "copilot-instructions.md")
+    assert mod.find_skill_files([str(repo_root / "skills")], recursive=True, index=index) == \
+        mod.find_skill_files([str(repo_root / "skills")], recursive=True)
+
+    expected = mod.validate_skill_file(str(beta_dir / "SKILL.md"))
+    monkeypatch.setattr(mod, "REPO_INDEX", index)
+    monkeypatch.setattr(Path, "exists", lambda self: pytest.fail(f"probed {self}"))
+    indexed = mod.validate_skill_file(str(beta_dir / "SKILL.md"))
+
+    assert indexed == expected
+    assert {"W4"} <= {w.id for w in indexed.warnings}
+    assert _find_check(indexed, "Structure", "1.12").passed is False
+    assert mod.RepoContext.for_skill(beta_dir / "SKILL.md").skill_registry == {
+        "alpha": str(alpha), "beta": str(beta_dir / "SKILL.md")}
+
+
+# --- In-memory API tests ---
+
+
+def test_in_memory_validation_matches_disk_without_touching_it(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    import builtins
+    import datetime
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    from dataclasses import asdict
+
+    repo_root = tmp_path / "repo"
+    (repo_root / ".github").mkdir(parents=True)
+    glossary = "# Instructions\nGlossary Last Updated: 2020-01-01\n"
+    (repo_root / ".github" / "copilot-instructions.md").write_text(glossary, encoding="utf-8")
+    en = "---\nname: mem-skill\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n### Step 1: Go\n"
+    ja = "---\nname: mem-skill\n---\n## A\n## B\n削除しないこと\n"
+    skill_file = _write_skill_with_ja(repo_root / "skills", "mem-skill", en, ja)
+    on_disk = asdict(mod.validate_skill_file(str(skill_file)))
+
+    context = mod.RepoContext.from_glossary_text(glossary, str(repo_root / ".github" / "copilot-instructions.md"))
+    modified = datetime.date.fromtimestamp(skill_file.stat().st_mtime)
+
+    def no_disk(*args, **kwargs):
+        raise AssertionError("filesystem access during in-memory validation")
+
+    monkeypatch.setattr(builtins, "open", no_disk)
+    monkeypatch.setattr(os, "stat", no_disk)
+    monkeypatch.setattr(Path, "exists", no_disk)
+
+    def run(_):
+        return asdict(mod.validate_skill_in_memory(
+            en, ja_content=ja, context=context, file_path=str(skill_file), modified=modified,
+        ))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(32)))
+
+    assert all(result == on_disk for result in results)
+    assert {"W1.1", "W2.1", "W3.1", "W4"} <= {w["id"] for w in on_disk["warnings"]}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_changed_only_validation_reads_staged_blobs_and_partners(tmp_path: Path):
+    mod = _load_validator_module()
+    import subprocess
+    from dataclasses import asdict
+
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                       cwd=tmp_path, check=True, capture_output=True)
+
+    en = "---\nname: {0}\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    ja = "---\nname: {0}\n---\n## A\n"
+    for name in ("alpha", "beta", "gamma"):
+        _write_skill_with_ja(tmp_path / "skills", name, en.format(name), ja.format(name))
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+
+    # Touch only beta's JA file; its EN partner must come along
+    beta_ja = tmp_path / "skills" / "beta" / "references" / "SKILL.ja.md"
+    beta_ja.write_text(ja.format("beta") + "## B\n", encoding="utf-8")
+    git("add", ".")
+    expected = asdict(mod.validate_skill_file(str(tmp_path / "skills" / "beta" / "SKILL.md")))
+    beta_ja.write_text("unstaged edit\n", encoding="utf-8")
+
+    changes = mod.collect_changes(tmp_path, staged=True)
+    assert [s.skill_file for s in changes.skills] == ["skills/beta/SKILL.md"]
+    assert changes.skills[0].ja_file == "skills/beta/references/SKILL.ja.md"
+    batch = mod.validate_changes(changes)
+    assert [asdict(r) for r in batch.reports] == [expected]
+    assert "W1.1" in {w["id"] for w in expected["warnings"]}
+
+    git("commit", "-q", "-m", "beta")
+    (tmp_path / "skills" / "alpha" / "SKILL.md").write_text(en.format("alpha") + "## B\n", encoding="utf-8")
+    git("commit", "-q", "-am", "alpha")
+    changes = mod.collect_changes(tmp_path, since="HEAD~2")
+    assert [s.skill_file for s in changes.skills] == ["skills/alpha/SKILL.md", "skills/beta/SKILL.md"]
+    assert changes.revision == "HEAD"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_changed_only_validation_handles_spaces_in_skill_path(tmp_path: Path):
+    mod = _load_validator_module()
+    import subprocess
+
+    en = "---\nname: my-skill\ndescription: test\nauthor: T\n---\n## A\n"
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                       cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "init")
+    _write_skill_with_ja(tmp_path / "skills", "my skill", en, en)
+    git("add", ".")
+
+    with sys.modules["skill_corpus"].GitBlobReader(str(tmp_path)) as reader:
+        assert reader.read(":skills/my skill/no such file.md") is None
+        assert reader.read(":skills/my skill/SKILL.md") == en.encode("utf-8")
+    changes = mod.collect_changes(tmp_path, staged=True)
+    assert [s.skill_file for s in changes.skills] == ["skills/my skill/SKILL.md"]
+    assert changes.skills[0].ja_file == "skills/my skill/references/SKILL.ja.md"
+    assert len(mod.validate_changes(changes).reports) == 1
+
+
+@pytest.mark.parametrize("argv", [["--watch"], ["--watch", "--staged", "skills"],
+                                  ["--watch", "--changed-since", "HEAD", "skills"]])
+def test_watch_requires_paths_and_rejects_changed_only_flags(argv, monkeypatch, capsys):
+    mod = _load_validator_module()
+
+    def fail(args):
+        raise AssertionError("must not start watching")
+
+    monkeypatch.setattr(mod, "run_watch", fail)
+    monkeypatch.setattr(sys, "argv", ["validate_skill.py", *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        mod.main()
+
+    assert exit_info.value.code == 2
+    assert "--watch cannot" in capsys.readouterr().err or argv == ["--watch"]
+
+
+def test_in_memory_validation_without_ja_or_context():
+    mod = _load_validator_module()
+    en = "---\nname: mem-skill\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+
+    report = mod.validate_skill_in_memory(en)
+
+    assert _find_check(report, "Structure", "1.12").passed is False
+    assert [w.id for w in report.warnings] == []
+
+
+# --- Batch mode tests ---
+
+
+def test_find_skill_files_recursive_skips_references(tmp_path: Path):
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    _write_skill_with_ja(tmp_path / "skills", "alpha", en, en)
+    _write_skill_with_ja(tmp_path / "dotnet", "beta", en, en)
+    # A stray SKILL.md under references/ must not be treated as a skill
+    (tmp_path / "skills" / "alpha" / "references" / "SKILL.md").write_text(en, encoding="utf-8")
+
+    found = mod.find_skill_files([str(tmp_path)], recursive=True)
+    assert sorted(p.parent.name for p in found) == ["alpha", "beta"]
+
+
+def test_validate_many_matches_single_file_results(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    # Worker processes re-import the module by name under spawn/forkserver
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1]))
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n## B\n"
+    paths = [
+        str(_write_skill_with_ja(tmp_path, f"skill-{i}", en, en))
+        for i in range(3)
+    ]
+    missing = str(tmp_path / "missing" / "SKILL.md")
+
+    batch = mod.validate_many(paths + [missing], workers=2)
+
+    assert [r.file_path for r in batch.reports] == paths
+    assert [e[0] for e in batch.errors] == [missing]
+    assert not batch.all_passed
+    single = mod.validate_skill_file(paths[0])
+    assert batch.reports[0].total_score == single.total_score
+    assert batch.reports[0].warnings == single.warnings
+
+
+def test_jsonl_stream_writes_one_compact_record_per_file(tmp_path: Path):
+    import io
+    import json
+
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    path = str(_write_skill_with_ja(tmp_path, "alpha", en, en))
+    missing = str(tmp_path / "missing" / "SKILL.md")
+    stream = io.StringIO()
+
+    summary = mod.write_jsonl_stream(
+        mod.iter_validate([path, missing], workers=1), stream, per_check=True
+    )
+
+    lines = stream.getvalue().splitlines()
+    records = [json.loads(line) for line in lines]
+    kinds = [r["record"] for r in records]
+    check_count = sum(len(c.checks) for c in mod.validate_skill_file(path).categories)
+    assert kinds == ["check"] * check_count + ["file", "error", "summary"]
+    assert lines[0] == json.dumps(records[0], ensure_ascii=False, separators=(",", ":"))
+    assert records[check_count]["file_path"] == path
+    assert records[-1] == {"record": "summary", "total": 2, "passed": 0, "failed": 1, "errors": 1}
+    assert summary["errors"] == 1
+
+
+# --- Markdown tokenizer tests ---
+
+
+def test_markdown_document_tokenizes_blocks_in_one_pass():
+    mod = _load_validator_module()
+    content = """---
+name: tokenizer-skill
+description: Tokenizer fixture.
+---
+
+## When to Use This Skill
+- Designing a tokenizer fixture.
+1. **Ordered** item
+
+## Workflow: Build
+### Step 1: Prepare
+> **Values**: 基礎と型
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+~~~markdown
+## Not a heading
+- not an item
+~~~
+"""
+    doc = mod.MarkdownDocument(content)
+
+    assert doc.frontmatter == "name: tokenizer-skill\ndescription: Tokenizer fixture."
+    assert [(h.level, h.title) for h in doc.headings] == [
+        (2, "When to Use This Skill"), (2, "Workflow: Build"), (3, "Step 1: Prepare"),
+    ]
+    assert [(i.marker, i.text) for i in doc.list_items] == [
+        ("-", "Designing a tokenizer fixture."), ("1.", "**Ordered** item"),
+    ]
+    assert [q.text for q in doc.blockquotes] == ["**Values**: 基礎と型"]
+    assert len(doc.tables) == 1 and len(doc.tables[0].rows) == 3
+    assert len(doc.fences) == 1
+    assert doc.fences[0].info == "markdown" and doc.fences[0].closed
+    assert "## Not a heading" in doc.code_blocks[0]
+    assert "Not a heading" not in doc.prose
+
+
+def test_term_scanner_finds_every_vocabulary_in_one_pass_with_positions():
+    mod = _load_validator_module()
+    scanner = mod.TermScanner("test.vocabulary", {
+        "vague": mod.Vocabulary(("may", "often"), whole_words=True),
+        "deps": mod.Vocabulary(("dependency", "dependency injection")),
+        "safety": mod.Vocabulary(("禁止", "絶対にしない")),
+        "negation": mod.Vocabulary(("しない", "禁止")),
+    })
+    text = "Maybe you MAY use it.\nOften: dependency injection\n絶対にしない。禁止\n"
+    scan = scanner.scan(text)
+
+    # "Maybe" is not the word "may"; case is ignored
+    assert [(m.term, m.line, m.column) for m in scan.of("vague")] == [("may", 1, 11), ("often", 2, 1)]
+    # Overlapping terms are all reported, like Aho-Corasick
+    assert scan.found("deps") == {"dependency", "dependency injection"}
+    assert scan.found("safety") == {"禁止", "絶対にしない"}
+    assert [(m.term, m.line, m.column) for m in scan.of("negation")] == [("しない", 3, 4), ("禁止", 3, 8)]
+    assert scan.lines("vague") == [1, 2]
+    assert text[scan.of("deps")[0].start:scan.of("deps")[0].end].lower() in scan.found("deps")
+
+    doc = mod.MarkdownDocument(text)
+    assert doc.scan_terms(scanner) is doc.scan_terms(scanner)
+
+
+def test_table_model_shape_and_en_ja_parity(tmp_path: Path):
+    mod = _load_validator_module()
+    doc = mod.MarkdownDocument(
+        "| A | B \\| C | D |\n|---|:-:|--|\n| 1 | 2 | 3 |\n| 4 | 5 | 6 |\n\n"
+        "```markdown\n| fenced | table |\n|---|---|\n```\n"
+    )
+    # The fenced table is an example, not a table of this document
+    assert len(doc.tables) == 1
+    table = doc.tables[0]
+    assert table.header == ["A", "B \\| C", "D"]
+    assert (table.shape, table.has_delimiter, table.start, table.end) == ((3, 2), True, 0, 3)
+
+    frontmatter = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n"
+    en = frontmatter + "## A\n\n| a | b | c |\n|---|---|---|\n| 1 | 2 | 3 |\n"
+    ja = frontmatter + "## A\n\n| a | b |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n"
+    report = mod.validate_skill_file(str(_write_skill_with_ja(tmp_path, "tables", en, ja)))
+    w15 = [w for w in report.warnings if w.id == "W1.5"]
+    assert len(w15) == 1
+    assert "table 1 (EN L9): EN 3x1, JA 2x2" in w15[0].details
+    assert [loc.line for loc in w15[0].locations] == [9]
+
+
+def test_markdown_document_unclosed_fence_runs_to_end_of_file():
+    mod = _load_validator_module()
+    doc = mod.MarkdownDocument("## A\n```python\nprint('x')\n## B\n")
+
+    assert [h.title for h in doc.headings] == ["A"]
+    assert doc.fences[0].closed is False
+    assert "## B" in doc.fences[0].body
+
+
+def test_document_memo_reads_each_file_once_until_it_changes(tmp_path: Path):
+    import os
+
+    mod = _load_validator_module()
+    corpus = sys.modules["skill_corpus"]
+    en = "---\nname: memo\ndescription: memo\n---\n## Step 1: Go\n"
+    ja = "---\nname: memo\ndescription: memo\n---\n## Step 1: 行く\n禁止\n"
+    skill_file = _write_skill_with_ja(tmp_path, "memo", en, ja)
+    ja_file = skill_file.parent / "references" / "SKILL.ja.md"
+    memo = corpus.DOCUMENT_MEMO
+
+    reads_before = memo.reads
+    mod.validate_skill_file(str(skill_file))
+    # EN once, JA once (W1 parity and W3 safety share the parsed JA document)
+    assert memo.reads - reads_before == 2
+    assert corpus.load_document(ja_file) is corpus.load_document(ja_file)
+
+    mod.validate_skill_file(str(skill_file))
+    assert memo.reads - reads_before == 2
+
+    os.utime(ja_file, ns=(1, 1))
+    mod.validate_skill_file(str(skill_file))
+    assert memo.reads - reads_before == 3
+
+
+# --- Result cache tests ---
+
+
+def test_result_cache_hit_skips_validators(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n## B\n"
+    file_path = _write_skill_with_ja(tmp_path, "cached", en, en)
+    cache = mod.ResultCache(tmp_path / "cache")
+
+    first = mod.validate_skill_file(str(file_path), cache=cache)
+
+    def fail_validate(self):
+        raise AssertionError("validators must not run on a cache hit")
+
+    monkeypatch.setattr(mod.StructureValidator, "validate", fail_validate)
+    second = mod.validate_skill_file(str(file_path), cache=cache)
+    assert second == first
+
+
+def test_result_cache_key_tracks_ja_companion(tmp_path: Path):
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "keyed", en, en)
+    cache = mod.ResultCache(tmp_path / "cache")
+    before = cache.key_for(file_path, file_path.read_bytes())
+
+    (file_path.parent / "references" / "SKILL.ja.md").write_text(en + "## B\n", encoding="utf-8")
+
+    assert cache.key_for(file_path, file_path.read_bytes()) != before
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path: Path):
+    import os
+
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    report = mod.validate_skill_file(str(_write_skill_with_ja(tmp_path, "lru", en, en)))
+    cache = mod.ResultCache(tmp_path / "cache")
+    cache.put("old", report)
+    cache.put("new", report)
+    entry_size = (tmp_path / "cache" / "old.json").stat().st_size
+    os.utime(tmp_path / "cache" / "old.json", (1, 1))
+    os.utime(tmp_path / "cache" / "new.json", (2, 2))
+    assert cache.get("old") is not None  # hit refreshes "old"
+
+    cache.max_bytes = entry_size * 2
+    cache.put("newest", report)
+
+    assert cache.get("new") is None
+    assert cache.get("old") is not None
+    assert cache.get("newest") is not None
+
+
+def test_result_cache_write_failures_are_misses_not_errors(tmp_path: Path, monkeypatch):
+    import os
+
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "uncacheable", en, en)
+    expected = mod.validate_skill_file(str(file_path))
+
+    not_a_directory = tmp_path / "cache-file"
+    not_a_directory.write_text("", encoding="utf-8")
+    assert mod.validate_skill_file(str(file_path), cache=mod.ResultCache(not_a_directory)) == expected
+    batch = mod.validate_many([str(file_path)], workers=1, cache=mod.ResultCache(not_a_directory / "sub"))
+    assert batch.reports == [expected] and not batch.errors
+
+    def fail_replace(*args):
+        raise PermissionError("read-only cache")
+
+    cache = mod.ResultCache(tmp_path / "cache")
+    monkeypatch.setattr(os, "replace", fail_replace)
+    assert mod.validate_skill_file(str(file_path), cache=cache) == expected
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+# --- Watch mode tests ---
+
+
+def test_watcher_revalidates_only_the_edited_skill_pair(tmp_path: Path):
+    import os
+
+    mod = _load_validator_module()
+    en = "---\nname: test\ndescription: test\nauthor: T\ninvocable: true\n---\n## A\n## B\n"
+    first = _write_skill_with_ja(tmp_path, "first", en, en)
+    _write_skill_with_ja(tmp_path, "second", en, en)
+    watcher = mod.SkillWatcher([str(tmp_path)])
+    watcher.start(workers=1)
+    assert watcher.poll() == []
+
+    ja_path = first.parent / "references" / "SKILL.ja.md"
+    ja_path.write_text(en.replace("## B\n", ""), encoding="utf-8")
+    os.utime(ja_path, ns=(1, 1))  # guarantee a new stamp on coarse-mtime filesystems
+
+    changes = watcher.poll()
+    assert [skill_file for skill_file, _, _ in changes] == [first]
+    _, previous, current = changes[0]
+    diff = mod.format_watch_diff(first, previous, current)
+    assert "+ W1.1" in diff
+
+
+def test_format_watch_diff_reports_fixed_and_resolved(tmp_path: Path):
+    mod = _load_validator_module()
+    before = mod.ValidationReport(
+        file_path="SKILL.md",
+        categories=[mod.CategoryResult("Structure", [mod.CheckResult("1.5", "First H2", False)], 0, 1, 0.0, False)],
+        total_score=0, total_max_score=1, overall_percentage=0.0, overall_passed=False,
+        warnings=[mod.WarningResult("W5", "Japanese leak", "L3: 日本語")],
+    )
+    after = mod.ValidationReport(
+        file_path="SKILL.md",
+        categories=[mod.CategoryResult("Structure", [mod.CheckResult("1.5", "First H2", True)], 1, 1, 100.0, True)],
+        total_score=1, total_max_score=1, overall_percentage=100.0, overall_passed=True,
+    )
+
+    diff = mod.format_watch_diff(Path("SKILL.md"), before, after)
+
+    assert "❌ FAIL → ✅ PASS" in diff
+    assert "1.5 First H2 (fixed)" in diff
+    assert "W5 Japanese leak (resolved)" in diff
+
+
+# --- Pathological input tests ---
+# Generous budgets: the point is to catch backtracking blow-ups (minutes), not
+# to benchmark. Each input stays well under a second on a typical laptop.
+
+
+def _skill_frontmatter(name: str) -> str:
+    return f"---\nname: {name}\ndescription: Pathological fixture for validator timing.\n---\n\n"
+
+
+def _validate_within(tmp_path: Path, content: str, budget_seconds: float = 10.0):
+    mod = _load_validator_module()
+    skill_file = _write_skill_file(tmp_path, "pathological-skill", content)
+    start = time.perf_counter()
+    report = mod.validate_skill_file(str(skill_file))
+    elapsed = time.perf_counter() - start
+    assert elapsed < budget_seconds, f"validation took {elapsed:.1f}s"
+    return report
+
+
+def test_ten_thousand_fences_validate_in_linear_time(tmp_path: Path):
+    mod = _load_validator_module()
+    content = _skill_frontmatter("fence-heavy") + "# Fence Heavy\n\n" + "```python\n## Not A Heading\n```\n\ntext\n\n" * 10_000
+
+    doc = mod.MarkdownDocument(content)
+    assert len(doc.fences) == 10_000
+    assert [h.title for h in doc.headings] == ["Fence Heavy"]
+    _validate_within(tmp_path, content)
+
+
+def test_unclosed_fence_swallows_rest_of_file_without_backtracking(tmp_path: Path):
+    mod = _load_validator_module()
+    content = (
+        _skill_frontmatter("unclosed-fence")
+        + "# Unclosed\n\n## When to Use\n\n- Using it\n\n```python\n"
+        + "## Pattern 1: Hidden\n~~~\n``\n" * 20_000
+    )
+
+    doc = mod.MarkdownDocument(content)
+    assert len(doc.fences) == 1 and not doc.fences[0].closed
+    assert "Pattern 1: Hidden" not in doc.prose
+    report = _validate_within(tmp_path, content)
+    assert "Legacy" not in (_find_check(report, "Structure", "1.7").details or "")
+
+
+def test_one_megabyte_file_and_long_heading_whitespace(tmp_path: Path):
+    mod = _load_validator_module()
+    heading = "## Spaced" + " " * 200_000 + "Title\n"
+    section = "## Section\n\nWhy: fix it | a | b |\n\n- Use the item\n\n```bash\necho ok\n```\n\n"
+    content = _skill_frontmatter("megabyte") + "# Megabyte\n\n" + heading + section * 12_000
+    assert len(content.encode("utf-8")) > 1_000_000
+
+    doc = mod.MarkdownDocument(content)
+    assert doc.headings[1].title.endswith("Title")
+    _validate_within(tmp_path, content)
+
+
+# --- Profiling tests ---
+
+
+def test_profiler_times_every_check_and_exports_collapsed_stacks(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1]))
+    en = "---\nname: prof\ndescription: prof\n---\n## Step 1: Go\n"
+    paths = [str(_write_skill_with_ja(tmp_path, f"prof-{i}", en, en)) for i in range(2)]
+    profiler = mod.Profiler()
+
+    batch = mod.validate_many(paths, workers=2, profiler=profiler)
+
+    check_ids = {c.id for c in batch.reports[0].categories[0].checks}
+    profiled = {check_id for (_, check_id), _, calls in profiler.by_check() if calls == 2}
+    assert check_ids <= profiled
+    assert {"W1", "W5"} <= profiled
+    assert {stage for (stage,), _, _ in profiler.by_stage()} >= {"tokenize", "StructureValidator", "WarningValidator"}
+    assert sorted(f for (f,), _, _ in profiler.by_file()) == sorted(paths)
+
+    stacks = profiler.collapsed_stacks().splitlines()
+    assert "validate_skill;StructureValidator;1.1" in {line.rsplit(" ", 1)[0] for line in stacks}
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks)
+    assert "[Slowest checks]" in mod.format_profile_report(profiler, top=3)
+
+
+# --- Check registry tests ---
+
+
+def test_check_registry_declares_every_scored_check_and_warning():
+    mod = _load_validator_module()
+    registry = mod.CHECK_REGISTRY
+    assert len(registry) == 15 + 20 + 15 + 10 + 5
+    assert {spec.category for spec in registry.values()} == {
+        "Structure", "Content", "Code Quality", "Language", "Warnings"}
+    assert registry["1.12"].inputs == ("ja",) and registry["1.12"].cost == "cross-file"
+    assert registry["W4"].inputs == ("repo",)
+
+    selection = mod.CheckSelection.parse("1.*,W5", "1.12")
+    assert {"1.1", "1.2b", "1.10", "W5"} <= selection.ids
+    assert not {"1.12", "2.1.1", "W4"} & selection.ids
+    assert mod.CheckSelection.parse("2.1").ids == {"2.1.1", "2.1.2", "2.1.3", "2.1.4"}
+    assert not mod.CheckSelection.parse(max_cost="cheap").needs("ja")
+    with pytest.raises(ValueError, match="No check matches 'X9'"):
+        mod.CheckSelection.parse("X9")
+
+
+def test_unselected_checks_and_inputs_do_no_work(tmp_path: Path, monkeypatch):
+    mod = _load_validator_module()
+    en = "---\nname: picked\ndescription: picked\nauthor: T\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "picked", en, en)
+    full = mod.validate_skill_file(str(file_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unselected work must not run")
+
+    monkeypatch.setattr(mod.LanguageValidator, "_check_acronyms", fail)
+    monkeypatch.setattr(mod, "find_ja_file", fail)
+    monkeypatch.setattr(mod.RepoContext, "for_skill", fail)
+    monkeypatch.setattr(mod.ContentValidator, "validate", fail)
+    selection = mod.CheckSelection.parse("1.*,4.*,W2", skip="4.2.3", max_cost="scan")
+    report = mod.validate_skill_file(str(file_path), selection=selection)
+
+    assert [c.name for c in report.categories] == ["Structure", "Language"]
+    assert "1.12" not in {c.id for c in report.categories[0].checks}
+    assert report.categories[0].checks == [
+        c for c in full.categories[0].checks if c.id != "1.12"
+    ]
+    assert report.total_max_score == 14 + 9
+    assert report.selection == "only 1.*,4.*,W2; skip 4.2.3; max cost scan (24/65 checks)"
+    assert "Checks: only 1.*" in mod.format_text_report(report)
+    assert mod.report_to_dict(report)["selection"] == report.selection
+
+    warnings_only = mod.validate_skill_file(str(file_path), selection=mod.CheckSelection(["W2"]))
+    assert warnings_only.categories == [] and warnings_only.overall_passed
+
+
+# --- Early exit tests ---
+
+
+def test_fail_fast_stops_once_a_category_threshold_is_unreachable(tmp_path: Path):
+    mod = _load_validator_module()
+    en = "---\nname: hasty\ndescription: hasty\nauthor: T\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "hasty", en, en)
+    cache = mod.ResultCache(tmp_path / "cache")
+    full = mod.validate_skill_file(str(file_path))
+
+    report = mod.validate_skill_file(str(file_path), cache=cache,
+                                     early_exit=mod.EarlyExit(fail_fast=True))
+
+    assert report.stopped.startswith("fail-fast: Structure can no longer reach 80%")
+    assert [c.name for c in report.categories] == ["Structure"]
+    assert len(report.categories[0].checks) < len(full.categories[0].checks)
+    # Checks the stop left unrun still count against the category
+    assert report.total_max_score == len(full.categories[0].checks)
+    assert not report.overall_passed and not report.warnings
+    assert mod.report_to_dict(report)["stopped"] == report.stopped
+    assert not list((tmp_path / "cache").glob("*.json"))
+
+
+def test_time_budget_aborts_runaway_check_and_names_it(tmp_path: Path, monkeypatch):
+    import time
+
+    mod = _load_validator_module()
+    en = "---\nname: slow\ndescription: slow\nauthor: T\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "slow", en, en)
+
+    def runaway(self):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            pass
+        raise AssertionError("the time budget must interrupt the check")
+
+    monkeypatch.setattr(mod.LanguageValidator, "_check_acronyms", runaway)
+    started = time.monotonic()
+    report = mod.validate_skill_file(str(file_path), early_exit=mod.EarlyExit(time_budget=0.2))
+
+    assert time.monotonic() - started < 2
+    assert report.stopped == "time budget 200 ms exceeded in 4.2.3"
+    assert not report.overall_passed
+    assert "⏹️  Stopped: time budget 200 ms" in mod.format_text_report(report)
+
+
+def test_time_budget_alarm_is_disarmed_before_results_leave_or_reach_the_cache(tmp_path: Path, monkeypatch):
+    import os
+    import signal
+
+    mod = _load_validator_module()
+    en = "---\nname: late\ndescription: late\nauthor: T\n---\n## A\n"
+    file_path = _write_skill_with_ja(tmp_path, "late", en, en)
+    cache = mod.ResultCache(tmp_path / "cache")
+    handler = signal.getsignal(signal.SIGALRM)
+    stored = []
+
+    def put(self, key, report):
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+        assert signal.getsignal(signal.SIGALRM) is handler
+        stored.append(report)
+
+    monkeypatch.setattr(mod.ResultCache, "put", put)
+    budget = mod.EarlyExit(time_budget=5)
+    report = mod.validate_skill_file(str(file_path), cache=cache, early_exit=budget)
+    assert not report.stopped and stored == [report]
+
+    # An alarm landing after the checks finished is still caught and never cached
+    validate = mod._validate_skill_file
+
+    def late_alarm(*args):
+        result = validate(*args)
+        os.kill(os.getpid(), signal.SIGALRM)
+        return result
+
+    monkeypatch.setattr(mod, "_validate_skill_file", late_alarm)
+    (tmp_path / "cache").mkdir(exist_ok=True)
+    report = mod.validate_skill_file(str(file_path), cache=mod.ResultCache(tmp_path / "cache"), early_exit=budget)
+    assert report.stopped.startswith("time budget 5000 ms exceeded in ")
+    assert len(stored) == 1
+    assert signal.getsignal(signal.SIGALRM) is handler
@@ -131,3 +131,77 @@ class TestW5LineNumbers:
         # then "## When to Use\n\n" is 2 lines, "English line.\n" is 1, "Another...\n" is 1
         # "日本語が混入した行。" should be on line 11 of original
         assert "L11" in warnings[0].details
+
+    def test_repeated_lines_report_their_own_line_numbers(self, tmp_path: Path):
+        content = FRONTMATTER + (
+            "```text\n"
+            "同じ行\n"
+            "```\n"
+            "同じ行\n"
+            "English.\n"
+            "同じ行\n"
+        )
+        v = _make_warning_validator(tmp_path, "SKILL.md", content)
+        warnings = v._check_en_japanese_leak()
+        assert len(warnings) == 1
+        # The fenced copy (L8) is allowed; the prose copies are L10 and L12
+        assert [loc.line for loc in warnings[0].locations] == [10, 12]
+        assert "L10:C1" in warnings[0].details and "L12:C1" in warnings[0].details
+
+    def test_every_hit_has_exact_columns(self, tmp_path: Path):
+        content = FRONTMATTER + "Use 報連相 with (基礎と型) and 形式知 here.\n"
+        v = _make_warning_validator(tmp_path, "SKILL.md", content)
+        warnings = v._check_en_japanese_leak()
+        assert len(warnings) == 1
+        spans = [(loc.line, loc.column, loc.end_column) for loc in warnings[0].locations]
+        # The parenthetical Values name is skipped without shifting later columns
+        assert spans == [(7, 5, 8), (7, 25, 28)]
+
+
+PHILOSOPHY = """\
+# Philosophy
+
+### Values
+
+#### 1. 温故知新
+
+Learn from the past.
+
+#### 2. 段階的開示
+
+Reveal detail only when needed.
+
+## Skill Values
+
+#### Values: 基礎と型 / 段階的開示
+"""
+
+
+class TestW5ValuesVocabulary:
+    """Allowed Values names come from PHILOSOPHY.md, not a hardcoded list."""
+
+    def test_parse_values_vocabulary(self):
+        mod = _load_validator_module()
+        assert mod.parse_values_vocabulary(PHILOSOPHY) == ("温故知新", "段階的開示", "基礎と型")
+
+    def test_custom_value_allowed_only_with_its_philosophy(self):
+        mod = _load_validator_module()
+        content = EN_CLEAN + "\n1. **Principle** — Description (段階的開示)\n"
+
+        default = mod.validate_skill_in_memory(content)
+        assert [w.id for w in default.warnings] == ["W5"]
+
+        context = mod.RepoContext.from_texts(philosophy_text=PHILOSOPHY)
+        custom = mod.validate_skill_in_memory(content, context=context)
+        assert "W5" not in [w.id for w in custom.warnings]
+
+    def test_context_is_built_once_per_run(self, tmp_path: Path):
+        mod = _load_validator_module()
+        (tmp_path / "PHILOSOPHY.md").write_text(PHILOSOPHY, encoding="utf-8")
+        skill = tmp_path / "skills" / "demo" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text(EN_CLEAN, encoding="utf-8")
+
+        first = mod.RepoContext.for_skill(skill)
+        assert first.values == ("温故知新", "段階的開示", "基礎と型")
+        assert mod.RepoContext.for_skill(skill) is first
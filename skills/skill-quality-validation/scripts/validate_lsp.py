@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SKILL.md Language Server (LSP over stdio)
+
+Publishes validate_skill.py results as editor diagnostics while a SKILL.md
+is being edited, so failures such as missing Values markers (W2) or Japanese
+leaks (W5) show up in the buffer instead of after a CLI run.
+
+Diagnostics:
+    failed checks  - Error on the first line (checks score the whole file)
+    warnings       - Warning on every SourceSpan the warning carries
+                     (W2 step heading, W5 each Japanese run)
+
+Edits are debounced (--debounce, default 300 ms) and re-validated
+incrementally from the already tokenized buffer:
+    Structure/Content/Code Quality/Language  re-run (they score the whole file)
+    W1  only when the heading outline, table shapes or the JA file changes
+    W2  re-run (one pass over the step headings)
+    W3  only when the JA file changes
+    W4  re-run (compares two dates resolved up front)
+    W5  only for H2 sections whose text changed; other sections reuse spans
+
+Usage (editor configuration):
+    python validate_lsp.py
+    python validate_lsp.py --debounce 0.5
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from skill_corpus import MarkdownDocument
+from validate_skill import (
+    VALIDATOR_VERSION,
+    SkillInputs,
+    SourceSpan,
+    ValidationReport,
+    WarningResult,
+    WarningValidator,
+    _assemble_report,
+    _validate_categories,
+    load_inputs,
+)
+
+# LSP DiagnosticSeverity
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+
+# LSP TextDocumentSyncKind.Full: every change carries the whole buffer; the
+# incremental work happens here, per section, not in the transport.
+SYNC_FULL = 1
+
+DIAGNOSTIC_SOURCE = "skill-validate"
+
+
+class IncrementalValidator:
+    """Re-validates one SKILL.md buffer, re-running only what an edit can affect.
+
+    The report is identical to validate_skill_content(); `rerun` lists what
+    the last call actually executed.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._keyed: Dict[str, Tuple[object, List[WarningResult]]] = {}
+        self._section_spans: Dict[str, List[SourceSpan]] = {}
+        self._values: Tuple[str, ...] = ()
+        self.rerun: List[str] = []
+
+    def _keyed_check(self, name: str, key: object, run) -> List[WarningResult]:
+        cached = self._keyed.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = run()
+        self._keyed[name] = (key, result)
+        self.rerun.append(name)
+        return result
+
+    def _leak_spans(self, doc: MarkdownDocument, inputs: SkillInputs) -> List[SourceSpan]:
+        """W5 spans per H2 section, scanning only sections whose text changed.
+
+        Fences never cross an H2 boundary (a heading inside a fence is not a
+        heading), so each section can be scanned on its own. Cached spans are
+        dropped when the Values allow-list (PHILOSOPHY.md) changes.
+        """
+        if inputs.context.values != self._values:
+            self._values = inputs.context.values
+            self._section_spans = {}
+        boundaries = sorted({0, *(h.line for h in doc.headings_at(2)), len(doc.lines)})
+        spans: List[SourceSpan] = []
+        sections: Dict[str, List[SourceSpan]] = {}
+        for start, end in zip(boundaries, boundaries[1:]):
+            text = '\n'.join(doc.lines[start:end])
+            relative = sections.get(text)
+            if relative is None:
+                relative = self._section_spans.get(text)
+            if relative is None:
+                relative = WarningValidator(text, self.file_path, inputs=inputs)._japanese_leak_spans()
+                self.rerun.append(f"W5@L{start + 1}")
+            sections[text] = relative
+            spans.extend(SourceSpan(s.line + start, s.column, s.end_column) for s in relative)
+        self._section_spans = sections
+        return spans
+
+    def validate(self, content: str) -> ValidationReport:
+        self.rerun = ['categories', 'W2', 'W4']
+        doc = MarkdownDocument(content)
+        # The document memo hands back the same JA document object until the file changes
+        inputs = load_inputs(Path(self.file_path))
+        categories = _validate_categories(doc, self.file_path, None, inputs)
+
+        validator = WarningValidator(content, self.file_path, document=doc, inputs=inputs)
+        ja_key = inputs.ja_document
+        outline = (
+            tuple(validator._extract_headings(doc)),
+            validator._has_decision_table(doc),
+            tuple((t.start, t.shape, len(t.rows[0])) for t in doc.tables),
+        )
+
+        warnings: List[WarningResult] = []
+        warnings.extend(self._keyed_check('W1', (outline, ja_key), validator._check_en_ja_parity))
+        warnings.extend(validator._check_step_values())
+        warnings.extend(self._keyed_check('W3', ja_key, validator._check_ja_safety_risks))
+        warnings.extend(validator._check_glossary_freshness())
+        if not self.file_path.endswith('.ja.md'):
+            warnings.extend(validator._japanese_leak_warnings(self._leak_spans(doc, inputs)))
+
+        return _assemble_report(self.file_path, categories, warnings)
+
+
+def _utf16_column(line: str, column: int) -> int:
+    """LSP positions count UTF-16 code units; SourceSpan columns count code points"""
+    prefix = line[:column]
+    return len(prefix.encode('utf-16-le')) // 2
+
+
+def _range(lines: List[str], line: int, start: int, end: int) -> Dict:
+    """0-based LSP range from a 1-based line and 1-based [start, end) columns"""
+    text = lines[line - 1] if 0 < line <= len(lines) else ''
+    return {
+        'start': {'line': line - 1, 'character': _utf16_column(text, start - 1)},
+        'end': {'line': line - 1, 'character': _utf16_column(text, end - 1)},
+    }
+
+
+def report_diagnostics(report: ValidationReport, content: str) -> List[Dict]:
+    """Turn failed checks and warnings into LSP Diagnostic objects"""
+    lines = content.split('\n')
+    first_line = _range(lines, 1, 1, len(lines[0]) + 1 if lines else 1)
+    diagnostics = []
+    for category in report.categories:
+        for check in category.checks:
+            if check.passed:
+                continue
+            message = f"{check.description}" + (f" — {check.details}" if check.details else "")
+            diagnostics.append({
+                'range': first_line,
+                'severity': SEVERITY_ERROR,
+                'code': check.id,
+                'source': DIAGNOSTIC_SOURCE,
+                'message': f"[{category.name}] {message}",
+            })
+    for warning in report.warnings:
+        ranges = [
+            _range(lines, loc.line, loc.column, loc.end_column) for loc in warning.locations
+        ] or [first_line]
+        for diagnostic_range in ranges:
+            diagnostics.append({
+                'range': diagnostic_range,
+                'severity': SEVERITY_WARNING,
+                'code': warning.id,
+                'source': DIAGNOSTIC_SOURCE,
+                'message': warning.description + (f" — {warning.details}" if warning.details else ""),
+            })
+    return diagnostics
+
+
+def uri_to_path(uri: str) -> str:
+    parsed = urlparse(uri)
+    return url2pathname(parsed.path) if parsed.scheme == 'file' else uri
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict]:
+    """Read one Content-Length framed JSON-RPC message (None at end of input)"""
+    length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode('ascii').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+class SkillLanguageServer:
+    """Minimal LSP server: text sync in, publishDiagnostics out"""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO, debounce: float = 0.3):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.documents: Dict[str, Dict] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self.shutdown_received = False
+
+    def send(self, message: Dict) -> None:
+        body = json.dumps(dict(message, jsonrpc='2.0'), ensure_ascii=False).encode('utf-8')
+        with self._write_lock:
+            self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+            self.writer.flush()
+
+    def publish(self, uri: str) -> None:
+        """Validate the current buffer and publish its diagnostics"""
+        with self._lock:
+            entry = self.documents.get(uri)
+            if entry is None:
+                return
+            report = entry['engine'].validate(entry['text'])
+            diagnostics = report_diagnostics(report, entry['text'])
+            version = entry['version']
+        self.send({
+            'method': 'textDocument/publishDiagnostics',
+            'params': {'uri': uri, 'version': version, 'diagnostics': diagnostics},
+        })
+
+    def schedule(self, uri: str) -> None:
+        """Debounce: only the last edit in a burst triggers validation"""
+        if self.debounce <= 0:
+            self.publish(uri)
+            return
+        with self._lock:
+            pending = self._timers.pop(uri, None)
+            if pending is not None:
+                pending.cancel()
+            timer = threading.Timer(self.debounce, self.publish, args=(uri,))
+            timer.daemon = True
+            self._timers[uri] = timer
+            timer.start()
+
+    def _related_open_documents(self, ja_path: Path) -> List[str]:
+        """Open SKILL.md buffers whose JA companion is ja_path"""
+        skill_dirs = {ja_path.parent, ja_path.parent.parent}
+        with self._lock:
+            return [
+                uri for uri, entry in self.documents.items()
+                if Path(entry['engine'].file_path).parent in skill_dirs
+            ]
+
+    # --- notifications ---
+
+    def did_open(self, params: Dict) -> None:
+        document = params['textDocument']
+        path = uri_to_path(document['uri'])
+        if Path(path).name != 'SKILL.md':
+            return
+        with self._lock:
+            self.documents[document['uri']] = {
+                'text': document['text'],
+                'version': document.get('version'),
+                'engine': IncrementalValidator(path),
+            }
+        self.publish(document['uri'])
+
+    def did_change(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        with self._lock:
+            entry = self.documents.get(uri)
+            if entry is None or not params['contentChanges']:
+                return
+            entry['text'] = params['contentChanges'][-1]['text']
+            entry['version'] = params['textDocument'].get('version')
+        self.schedule(uri)
+
+    def did_save(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        path = Path(uri_to_path(uri))
+        if path.name == 'SKILL.ja.md':
+            for related in self._related_open_documents(path):
+                self.publish(related)
+        elif uri in self.documents:
+            self.publish(uri)
+
+    def did_close(self, params: Dict) -> None:
+        uri = params['textDocument']['uri']
+        with self._lock:
+            pending = self._timers.pop(uri, None)
+            if pending is not None:
+                pending.cancel()
+            known = self.documents.pop(uri, None) is not None
+        if known:
+            self.send({
+                'method': 'textDocument/publishDiagnostics',
+                'params': {'uri': uri, 'diagnostics': []},
+            })
+
+    # --- dispatch ---
+
+    def handle(self, message: Dict) -> bool:
+        """Handle one message; False once the client sent 'exit'"""
+        method = message.get('method')
+        params = message.get('params') or {}
+        if method == 'exit':
+            return False
+        if 'id' in message and method is not None:
+            if method == 'initialize':
+                result = {
+                    'capabilities': {
+                        'textDocumentSync': {
+                            'openClose': True,
+                            'change': SYNC_FULL,
+                            'save': {'includeText': False},
+                        },
+                    },
+                    'serverInfo': {'name': DIAGNOSTIC_SOURCE, 'version': VALIDATOR_VERSION},
+                }
+                self.send({'id': message['id'], 'result': result})
+            elif method == 'shutdown':
+                self.shutdown_received = True
+                self.send({'id': message['id'], 'result': None})
+            else:
+                self.send({'id': message['id'],
+                           'error': {'code': -32601, 'message': f"Method not found: {method}"}})
+            return True
+        handler = {
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didSave': self.did_save,
+            'textDocument/didClose': self.did_close,
+        }.get(method)
+        if handler is not None:
+            handler(params)
+        return True
+
+    def run(self) -> int:
+        """Serve until 'exit'; exit code 0 only if 'shutdown' came first (per LSP)"""
+        while True:
+            message = read_message(self.reader)
+            if message is None or not self.handle(message):
+                break
+        return 0 if self.shutdown_received else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Language server publishing SKILL.md validation diagnostics (stdio)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python validate_lsp.py
+  python validate_lsp.py --debounce 0.5
+
+Editors start this command and talk LSP over stdin/stdout.
+        """
+    )
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help='Seconds to wait after the last keystroke before validating (default: 0.3)')
+    args = parser.parse_args()
+
+    server = SkillLanguageServer(sys.stdin.buffer, sys.stdout.buffer, debounce=args.debounce)
+    exit(server.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent SKILL.md Validation Server (Unix socket)
+
+Keeps validate_skill.py imported and its repo context warm in one long-running
+process, so editors and pre-commit hooks get a report in a few milliseconds
+instead of paying interpreter startup and module import on every save.
+
+Warm state kept between requests:
+    - compiled regex registry and validator classes
+    - document memo: glossary (copilot-instructions.md) and JA companions stay
+      parsed and are re-read only when their mtime/size changes
+    - repo context: glossary date and PHILOSOPHY.md Values, rebuilt only when
+      one of those files changes
+    - skill registry: skill name -> SKILL.md for every skill under --root,
+      held by the repo context (RepoContext.skill_registry)
+
+Protocol: newline-delimited JSON over a Unix stream socket. One connection may
+carry any number of requests; each gets exactly one response line.
+
+    {"id": 1, "method": "validate", "path": "skills/x/SKILL.md"}
+    {"id": 2, "method": "validate", "path": "skills/x/SKILL.md", "content": "..."}
+    {"id": 3, "method": "validate", "skill": "x", "format": "text"}
+    {"id": 4, "method": "ping" | "stats" | "reload" | "shutdown"}
+
+    -> {"id": 1, "ok": true, "report": {...}, "elapsed_ms": 2.1}
+    -> {"id": 1, "ok": false, "error": "File not found: ..."}
+
+"report" has the same shape as `validate_skill.py --json`. With "content" the
+buffer is validated as if it were saved at "path" (unsaved editor buffers).
+
+Usage:
+    python validate_server.py serve --root .
+    python validate_server.py check skills/x/SKILL.md
+    python validate_server.py check skills/x/SKILL.md --stdin < buffer.md
+    python validate_server.py stop
+
+Version: 1.0.0
+Author: RyoMurakami1983
+Last Updated: 2026-10-17
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# The client path (check/ping/stop) only needs the standard library; the
+# validator is imported by the server alone so that clients start instantly.
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def default_socket_path() -> str:
+    """Per-user socket in $XDG_RUNTIME_DIR, falling back to the temp directory"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(runtime_dir, f"skill-validate-{uid}.sock")
+
+
+class ValidationService:
+    """Request dispatcher holding the warm validator state; safe to share between threads"""
+
+    def __init__(self, root: Optional[str] = None):
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        import validate_skill
+        import skill_corpus
+
+        self.validator = validate_skill
+        self.memo = skill_corpus.DOCUMENT_MEMO
+        self.root = Path(root).resolve() if root else None
+        self.started = time.time()
+        self.requests = 0
+        self.context = None
+        self._lock = threading.Lock()
+        self.shutdown_requested = threading.Event()
+        self.reload()
+
+    def reload(self) -> Dict:
+        """Rebuild the skill registry and re-prime the repo context (after adding skills, etc.)"""
+        self.memo.clear()
+        context = None
+        if self.root is not None:
+            # The index only feeds the context's skill registry; requests keep probing
+            # the disk, since a long-running snapshot would miss files created later
+            index = self.validator.RepoIndex.scan([self.root])
+            skills = self.validator.RepoContext.skills_in(index)
+            if skills:
+                context = self.validator.RepoContext.for_skill(Path(skills[0][1]), index=index)
+        with self._lock:
+            self.context = context
+        return self._context_summary()
+
+    def _context_summary(self) -> Dict:
+        context = self.context
+        return {
+            'skills': len(context.skills) if context else 0,
+            'glossary': context.glossary_path if context else None,
+            'values': list(context.values) if context else [],
+            'values_source': context.values_path if context else None,
+        }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'validator_version': self.validator.VALIDATOR_VERSION,
+                'root': str(self.root) if self.root else None,
+                **self._context_summary(),
+                'requests': self.requests,
+                'uptime_s': round(time.time() - self.started, 1),
+                'memo_reads': self.memo.reads,
+            }
+
+    def _resolve_path(self, request: Dict) -> str:
+        if request.get('skill'):
+            with self._lock:
+                skill_file = self.context.skill_registry.get(request['skill']) if self.context else None
+            if skill_file is None:
+                raise FileNotFoundError(f"Unknown skill: {request['skill']}")
+            return str(skill_file)
+        if not request.get('path'):
+            raise ValueError("validate needs 'path' or 'skill'")
+        path = Path(request['path'])
+        if not path.is_absolute() and request.get('cwd'):
+            path = Path(request['cwd']) / path
+        return str(path)
+
+    def validate(self, request: Dict) -> Dict:
+        file_path = self._resolve_path(request)
+        if request.get('content') is not None:
+            report = self.validator.validate_skill_content(request['content'], file_path)
+        else:
+            report = self.validator.validate_skill_file(file_path)
+        response = {'report': self.validator.report_to_dict(report)}
+        if request.get('format') == 'text':
+            response['text'] = self.validator.format_text_report(report)
+        return response
+
+    def handle(self, request: Dict) -> Dict:
+        """Answer one request; never raises"""
+        started = time.perf_counter()
+        with self._lock:
+            self.requests += 1
+        response: Dict = {'id': request.get('id')}
+        method = request.get('method', 'validate')
+        try:
+            if method == 'validate':
+                response.update(self.validate(request))
+            elif method == 'ping':
+                response['pong'] = True
+            elif method == 'stats':
+                response['stats'] = self.stats()
+            elif method == 'reload':
+                response['reloaded'] = self.reload()
+            elif method == 'shutdown':
+                self.shutdown_requested.set()
+            else:
+                raise ValueError(f"Unknown method: {method}")
+            response['ok'] = True
+        except (OSError, ValueError) as e:
+            response.update(ok=False, error=str(e))
+        except Exception as e:
+            response.update(ok=False, error=f"Unexpected error: {e}")
+        response['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return response
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        service: ValidationService = self.server.service
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                return
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                response = {'id': None, 'ok': False, 'error': f"Bad request: {e}"}
+            else:
+                response = service.handle(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+            if service.shutdown_requested.is_set():
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class ValidationServer(socketserver.ThreadingUnixStreamServer):
+        """Threaded Unix-socket server; one thread per editor connection"""
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, service: ValidationService):
+            self.service = service
+            self.socket_path = socket_path
+            super().__init__(socket_path, _RequestHandler)
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+else:
+    ValidationServer = None
+
+
+def socket_in_use(socket_path: str) -> bool:
+    """True when another server answers on socket_path (a leftover file does not count)"""
+    if not os.path.exists(socket_path):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def serve(socket_path: str, root: Optional[str] = None) -> None:
+    """Bind socket_path and answer requests until a shutdown request or Ctrl+C"""
+    if ValidationServer is None:
+        raise OSError("Unix sockets are not supported on this platform")
+    if socket_in_use(socket_path):
+        raise OSError(f"A server is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    service = ValidationService(root)
+    with ValidationServer(socket_path, service) as server:
+        os.chmod(socket_path, 0o600)
+        stats = service.stats()
+        print(f"👂 Listening on {socket_path} ({stats['skills']} skills indexed)", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(socket_path: str, payloads: List[Dict], timeout: float = 30.0) -> List[Dict]:
+    """Send requests over one connection and return the responses in order"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        stream = sock.makefile('rwb')
+        responses = []
+        for payload in payloads:
+            stream.write(json.dumps(payload, ensure_ascii=False).encode('utf-8') + b'\n')
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            responses.append(json.loads(line))
+        return responses
+
+
+def run_check(args: argparse.Namespace) -> int:
+    if not args.paths:
+        print("❌ Error: check needs at least one PATH", file=sys.stderr)
+        return 2
+    if args.stdin and len(args.paths) != 1:
+        print("❌ Error: --stdin validates exactly one PATH", file=sys.stderr)
+        return 2
+
+    payloads = []
+    for i, path in enumerate(args.paths, 1):
+        payload = {'id': i, 'method': 'validate', 'path': path, 'cwd': os.getcwd(),
+                   'format': 'json' if args.json else 'text'}
+        if args.stdin:
+            payload['content'] = sys.stdin.buffer.read().decode('utf-8')
+        payloads.append(payload)
+    responses = request(args.socket, payloads, timeout=args.timeout)
+
+    exit_code = 0
+    for response in responses:
+        if not response['ok']:
+            print(f"❌ Error: {response['error']}", file=sys.stderr)
+            exit_code = 2
+            continue
+        if args.json:
+            print(json.dumps(response['report'], indent=2, ensure_ascii=False))
+        else:
+            print(response['text'])
+        if not response['report']['overall']['passed'] and exit_code == 0:
+            exit_code = 1
+    return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Long-running SKILL.md validation server for editors and hooks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python validate_server.py serve --root .
+  python validate_server.py check skills/my-skill/SKILL.md
+  python validate_server.py check skills/my-skill/SKILL.md --json
+  python validate_server.py check skills/my-skill/SKILL.md --stdin < buffer.md
+  python validate_server.py stats
+  python validate_server.py stop
+
+Exit codes (check):
+  0 - all files passed
+  1 - at least one file failed validation
+  2 - file not found, bad request, or no server running
+        """
+    )
+    parser.add_argument('command', choices=['serve', 'check', 'ping', 'stats', 'reload', 'stop'])
+    parser.add_argument('paths', nargs='*', metavar='PATH', help='SKILL.md files to check')
+    parser.add_argument('--socket', default=default_socket_path(),
+                        help='Unix socket path (default: $XDG_RUNTIME_DIR/skill-validate-<uid>.sock)')
+    parser.add_argument('--root', help='serve: repository root whose skills are indexed by name')
+    parser.add_argument('--stdin', action='store_true',
+                        help='check: validate content read from stdin as if saved at PATH')
+    parser.add_argument('--json', action='store_true', help='check: print JSON reports')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help='Client timeout in seconds (default: 30)')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'serve':
+            serve(args.socket, root=args.root)
+            exit(0)
+        if args.command == 'check':
+            exit(run_check(args))
+        method = {'stop': 'shutdown'}.get(args.command, args.command)
+        response = request(args.socket, [{'id': 1, 'method': method}], timeout=args.timeout)[0]
+        print(json.dumps(response, indent=2, ensure_ascii=False))
+        exit(0 if response['ok'] else 2)
+    except (OSError, ConnectionError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,19 +12,173 @@ Usage:
     python validate_skill.py path/to/SKILL.md
     python validate_skill.py path/to/SKILL.md --json
     python validate_skill.py path/to/SKILL.md --output report.txt
+    python validate_skill.py skills/ dotnet/ --recursive --workers 4
+    python validate_skill.py skills/ --recursive --cache
+    python validate_skill.py skills/ dotnet/ --watch
+    python validate_skill.py skills/ archive/ --recursive --jsonl
+    python validate_skill.py --changed-since origin/main
+    python validate_skill.py --staged
+    python validate_skill.py --staged --max-cost cheap
+    python validate_skill.py path/to/SKILL.md --only "1.*,W5" --skip W4
+    python validate_skill.py --staged --fail-fast --time-budget 200
     
-Version: 4.0.0
+Version: 4.2.0
 Author: RyoMurakami1983
-Last Updated: 2026-02-13
+Last Updated: 2026-10-17
 """
 
 import argparse
+import hashlib
+import os
 import re
 import json
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass, asdict, field
+from datetime import date, datetime
+from fnmatch import fnmatchcase
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Dict, Iterator, Sequence, Tuple, Optional, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from skill_corpus import (
+    REGEX_REGISTRY,
+    register_regex,
+    Heading,
+    ListItem,
+    ChangeSet,
+    GitError,
+    MarkdownDocument,
+    RepoIndex,
+    TableBlock,
+    TermScanner,
+    Vocabulary,
+    collect_changes,
+    table_shape_mismatches,
+    read_bytes,
+    read_text,
+    load_document,
+)
+
+VALIDATOR_VERSION = "4.2.0"
+
+
+# --- Precompiled regex registry ---
+# Every pattern the validators use is compiled once at import and registered by
+# name (prefixed with the check that uses it) in skill_corpus.REGEX_REGISTRY, so
+# per-pattern cost can be measured with bench_regex.py and expensive patterns
+# tuned in one place.
+
+RE_FRONTMATTER_KEY = register_regex('frontmatter.key', r'^([A-Za-z0-9_-]+):\s*(.*)$', scope='line')
+RE_FRONTMATTER_SUBKEY = register_regex('frontmatter.subkey', r'^\s+([A-Za-z0-9_-]+):\s*(.*)$', scope='line')
+
+# Sections
+RE_H2 = register_regex('section.h2', r'^##\s+(\S.*)', scope='line')  # title is .strip()ped
+RE_SECTION_BOUNDARY = register_regex(
+    'section.boundary',
+    r'^(when to use|core principles|the philosophy|workflow:|related skills|dependencies|'
+    r'best practices|good practices|common pitfalls|anti-patterns|quick reference|decision tree|'
+    r'resources|validation scripts|migration notice|changelog|pattern\s+\d+:)',
+    re.IGNORECASE, scope='title',
+)
+RE_STEP_TITLE = register_regex('section.step_title', r'Step\s+\d+', scope='title')
+RE_STEP_TITLE_ANYCASE = register_regex('section.step_title_anycase', r'Step\s+\d+', re.IGNORECASE, scope='title')
+
+# Structure (1.x)
+RE_CORE_PRINCIPLES_HEADING = register_regex('1.6.core_principles', r'^##\s+.*Core Principles', re.IGNORECASE, scope='line')
+RE_PHILOSOPHY_HEADING = register_regex('1.6.philosophy', r'^##\s+.*The Philosophy', re.IGNORECASE, scope='line')
+RE_FM_NAME = register_regex('1.3.name', r'name:\s*["\']?([^"\'\n]+)["\']?', re.IGNORECASE)
+RE_FM_DESCRIPTION = register_regex('1.4.description', r'description:\s*["\']?([^"\'\n]+)["\']?', re.IGNORECASE)
+RE_PATTERN_TITLE = register_regex('1.7.pattern_title', r'Pattern\s+\d+:', scope='title')
+RE_PITFALLS_HEADING = register_regex('1.8.pitfalls', r'^##\s+.*Common Pitfalls', re.IGNORECASE, scope='line')
+RE_ANTIPATTERNS_HEADING = register_regex('1.9.anti_patterns', r'^##\s+.*Anti-Patterns', re.IGNORECASE, scope='line')
+RE_QUICK_REFERENCE_HEADING = register_regex('1.10.quick_reference', r'^##\s+.*Quick Reference', re.IGNORECASE, scope='line')
+RE_DECISION_TREE_HEADING = register_regex('1.10.decision_tree', r'^##\s+.*Decision Tree', re.IGNORECASE, scope='line')
+
+# Content (2.x)
+RE_SCENARIO_VERB = register_regex('2.1.2.verb', r'[A-Z][a-z]+ing(?:\s|$)', scope='line')
+RE_PRINCIPLE = register_regex('2.2.1.principle', r'\*\*[^*]+\*\*', scope='line')
+RE_OVERVIEW_HEADING = register_regex('2.3.1.overview', r'^###\s+.*Overview', scope='line')
+RE_TIER_BASIC = register_regex('2.3.2.basic', r'basic|simple|beginner', re.IGNORECASE)
+RE_TIER_INTERMEDIATE = register_regex('2.3.2.intermediate', r'intermediate', re.IGNORECASE)
+RE_TIER_ADVANCED = register_regex('2.3.2.advanced', r'advanced|production', re.IGNORECASE)
+RE_USE_GUIDANCE = register_regex('2.3.3.use_guidance', r'(?:use when|when to use|\*\*when\*\*)', re.IGNORECASE)
+RE_WHEN_TO_USE = register_regex('2.3.3.when_to_use', r'when to use', re.IGNORECASE)
+RE_WHY = register_regex('2.4.2.why', r'\bwhy\b', re.IGNORECASE)
+RE_FIX = register_regex('2.5.3.fix', r'\b(fix|solution|instead|correct)\b', re.IGNORECASE)
+
+# Language (4.x)
+RE_IMPERATIVE = register_regex('4.1.3.imperative', r'(Use|Implement|Create|Define|Apply|Avoid|Consider)', scope='line')
+RE_DEFINITION = register_regex('4.2.2.definition', r'\*\*[A-Z][^*]+\*\*:')
+# [^()] keeps an unclosed "API (" from scanning the rest of the file for ')'
+RE_ACRONYM = register_regex('4.2.3.acronym', r'\b[A-Z]{2,}\b\s*\([^()]+\)|\([A-Z]{2,}\)')
+
+# Warnings (W1-W5)
+RE_DECISION_TABLE = register_regex('W1.4.decision_table', r'decision\s+table|判断テーブル|判断表', re.IGNORECASE)
+RE_GLOSSARY_DATE = register_regex('W4.glossary_date', r'Glossary Last Updated[:\s]*(\d{4}-\d{2}-\d{2})')
+RE_W5_VALUES_BLOCKQUOTE = register_regex('W5.values_blockquote', r'^>\s*\*\*Values\*\*', scope='line')
+# Values names allowed in parentheses in EN files. The repo's PHILOSOPHY.md is the
+# source of truth (see parse_values_vocabulary); this list is the fallback when
+# there is none, e.g. for in-memory validation without a RepoContext.
+DEFAULT_VALUES = (
+    '基礎と型の追求', 'ニュートラルな視点', '温故知新', '継続は力', '基礎と型',
+    '成長の複利', 'ニュートラル', '余白の設計',
+)
+
+
+def values_parenthetical_pattern(values: Tuple[str, ...]) -> 're.Pattern[str]':
+    """(基礎と型) / （基礎と型） for any of the given Values names"""
+    names = '|'.join(re.escape(v) for v in sorted(values, key=len, reverse=True))
+    return re.compile(rf'[（(](?:{names})[)）]')
+
+
+RE_W5_VALUES_PARENTHETICAL = register_regex(
+    'W5.values_parenthetical', values_parenthetical_pattern(DEFAULT_VALUES).pattern,
+)
+RE_W5_VALUES_LINE = register_regex('W5.values_line', r'\*\*Values\*\*\s*[:：]', scope='line')
+RE_JAPANESE = register_regex('W5.japanese', r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]+', scope='line')
+
+# PHILOSOPHY.md Values vocabulary
+RE_VALUES_SECTION = register_regex('context.values_section', r'^Values(?![:：])', scope='title')
+RE_VALUES_NUMBERED = register_regex('context.values_numbered', r'^\d+\.\s*(.+)$', scope='title')
+RE_VALUES_LIST = register_regex('context.values_list', r'^Values\s*[:：]\s*(.+)$', scope='title')
+
+# Vocabulary lists, all matched in one pass per document (see skill_corpus.TermScanner)
+SAFETY_KEYWORDS_JA = (
+    'セキュリティ', '認証', '認可', '削除', '破壊的', '秘密',
+    '機密', 'トークン', 'パスワード', 'クレデンシャル', '危険',
+    '禁止', '絶対にしない', '必ず確認',
+)
+NEGATION_PATTERNS_JA = (
+    'しない', 'してはいけない', '禁止', '不可',
+    '使わない', '避ける', 'やめる',
+)
+VOCABULARY_SCANNER = TermScanner('vocabulary.terms', {
+    '3.1.3.dependencies': Vocabulary(('nuget', 'package', 'dependency', 'dependencies', 'npm', 'pip')),
+    '3.4.1.di': Vocabulary(('dependency injection', 'addscoped', 'addsingleton',
+                            'addtransient', 'configure services')),
+    '4.1.1.passive': Vocabulary(('is recommended', 'is used', 'is implemented',
+                                 'are required', 'was created', 'were designed'), whole_words=True),
+    '4.1.4.vague': Vocabulary(('may', 'might', 'possibly', 'perhaps', 'sometimes', 'often'),
+                              whole_words=True),
+    'W3.1.safety': Vocabulary(SAFETY_KEYWORDS_JA),
+    'W3.2.negation': Vocabulary(NEGATION_PATTERNS_JA),
+})
+
+
+def _line_refs(lines: List[int], limit: int = 5) -> str:
+    """' at L3, L9' for the first lines of a finding ('' when there are none)"""
+    if not lines:
+        return ""
+    more = f" (+{len(lines) - limit} more)" if len(lines) > limit else ""
+    return " at " + ", ".join(f"L{line}" for line in lines[:limit]) + more
+
 
 # Ensure UTF-8 encoding for stdout
 if sys.platform == 'win32':
@@ -33,12 +187,25 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
+@dataclass
+class SourceSpan:
+    """1-based position of a finding in the checked file (end_column is exclusive)"""
+    line: int
+    column: int
+    end_column: int
+
+
 @dataclass
 class WarningResult:
     """Warning-level check result (does not affect pass/fail)"""
     id: str
     description: str
     details: str = ""
+    locations: List[SourceSpan] = None
+
+    def __post_init__(self):
+        if self.locations is None:
+            self.locations = []
 
 
 @dataclass
@@ -77,37 +244,536 @@ class ValidationReport:
     overall_passed: bool
     overall_threshold: float = 85.0
     warnings: List[WarningResult] = None
+    selection: str = ""  # CheckSelection.describe() of a partial run
+    stopped: str = ""  # why --fail-fast or --time-budget cut the run short
 
     def __post_init__(self):
         if self.warnings is None:
             self.warnings = []
 
 
-class SkillValidator:
+@dataclass
+class BatchReport:
+    """Aggregated result of validating many SKILL.md files in one run"""
+    reports: List[ValidationReport]
+    errors: List[Tuple[str, str]]  # (file_path, error message)
+
+    @property
+    def passed_count(self) -> int:
+        return sum(1 for r in self.reports if r.overall_passed)
+
+    @property
+    def failed_count(self) -> int:
+        return sum(1 for r in self.reports if not r.overall_passed)
+
+    @property
+    def all_passed(self) -> bool:
+        return not self.errors and self.failed_count == 0
+
+
+def parse_values_vocabulary(text: str) -> Tuple[str, ...]:
+    """Values names from PHILOSOPHY.md.
+
+    Full names come from the numbered headings under the "### Values" section
+    (#### 3. 基礎と型の追求); short forms from "### Values: 基礎と型 / 成長の複利"
+    headings. Returns () when the file names no Values.
+    """
+    doc = MarkdownDocument(text)
+    names: List[str] = []
+    section_level = None
+    for heading in doc.headings:
+        if section_level is not None and heading.level <= section_level:
+            section_level = None
+        if section_level is not None:
+            numbered = RE_VALUES_NUMBERED.match(heading.title)
+            if numbered:
+                names.append(numbered.group(1).strip())
+        elif RE_VALUES_SECTION.match(heading.title):
+            section_level = heading.level
+        listed = RE_VALUES_LIST.match(heading.title)
+        if listed:
+            names.extend(name.strip() for name in listed.group(1).split('/'))
+    return tuple(dict.fromkeys(name for name in names if name))
+
+
+@lru_cache(maxsize=16)
+def _values_pattern(values: Tuple[str, ...]) -> 're.Pattern[str]':
+    if values == DEFAULT_VALUES:
+        return RE_W5_VALUES_PARENTHETICAL
+    return values_parenthetical_pattern(values)
+
+
+@dataclass(frozen=True)
+class RepoContext:
+    """Repository-level inputs shared by every skill (immutable, safe to share between threads)"""
+    glossary_path: Optional[str] = None  # None: no copilot-instructions.md, W4 is skipped
+    glossary_date: Optional[date] = None  # None with a glossary: its date line is missing
+    values: Tuple[str, ...] = DEFAULT_VALUES  # W5 allow-list
+    values_path: Optional[str] = None  # PHILOSOPHY.md the Values came from
+    skills: Tuple[Tuple[str, str], ...] = ()  # (skill name, SKILL.md path) in the indexed roots
+
+    @property
+    def values_pattern(self) -> 're.Pattern[str]':
+        return _values_pattern(self.values)
+
+    @cached_property
+    def skill_registry(self) -> Dict[str, str]:
+        """Skill name (directory name) -> SKILL.md path"""
+        return dict(self.skills)
+
+    @staticmethod
+    def skills_in(index: Optional[RepoIndex]) -> Tuple[Tuple[str, str], ...]:
+        """Registry entries for every skill in index; the first directory with a name wins"""
+        registry: Dict[str, str] = {}
+        for entry in (index.skills.values() if index is not None else ()):
+            registry.setdefault(os.path.basename(entry.directory), entry.skill_file)
+        return tuple(registry.items())
+
+    @classmethod
+    def from_glossary_text(cls, text: str, path: str = "copilot-instructions.md") -> 'RepoContext':
+        return cls.from_texts(glossary_text=text, glossary_path=path)
+
+    @classmethod
+    def from_texts(cls, glossary_text: Optional[str] = None, philosophy_text: Optional[str] = None,
+                   glossary_path: str = "copilot-instructions.md", philosophy_path: str = "PHILOSOPHY.md",
+                   skills: Tuple[Tuple[str, str], ...] = ()) -> 'RepoContext':
+        """Build a context from file contents (None: that file does not exist)"""
+        fields = {'skills': tuple(skills)}
+        if glossary_text is not None:
+            # Extract "Glossary Last Updated: YYYY-MM-DD"
+            date_match = RE_GLOSSARY_DATE.search(glossary_text)
+            fields['glossary_path'] = glossary_path
+            fields['glossary_date'] = (
+                datetime.strptime(date_match.group(1), '%Y-%m-%d').date() if date_match else None
+            )
+        values = parse_values_vocabulary(philosophy_text) if philosophy_text is not None else ()
+        if values:
+            fields['values'] = values
+            fields['values_path'] = philosophy_path
+        return cls(**fields)
+
+    @classmethod
+    def for_skill(cls, skill_path: Path, index: Optional[RepoIndex] = None) -> 'RepoContext':
+        """The context of the repository skill_path lives in, built once per process.
+
+        The skill registry comes from index (default: the active REPO_INDEX).
+        Under an index the first result is reused for as long as that index is;
+        otherwise it is rebuilt only when the glossary or PHILOSOPHY.md changes.
+        """
+        index = index if index is not None else REPO_INDEX
+        resolved = skill_path.resolve()
+        glossary = find_glossary_file(resolved)
+        philosophy = find_philosophy_file(resolved)
+        key = (str(glossary), str(philosophy))
+        with _REPO_CONTEXTS_LOCK:
+            cached = _REPO_CONTEXTS.get(key)
+        if cached is not None and cached[1] is not index:
+            cached = None
+        if cached is not None and index is not None:
+            return cached[2]
+
+        texts = []
+        for path in (glossary, philosophy):
+            try:
+                texts.append(read_text(path) if path is not None else None)
+            except OSError:
+                texts.append(None)
+        # The document memo hands back the same str object while a file is unchanged
+        if cached is not None and all(a is b for a, b in zip(cached[0], texts)):
+            return cached[2]
+
+        context = cls.from_texts(
+            glossary_text=texts[0], philosophy_text=texts[1],
+            glossary_path=str(glossary), philosophy_path=str(philosophy),
+            skills=cls.skills_in(index),
+        )
+        with _REPO_CONTEXTS_LOCK:
+            _REPO_CONTEXTS[key] = (tuple(texts), index, context)
+        return context
+
+
+# (glossary, PHILOSOPHY.md) -> (their texts, the index the registry came from, context)
+_REPO_CONTEXTS: Dict[Tuple[str, str], Tuple[Tuple[Optional[str], ...], Optional[RepoIndex], RepoContext]] = {}
+_REPO_CONTEXTS_LOCK = threading.Lock()
+
+
+@dataclass
+class SkillInputs:
+    """Everything the checks read besides the EN document, resolved before validation.
+
+    Checks only look here, never at the filesystem, so the same validators run
+    on files, editor buffers and git blobs alike.
+    """
+    ja_document: Optional[MarkdownDocument] = None
+    modified: Optional[date] = None  # EN file modification date (W4)
+    context: RepoContext = field(default_factory=RepoContext)
+
+
+JA_CANDIDATES = (Path("references") / "SKILL.ja.md", Path("SKILL.ja.md"))
+
+# Snapshot of the roots being validated (see use_repo_index); None = probe the disk
+REPO_INDEX: Optional[RepoIndex] = None
+
+
+def use_repo_index(index: Optional[RepoIndex]) -> None:
+    """Answer JA/glossary/mtime lookups for files under index.roots from the index.
+
+    Also the process-pool initializer, so each worker receives the index once.
+    """
+    global REPO_INDEX
+    REPO_INDEX = index
+
+
+def _indexed(skill_path: Path) -> bool:
+    return REPO_INDEX is not None and REPO_INDEX.covers(skill_path)
+
+
+def find_ja_file(skill_path: Path) -> Optional[Path]:
+    """Locate the Japanese version next to a SKILL.md"""
+    if _indexed(skill_path):
+        ja_file = REPO_INDEX.ja_file_for(skill_path)
+        return Path(ja_file) if ja_file else None
+    for candidate in JA_CANDIDATES:
+        ja_path = skill_path.parent / candidate
+        if ja_path.exists():
+            return ja_path
+    return None
+
+
+def modified_date(skill_path: Path) -> Optional[date]:
+    """Modification date of a skill file (None if it does not exist)"""
+    entry = REPO_INDEX.skill(skill_path) if _indexed(skill_path) else None
+    if entry is not None:
+        return datetime.fromtimestamp(entry.mtime).date()
+    try:
+        return datetime.fromtimestamp(skill_path.stat().st_mtime).date()
+    except OSError:
+        return None  # in-memory content may have no file yet
+
+
+def load_inputs(skill_path: Path, ja: bool = True, repo: bool = True) -> SkillInputs:
+    """Resolve a skill file's JA companion, modification date and repo context.
+
+    ja=False / repo=False leave those inputs empty without touching the disk,
+    for runs whose selected checks never read them.
+    """
+    ja_path = find_ja_file(skill_path) if ja else None
+    inputs = SkillInputs(ja_document=load_document(ja_path) if ja_path is not None else None)
+    if repo:
+        inputs.modified = modified_date(skill_path)
+        inputs.context = RepoContext.for_skill(skill_path)
+    return inputs
+
+
+def _load_selected_inputs(skill_path: Path, selection: 'CheckSelection') -> SkillInputs:
+    return load_inputs(skill_path, ja=selection.needs('ja'), repo=selection.needs('repo'))
+
+
+# --- Check registry ---
+# Each check is a validator method registered with @check, declaring what it
+# reads and how expensive it is. validate() runs the registered checks in
+# declaration order, so a CheckSelection (--only/--skip/--max-cost) can leave
+# checks out entirely: an unselected check is never called, and inputs no
+# selected check reads (JA file, repo context) are never loaded.
+
+# What a check reads: SKILL.md body, its frontmatter, fenced code blocks,
+# the JA companion, and repo context (glossary, PHILOSOPHY.md, file dates)
+CHECK_INPUTS = ('en', 'frontmatter', 'code', 'ja', 'repo')
+
+# Cheapest first: 'cheap' reads the parsed outline (frontmatter, headings,
+# lists, tables, code blocks), 'scan' searches the full text (regex,
+# vocabulary, substring counts), 'cross-file' reads files besides SKILL.md
+COST_CLASSES = ('cheap', 'scan', 'cross-file')
+
+
+@dataclass(frozen=True)
+class CheckSpec:
+    """Declaration of one registered check (a scored item or a W group)"""
+    id: str
+    category: str
+    inputs: Tuple[str, ...]
+    cost: str
+    method: str
+    router: Optional[str] = None  # description reported as N/A for router skills
+
+
+CHECK_REGISTRY: Dict[str, CheckSpec] = {}
+
+
+def check(check_id: str, inputs: Tuple[str, ...] = ('en',), cost: str = 'cheap',
+          router: Optional[str] = None):
+    """Register a validator method as check check_id (see CheckSpec)"""
+    if cost not in COST_CLASSES or not set(inputs) <= set(CHECK_INPUTS):
+        raise ValueError(f"Bad declaration for check {check_id}: {inputs}, {cost}")
+
+    def register(method):
+        method.check_args = (check_id, tuple(inputs), cost, router)
+        return method
+    return register
+
+
+class _RegistersChecks:
+    """Collects a validator's @check methods into CHECKS and CHECK_REGISTRY"""
+    CATEGORY = ""
+    CHECKS: Tuple[CheckSpec, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        specs = []
+        for name, member in vars(cls).items():
+            args = getattr(member, 'check_args', None)
+            if args is None:
+                continue
+            check_id, inputs, cost, router = args
+            spec = CheckSpec(check_id, cls.CATEGORY, inputs, cost, name, router)
+            CHECK_REGISTRY[check_id] = spec
+            specs.append(spec)
+        cls.CHECKS = tuple(specs)
+
+
+def _id_matches(check_id: str, pattern: str) -> bool:
+    """fnmatch an ID pattern; a plain ID also covers the IDs nested under it ("2.1" -> 2.1.x)"""
+    check_id, pattern = check_id.upper(), pattern.upper()
+    return fnmatchcase(check_id, pattern) or check_id.startswith(pattern + '.')
+
+
+class CheckSelection:
+    """Which registered checks run: --only/--skip ID patterns and a --max-cost ceiling.
+
+    Categories are scored over their selected checks only; a category with no
+    selected check is left out of the report.
+    """
+
+    def __init__(self, only: Sequence[str] = (), skip: Sequence[str] = (),
+                 max_cost: Optional[str] = None):
+        self.only = tuple(only)
+        self.skip = tuple(skip)
+        self.max_cost = max_cost
+        for pattern in self.only + self.skip:
+            if not any(_id_matches(check_id, pattern) for check_id in CHECK_REGISTRY):
+                raise ValueError(f"No check matches '{pattern}'")
+        if max_cost is not None and max_cost not in COST_CLASSES:
+            raise ValueError(f"Unknown cost class '{max_cost}' (choose from {', '.join(COST_CLASSES)})")
+        ceiling = COST_CLASSES.index(max_cost) if max_cost else len(COST_CLASSES)
+        self.ids: FrozenSet[str] = frozenset(
+            spec.id for spec in CHECK_REGISTRY.values()
+            if (not self.only or any(_id_matches(spec.id, p) for p in self.only))
+            and not any(_id_matches(spec.id, p) for p in self.skip)
+            and COST_CLASSES.index(spec.cost) <= ceiling
+        )
+
+    @classmethod
+    def parse(cls, only: Optional[str] = None, skip: Optional[str] = None,
+              max_cost: Optional[str] = None) -> 'CheckSelection':
+        """Build a selection from comma-separated CLI lists ("1.*,W5")"""
+        def split(text: Optional[str]) -> List[str]:
+            return [p.strip() for p in (text or '').split(',') if p.strip()]
+        return cls(split(only), split(skip), max_cost)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.ids) == len(CHECK_REGISTRY)
+
+    def includes(self, spec: CheckSpec) -> bool:
+        return spec.id in self.ids
+
+    def any_of(self, specs: Sequence[CheckSpec]) -> bool:
+        return any(spec.id in self.ids for spec in specs)
+
+    def needs(self, name: str) -> bool:
+        """True when a selected check reads input name (see CHECK_INPUTS)"""
+        return any(name in CHECK_REGISTRY[check_id].inputs for check_id in self.ids)
+
+    def describe(self) -> str:
+        """One-line summary for reports ("" for a full run)"""
+        if self.is_full:
+            return ""
+        parts = []
+        if self.only:
+            parts.append(f"only {','.join(self.only)}")
+        if self.skip:
+            parts.append(f"skip {','.join(self.skip)}")
+        if self.max_cost:
+            parts.append(f"max cost {self.max_cost}")
+        return f"{'; '.join(parts)} ({len(self.ids)}/{len(CHECK_REGISTRY)} checks)"
+
+
+@dataclass(frozen=True)
+class EarlyExit:
+    """When validation of one file may stop before every selected check ran.
+
+    fail_fast stops at the first failure after which a category can no longer
+    reach 80% or the overall score 85%. time_budget (seconds) caps the whole
+    file; in the main thread an alarm interrupts even a runaway regex, and
+    elsewhere the budget is checked between checks.
+    """
+    fail_fast: bool = False
+    time_budget: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return self.fail_fast or self.time_budget is not None
+
+
+NO_EARLY_EXIT = EarlyExit()
+
+
+class CheckTimeout(Exception):
+    """Raised by the --time-budget alarm inside whatever check is running"""
+
+
+class _Gate:
+    """One file's EarlyExit state: failures per category, the clock and the stop reason"""
+
+    def __init__(self, early_exit: EarlyExit, selection: CheckSelection):
+        self.early_exit = early_exit
+        self.selection = selection
+        self.failed: Dict[str, int] = {}
+        self.current = "setup"  # check (or stage) running when the budget runs out
+        self.stopped = ""
+        self.started = time.perf_counter()
+        self.live = False  # the --time-budget alarm is set
+
+    @cached_property
+    def totals(self) -> Dict[str, int]:
+        """Selected scored checks per category"""
+        totals: Dict[str, int] = {}
+        for check_id in self.selection.ids:
+            category = CHECK_REGISTRY[check_id].category
+            if category != WarningValidator.CATEGORY:
+                totals[category] = totals.get(category, 0) + 1
+        return totals
+
+    def record(self, category: str, result: CheckResult) -> bool:
+        """Count a finished check; True when validation should stop after it"""
+        if not self.early_exit.active:
+            return False
+        if self.early_exit.fail_fast and not result.passed:
+            self.failed[category] = self.failed.get(category, 0) + 1
+            total = self.totals[category]
+            if total - self.failed[category] < total * 0.8:
+                return self.stop(f"fail-fast: {category} can no longer reach 80% (after {result.id})")
+            overall = sum(self.totals.values())
+            if (overall - sum(self.failed.values())) / overall * 100 < 85:
+                return self.stop(f"fail-fast: overall can no longer reach 85% (after {result.id})")
+        return self.out_of_time(result.id)
+
+    def out_of_time(self, check_id: str) -> bool:
+        """Between-checks budget test (the only one outside the main thread)"""
+        budget = self.early_exit.time_budget
+        if budget is None or time.perf_counter() - self.started <= budget:
+            return False
+        self.current = check_id
+        return self.time_out()
+
+    def time_out(self) -> bool:
+        return self.stop(f"time budget {self.early_exit.time_budget * 1000:g} ms exceeded in {self.current}")
+
+    def stop(self, reason: str) -> bool:
+        self.stopped = self.stopped or reason
+        return True
+
+    @contextmanager
+    def armed(self):
+        """Raise CheckTimeout in the running check once the budget is spent (main thread only)"""
+        budget = self.early_exit.time_budget
+        self.started = time.perf_counter()
+        if (budget is None or not hasattr(signal, 'setitimer')
+                or threading.current_thread() is not threading.main_thread()):
+            yield
+            return
+
+        def expire(signum, frame):
+            if self.live:
+                raise CheckTimeout(self.current)
+
+        previous = signal.signal(signal.SIGALRM, expire)
+        self.live = True
+        signal.setitimer(signal.ITIMER_REAL, budget)
+        try:
+            yield
+        finally:
+            try:
+                self.disarm()
+            finally:
+                signal.signal(signal.SIGALRM, previous)
+
+    def disarm(self) -> None:
+        """Cancel the alarm; safe to call more than once and without one"""
+        if self.live:
+            self.live = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class SkillValidator(_RegistersChecks):
     """Base validator with common utilities"""
 
-    def __init__(self, content: str, file_path: str, is_router: bool = False, is_workflow: bool = False):
+    def __init__(self, content: str, file_path: str, is_router: bool = False, is_workflow: bool = False,
+                 document: Optional[MarkdownDocument] = None, profiler: Optional['Profiler'] = None,
+                 inputs: Optional[SkillInputs] = None, selection: Optional[CheckSelection] = None,
+                 gate: Optional[_Gate] = None):
+        self.doc = document or MarkdownDocument(content)
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
+        self.lines = self.doc.lines
         self.is_router = is_router
         self.is_workflow = is_workflow
+        self.profiler = profiler
+        self._inputs = inputs
+        self.selection = selection or ALL_CHECKS
+        self.gate = gate or _Gate(NO_EARLY_EXIT, self.selection)
+
+    @property
+    def inputs(self) -> SkillInputs:
+        """Inputs given by the caller, else resolved from disk on first use"""
+        if self._inputs is None:
+            self._inputs = load_inputs(Path(self.file_path))
+        return self._inputs
+
+    def _check_list(self) -> List[CheckResult]:
+        """Result list for validate(); lap-times each check when profiling"""
+        if self.profiler is None:
+            return []
+        return _LapList(self.profiler, self.file_path, type(self).__name__)
+
+    def validate(self) -> List[CheckResult]:
+        """Run the selected checks of this category in declaration order, until the gate stops"""
+        checks = self._check_list()
+        for spec in self.CHECKS:
+            if not self.selection.includes(spec):
+                continue
+            self.gate.current = spec.id
+            try:
+                if self.is_router and spec.router is not None:
+                    result = CheckResult(spec.id, spec.router, True, "N/A (router skill)")
+                else:
+                    result = getattr(self, spec.method)()
+            except CheckTimeout:
+                self.gate.time_out()
+                break
+            checks.append(result)
+            if self.gate.record(self.CATEGORY, result):
+                break
+        return checks
 
-    def has_section(self, pattern: str) -> bool:
-        """Check if section exists (case-insensitive)"""
-        return bool(re.search(pattern, self.content, re.IGNORECASE | re.MULTILINE))
+    @cached_property
+    def step_count(self) -> int:
+        """Number of "### Step N" workflow headings"""
+        return sum(1 for h in self.doc.headings_at(3) if RE_STEP_TITLE.match(h.title))
 
-    def count_sections(self, pattern: str) -> int:
-        """Count number of matching sections, excluding code blocks"""
-        # Remove code blocks first to avoid counting headings inside them
-        # Use line-start anchor to avoid matching inline code
-        content_without_code = re.sub(r'^```.*?^```', '', self.content, flags=re.DOTALL | re.MULTILINE)
-        return len(re.findall(pattern, content_without_code, re.MULTILINE))
+    def has_section(self, pattern: Union[str, 're.Pattern[str]']) -> bool:
+        """Check if a heading matching pattern exists (string patterns are case-insensitive)"""
+        regex = re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+        return any(regex.match(self.lines[h.line]) for h in self.doc.headings)
+
+    def count_sections(self, pattern: Union[str, 're.Pattern[str]']) -> int:
+        """Count headings matching pattern (headings inside code blocks are excluded)"""
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        return sum(1 for h in self.doc.headings if regex.match(self.lines[h.line]))
 
     def extract_frontmatter(self) -> Optional[str]:
         """Extract YAML frontmatter"""
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', self.content, re.DOTALL)
-        return match.group(1) if match else None
+        return self.doc.frontmatter
 
     def parse_frontmatter(self) -> Dict:
         """Parse frontmatter into a simplified dict without external deps."""
@@ -124,7 +790,7 @@ class SkillValidator:
                 i += 1
                 continue
 
-            m = re.match(r'^([A-Za-z0-9_-]+):\s*(.*)$', line)
+            m = RE_FRONTMATTER_KEY.match(line)
             if not m:
                 i += 1
                 continue
@@ -139,7 +805,7 @@ class SkillValidator:
                     sub = lines[i]
                     if sub and not sub.startswith(' ') and not sub.startswith('\t'):
                         break
-                    sm = re.match(r'^\s+([A-Za-z0-9_-]+):\s*(.*)$', sub)
+                    sm = RE_FRONTMATTER_SUBKEY.match(sub)
                     if sm:
                         meta[sm.group(1)] = sm.group(2).strip().strip('"\'')
                     i += 1
@@ -164,136 +830,153 @@ class SkillValidator:
 
         return data
 
-    def get_section_content(self, heading: str) -> Optional[str]:
-        """Extract a section body while ignoring headings inside fenced code blocks."""
-        lines = self.content.split('\n')
+    def get_section_range(self, heading: str) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) line range of a section body, ignoring headings inside fenced code blocks."""
         heading_prefix = heading.strip().lower()
-        section_boundary_pattern = re.compile(
-            r'^(when to use|core principles|the philosophy|workflow:|related skills|dependencies|'
-            r'best practices|good practices|common pitfalls|anti-patterns|quick reference|decision tree|'
-            r'resources|validation scripts|migration notice|changelog|pattern\s+\d+:)',
-            re.IGNORECASE,
-        )
+        h2_headings = self.doc.headings_at(2)
+
         start_line: Optional[int] = None
-        end_line: Optional[int] = None
-
-        in_fence = False
-        fence_char = ''
-        fence_len = 0
-
-        for idx, line in enumerate(lines):
-            # CommonMark: fenced code blocks are recognized with up to 3 leading spaces.
-            fence_match = re.match(r'^ {0,3}([`~]{3,})', line)
-            if fence_match:
-                marker = fence_match.group(1)
-                if not in_fence:
-                    in_fence = True
-                    fence_char = marker[0]
-                    fence_len = len(marker)
-                elif marker[0] == fence_char and len(marker) >= fence_len:
-                    in_fence = False
-                continue
+        for h2 in h2_headings:
+            if h2.title.lower().startswith(heading_prefix):
+                start_line = h2.line + 1
+                break
+        if start_line is None:
+            return None
 
-            if in_fence:
-                # Guardrail for malformed markdown: if a known top-level section appears while
-                # a fence remains unclosed, stop the current section at that boundary.
-                h2_in_fence = re.match(r'^##\s+(.+?)\s*$', line)
-                if start_line is not None and h2_in_fence:
-                    h2_title = h2_in_fence.group(1).strip()
-                    if section_boundary_pattern.match(h2_title):
-                        end_line = idx
-                        break
-                continue
+        end_line = len(self.lines)
+        for h2 in h2_headings:
+            if h2.line >= start_line:
+                end_line = h2.line
+                break
 
-            h2_match = re.match(r'^##\s+(.+?)\s*$', line)
-            if not h2_match:
-                continue
+        # Guardrail for malformed markdown: if a known top-level section appears while
+        # a fence remains unclosed, stop the current section at that boundary.
+        for fence in self.doc.fences:
+            interior_end = fence.end - 1 if fence.closed else fence.end
+            for idx in range(max(fence.start + 1, start_line), min(interior_end + 1, end_line)):
+                h2_in_fence = RE_H2.match(self.lines[idx])
+                if h2_in_fence and RE_SECTION_BOUNDARY.match(h2_in_fence.group(1).strip()):
+                    return start_line, idx
 
-            h2_title = h2_match.group(1).strip().lower()
-            if start_line is None:
-                if h2_title.startswith(heading_prefix):
-                    start_line = idx + 1
-            else:
-                end_line = idx
-                break
+        return start_line, end_line
 
-        if start_line is None:
+    def get_section_content(self, heading: str) -> Optional[str]:
+        """Extract a section body while ignoring headings inside fenced code blocks."""
+        section_range = self.get_section_range(heading)
+        if section_range is None:
             return None
-
-        section_lines = lines[start_line:end_line] if end_line is not None else lines[start_line:]
-        return '\n'.join(section_lines).strip()
+        start_line, end_line = section_range
+        return '\n'.join(self.lines[start_line:end_line]).strip()
+
+    def tables_in(self, section_range: Optional[Tuple[int, int]]) -> List[TableBlock]:
+        """Tables inside a section range"""
+        if section_range is None:
+            return []
+        return self.doc.tables_in(*section_range)
+
+    def list_items_in(self, section_range: Optional[Tuple[int, int]]) -> List[ListItem]:
+        """Top-level bullet items (- or *) inside a section range"""
+        if section_range is None:
+            return []
+        start_line, end_line = section_range
+        return [
+            item for item in self.doc.list_items
+            if start_line <= item.line < end_line and item.indent == 0 and item.marker in ('-', '*')
+        ]
 
 
 class StructureValidator(SkillValidator):
     """Validates structure requirements (14 items)"""
+    CATEGORY = "Structure"
 
-    def validate(self) -> List[CheckResult]:
-        checks = []
+    @cached_property
+    def frontmatter_data(self) -> Dict:
+        return self.parse_frontmatter()
+
+    @cached_property
+    def mentions_router(self) -> bool:
+        """Router skill detected from the text itself (1.7, 1.11)"""
+        frontmatter = self.extract_frontmatter()
+        return 'router' in (frontmatter or '').lower() or 'router skill' in self.content[:500].lower()
 
+    @check("1.1", inputs=())
+    def _check_single_file(self) -> CheckResult:
         # 1.1 Single SKILL.md file
-        checks.append(CheckResult(
+        return CheckResult(
             "1.1",
             "Single SKILL.md file",
             self.file_path.endswith('SKILL.md'),
             f"File: {Path(self.file_path).name}"
-        ))
+        )
 
+    @check("1.2", inputs=('frontmatter',))
+    def _check_frontmatter_fields(self) -> CheckResult:
         # 1.2 YAML frontmatter present with required fields
-        frontmatter = self.extract_frontmatter()
-        frontmatter_data = self.parse_frontmatter()
+        frontmatter_data = self.frontmatter_data
         has_required_fields = False
         if frontmatter_data:
             has_required_fields = all(k in frontmatter_data for k in ['name', 'description'])
-        checks.append(CheckResult(
+        return CheckResult(
             "1.2",
             "YAML frontmatter with name/description",
             has_required_fields,
             "Found" if has_required_fields else "Missing or incomplete"
-        ))
+        )
 
+    @check("1.2b", inputs=('frontmatter',))
+    def _check_metadata_author(self) -> CheckResult:
         # 1.2b Metadata includes author/tags/invocable (legacy top-level also accepted)
+        frontmatter_data = self.frontmatter_data
         metadata = frontmatter_data.get('metadata', {}) if isinstance(frontmatter_data.get('metadata', {}), dict) else {}
         has_author = (
             'author' in metadata or
             ('author' in frontmatter_data and bool(frontmatter_data.get('author')))
         )
-        checks.append(CheckResult(
+        return CheckResult(
             "1.2b",
             "YAML frontmatter includes metadata author",
             has_author,
             "Found" if has_author else "Missing metadata.author"
-        ))
+        )
 
+    @check("1.2c", inputs=('frontmatter',))
+    def _check_forbidden_keys(self) -> CheckResult:
         # 1.2c No forbidden top-level keys (must be under metadata:)
+        frontmatter_data = self.frontmatter_data
         forbidden_top_level = {'version', 'author', 'tags', 'invocable'}
         found_forbidden = []
         if frontmatter_data:
             found_forbidden = [k for k in forbidden_top_level if k in frontmatter_data and k not in (frontmatter_data.get('metadata', {}) or {})]
         no_forbidden = len(found_forbidden) == 0
-        checks.append(CheckResult(
+        return CheckResult(
             "1.2c",
             "No forbidden top-level keys (version/author/tags/invocable)",
             no_forbidden,
             f"Found forbidden: {', '.join(found_forbidden)}" if found_forbidden else "Clean"
-        ))
+        )
 
+    @check("1.3", inputs=('frontmatter',))
+    def _check_name_matches_folder(self) -> CheckResult:
         # 1.3 frontmatter name matches folder (kebab-case)
-        name_match = re.search(r'name:\s*["\']?([^"\'\n]+)["\']?', frontmatter or '', re.IGNORECASE)
+        name_match = RE_FM_NAME.search(self.extract_frontmatter() or '')
         folder_name = Path(self.file_path).parent.name
         names_match = False
         if name_match:
             skill_name = name_match.group(1).strip().lower().replace(' ', '-')
             folder_lower = folder_name.lower()
             names_match = skill_name == folder_lower or skill_name in folder_lower
-        checks.append(CheckResult(
+        return CheckResult(
             "1.3",
             "Name matches folder (kebab-case)",
             names_match,
             f"Folder: {folder_name}"
-        ))
+        )
 
+    @check("1.4", inputs=('frontmatter',))
+    def _check_description(self) -> CheckResult:
         # 1.4 description <= 1024 chars and includes trigger phrase
-        desc_match = re.search(r'description:\s*["\']?([^"\'\n]+)["\']?', frontmatter or '', re.IGNORECASE)
+        frontmatter_data = self.frontmatter_data
+        desc_match = RE_FM_DESCRIPTION.search(self.extract_frontmatter() or '')
         desc_length_ok = False
         desc = ""
         if isinstance(frontmatter_data.get('description'), str):
@@ -302,46 +985,52 @@ class StructureValidator(SkillValidator):
             desc = desc_match.group(1).strip()
         if desc:
             desc_length_ok = len(desc) <= 1024 and 'use when' in desc.lower()
-        checks.append(CheckResult(
+        return CheckResult(
             "1.4",
             "Description ≤1024 chars and includes trigger phrase",
             desc_length_ok,
             f"{len(desc)} chars"
-        ))
+        )
 
+    @check("1.5")
+    def _check_when_to_use_first(self) -> CheckResult:
         # 1.5 "When to Use This Skill" is first H2
-        first_h2 = re.search(r'^##\s+(.+)$', self.content, re.MULTILINE)
+        h2_headings = self.doc.headings_at(2)
+        first_h2 = h2_headings[0].title if h2_headings else None
         when_to_use_first = False
         if first_h2:
-            when_to_use_first = 'when to use' in first_h2.group(1).lower()
-        checks.append(CheckResult(
+            when_to_use_first = 'when to use' in first_h2.lower()
+        return CheckResult(
             "1.5",
             '"When to Use This Skill" is first H2',
             when_to_use_first,
-            first_h2.group(1) if first_h2 else "No H2 found"
-        ))
+            first_h2 if first_h2 else "No H2 found"
+        )
 
+    @check("1.6")
+    def _check_principles_section(self) -> CheckResult:
         # 1.6 "Core Principles" or "The Philosophy" exists
         has_principles = (
-            self.has_section(r'^##\s+.*Core Principles') or
-            self.has_section(r'^##\s+.*The Philosophy')
+            self.has_section(RE_CORE_PRINCIPLES_HEADING) or
+            self.has_section(RE_PHILOSOPHY_HEADING)
         )
-        checks.append(CheckResult(
+        return CheckResult(
             "1.6",
             '"Core Principles" or "The Philosophy" section exists',
             has_principles
-        ))
+        )
 
+    @check("1.7", inputs=('en', 'frontmatter'))
+    def _check_workflow_structure(self) -> CheckResult:
         # 1.7 Workflow or Pattern structure
         # New standard: single "## Workflow:" section
         # Legacy: 7-10 "## Pattern N:" sections
         # Router skills: single routing workflow (detected separately)
-        content_without_code = re.sub(r'^```.*?^```', '', self.content, flags=re.DOTALL | re.MULTILINE)
-        pattern_count = len(re.findall(r'^##\s+Pattern\s+\d+:', content_without_code, re.MULTILINE))
-        has_workflow = bool(re.search(r'^##\s+Workflow:', content_without_code, re.MULTILINE))
-        is_router = 'router' in (frontmatter or '').lower() or 'router skill' in self.content[:500].lower()
-        
-        if has_workflow or is_router:
+        h2_headings = self.doc.headings_at(2)
+        pattern_count = sum(1 for h in h2_headings if RE_PATTERN_TITLE.match(h.title))
+        has_workflow = any(h.title.startswith('Workflow:') for h in h2_headings)
+
+        if has_workflow or self.mentions_router:
             structure_ok = True
             detail = "Workflow section found" if has_workflow else "Router skill detected"
         elif 7 <= pattern_count <= 10:
@@ -350,282 +1039,295 @@ class StructureValidator(SkillValidator):
         else:
             structure_ok = False
             detail = f"Found {pattern_count} patterns, no Workflow section"
-        
-        checks.append(CheckResult(
+
+        return CheckResult(
             "1.7",
             "Workflow section OR 7-10 pattern sections",
             structure_ok,
             detail
-        ))
-        
+        )
+
+    @check("1.11", inputs=('en', 'frontmatter'), cost='scan')
+    def _check_router_table(self) -> CheckResult:
         # 1.11 Router skill consistency (if applicable)
-        if is_router:
-            has_related_table = bool(re.search(r'Related Skills.*?\|', self.content, re.DOTALL | re.IGNORECASE))
-            checks.append(CheckResult(
-                "1.11",
-                "Router skill has Related Skills routing table",
-                has_related_table,
-                "Router with routing table" if has_related_table else "Router missing routing table"
-            ))
-        else:
-            checks.append(CheckResult(
+        if not self.mentions_router:
+            return CheckResult(
                 "1.11",
                 "Router skill has Related Skills routing table",
                 True,
                 "N/A (not a router skill)"
-            ))
-        
-        # 1.12 Bilingual support (references/SKILL.ja.md exists)
-        skill_dir = Path(self.file_path).parent
-        ja_path = skill_dir / "references" / "SKILL.ja.md"
-        ja_root_path = skill_dir / "SKILL.ja.md"
-        has_japanese = ja_path.exists() or ja_root_path.exists()
-        checks.append(CheckResult(
+            )
+        related_idx = self.content.lower().find('related skills')
+        has_related_table = related_idx != -1 and '|' in self.content[related_idx:]
+        return CheckResult(
+            "1.11",
+            "Router skill has Related Skills routing table",
+            has_related_table,
+            "Router with routing table" if has_related_table else "Router missing routing table"
+        )
+
+    @check("1.12", inputs=('ja',), cost='cross-file')
+    def _check_japanese_version(self) -> CheckResult:
+        # 1.12 Bilingual support (references/SKILL.ja.md or SKILL.ja.md exists)
+        has_japanese = self.inputs.ja_document is not None
+        return CheckResult(
             "1.12",
             "Japanese version exists (references/SKILL.ja.md)",
             has_japanese,
-            f"Found: {ja_path.name}" if ja_path.exists() else
-            f"Found: {ja_root_path.name}" if ja_root_path.exists() else "Missing"
-        ))
-        
+            "Found: SKILL.ja.md" if has_japanese else "Missing"
+        )
+
+    @check("1.13")
+    def _check_line_count(self) -> CheckResult:
         # 1.13 Line count policy (≤500 recommended, ≤550 max)
         line_count = len(self.lines)
         line_ok = line_count <= 550
-        checks.append(CheckResult(
+        return CheckResult(
             "1.13",
             "Line count ≤550 (target ≤500)",
             line_ok,
             f"{line_count} lines" + (" ⚠️ over 500" if 500 < line_count <= 550 else "")
-        ))
+        )
 
+    @check("1.8", router='"Common Pitfalls" section exists')
+    def _check_pitfalls_section(self) -> CheckResult:
         # 1.8 "Common Pitfalls" exists (N/A for router skills)
-        if self.is_router:
-            checks.append(CheckResult("1.8", '"Common Pitfalls" section exists', True, "N/A (router skill)"))
-        else:
-            has_pitfalls = self.has_section(r'^##\s+.*Common Pitfalls')
-            checks.append(CheckResult("1.8", '"Common Pitfalls" section exists', has_pitfalls))
+        has_pitfalls = self.has_section(RE_PITFALLS_HEADING)
+        return CheckResult("1.8", '"Common Pitfalls" section exists', has_pitfalls)
 
+    @check("1.9", router='"Anti-Patterns" section exists')
+    def _check_antipatterns_section(self) -> CheckResult:
         # 1.9 "Anti-Patterns" exists (N/A for router skills)
-        if self.is_router:
-            checks.append(CheckResult("1.9", '"Anti-Patterns" section exists', True, "N/A (router skill)"))
-        else:
-            has_antipatterns = self.has_section(r'^##\s+.*Anti-Patterns')
-            checks.append(CheckResult("1.9", '"Anti-Patterns" section exists', has_antipatterns))
+        has_antipatterns = self.has_section(RE_ANTIPATTERNS_HEADING)
+        return CheckResult("1.9", '"Anti-Patterns" section exists', has_antipatterns)
 
+    @check("1.10", router='"Quick Reference" or "Decision Tree" exists')
+    def _check_reference_section(self) -> CheckResult:
         # 1.10 "Quick Reference" or "Decision Tree" exists (N/A for router skills)
-        if self.is_router:
-            checks.append(CheckResult("1.10", '"Quick Reference" or "Decision Tree" exists', True, "N/A (router skill)"))
-        else:
-            has_reference = (
-                self.has_section(r'^##\s+.*Quick Reference') or
-                self.has_section(r'^##\s+.*Decision Tree')
-            )
-            checks.append(CheckResult(
-                "1.10",
-                '"Quick Reference" or "Decision Tree" exists',
-                has_reference
-            ))
-
-        return checks
+        has_reference = (
+            self.has_section(RE_QUICK_REFERENCE_HEADING) or
+            self.has_section(RE_DECISION_TREE_HEADING)
+        )
+        return CheckResult(
+            "1.10",
+            '"Quick Reference" or "Decision Tree" exists',
+            has_reference
+        )
 
 
 class ContentValidator(SkillValidator):
     """Validates content requirements (20 items)"""
+    CATEGORY = "Content"
 
-    def validate(self) -> List[CheckResult]:
-        checks = []
+    # --- 2.1 "When to Use" section (4 items) ---
 
-        # 2.1 "When to Use" section (4 items)
-        when_to_use = self.get_section_content("When to Use")
-        
+    @cached_property
+    def scenarios(self) -> List[str]:
+        return [item.text for item in self.list_items_in(self.get_section_range("When to Use"))]
+
+    @check("2.1.1")
+    def _check_scenario_count(self) -> CheckResult:
         # 2.1.1 5-8 specific scenarios listed (3+ for router skills)
-        scenario_count = 0
-        if when_to_use:
-            scenarios = re.findall(r'^[-*]\s+(.+)$', when_to_use, re.MULTILINE)
-            scenario_count = len(scenarios)
+        scenario_count = len(self.scenarios)
         min_scenarios = 3 if self.is_router else 5
         max_scenarios = 10 if self.is_router else 8
-        checks.append(CheckResult(
+        return CheckResult(
             "2.1.1",
             f"{'3+' if self.is_router else '5-8'} specific scenarios in When to Use",
             min_scenarios <= scenario_count <= max_scenarios,
             f"Found {scenario_count} scenarios"
-        ))
+        )
 
+    @check("2.1.2", router="Scenarios start with verbs")
+    def _check_scenario_verbs(self) -> CheckResult:
         # 2.1.2 Each scenario starts with verb (relaxed for router skills)
-        verb_pattern = r'^[-*]\s+([A-Z][a-z]+ing)\s'
-        verb_scenarios = 0
-        if when_to_use:
-            verb_scenarios = len(re.findall(verb_pattern, when_to_use, re.MULTILINE))
-        if self.is_router:
-            checks.append(CheckResult(
-                "2.1.2", "Scenarios start with verbs", True, "N/A (router skill)"
-            ))
-        else:
-            checks.append(CheckResult(
-                "2.1.2",
-                "Scenarios start with verbs (Designing, Implementing, etc.)",
-                verb_scenarios >= scenario_count * 0.8 if scenario_count > 0 else False,
-                f"{verb_scenarios}/{scenario_count} start with verbs"
-            ))
+        scenario_count = len(self.scenarios)
+        verb_scenarios = sum(1 for scenario in self.scenarios if RE_SCENARIO_VERB.match(scenario))
+        return CheckResult(
+            "2.1.2",
+            "Scenarios start with verbs (Designing, Implementing, etc.)",
+            verb_scenarios >= scenario_count * 0.8 if scenario_count > 0 else False,
+            f"{verb_scenarios}/{scenario_count} start with verbs"
+        )
 
+    @check("2.1.3")
+    def _check_scenario_length(self) -> CheckResult:
         # 2.1.3 Each scenario 50-100 chars (relaxed for router skills)
         scenario_length_ok = True
-        if when_to_use and not self.is_router:
-            scenarios = re.findall(r'^[-*]\s+(.+)$', when_to_use, re.MULTILINE)
-            for scenario in scenarios:
+        if not self.is_router:
+            for scenario in self.scenarios:
                 if not (50 <= len(scenario) <= 100):
                     scenario_length_ok = False
                     break
-        checks.append(CheckResult(
+        return CheckResult(
             "2.1.3",
             "Scenarios are 50-100 chars",
             scenario_length_ok
-        ))
+        )
 
+    @check("2.1.4")
+    def _check_abstract_terms(self) -> CheckResult:
         # 2.1.4 No abstract terms
-        abstract_terms = ['good code', 'quality software', 'best practices', 
+        when_to_use = self.get_section_content("When to Use")
+        abstract_terms = ['good code', 'quality software', 'best practices',
                          'clean code', 'proper implementation']
         has_abstract = False
         if when_to_use:
             has_abstract = any(term in when_to_use.lower() for term in abstract_terms)
-        checks.append(CheckResult(
+        return CheckResult(
             "2.1.4",
             'No abstract terms ("good code", "quality software")',
             not has_abstract
-        ))
+        )
 
-        # 2.2 Core Principles section (3 items)
-        principles = self.get_section_content("Core Principles") or \
-                    self.get_section_content("The Philosophy") or ""
+    # --- 2.2 Core Principles section (3 items) ---
 
-        # 2.2.1 3-5 principles listed
+    @cached_property
+    def principle_count(self) -> int:
         # Match numbered list format: "1. **Name** - description"
-        principle_count = len(re.findall(r'^\d+\.\s+\*\*[^*]+\*\*', principles, re.MULTILINE))
-        checks.append(CheckResult(
+        principles_range = self.get_section_range("Core Principles") or \
+                    self.get_section_range("The Philosophy")
+        if principles_range is None:
+            return 0
+        return sum(
+            1 for item in self.doc.list_items
+            if principles_range[0] <= item.line < principles_range[1]
+            and item.indent == 0 and item.marker[:-1].isdigit() and item.marker.endswith('.')
+            and RE_PRINCIPLE.match(item.text)
+        )
+
+    @check("2.2.1")
+    def _check_principle_count(self) -> CheckResult:
+        # 2.2.1 3-5 principles listed
+        return CheckResult(
             "2.2.1",
             "3-5 principles listed",
-            3 <= principle_count <= 5,
-            f"Found {principle_count} principles"
-        ))
+            3 <= self.principle_count <= 5,
+            f"Found {self.principle_count} principles"
+        )
 
+    @check("2.2.2")
+    def _check_principle_format(self) -> CheckResult:
         # 2.2.2 Bold name + description format
-        principle_format_ok = principle_count > 0
-        checks.append(CheckResult(
+        principle_format_ok = self.principle_count > 0
+        return CheckResult(
             "2.2.2",
             "Bold name + description (30-50 chars) format",
             principle_format_ok
-        ))
+        )
 
+    @check("2.2.3")
+    def _check_principles_independent(self) -> CheckResult:
         # 2.2.3 Principles independently understandable
         # Heuristic: each principle should be on separate lines
-        principles_independent = principle_count >= 3
-        checks.append(CheckResult(
+        principles_independent = self.principle_count >= 3
+        return CheckResult(
             "2.2.3",
             "Principles independently understandable",
             principles_independent
-        ))
+        )
 
-        # 2.3 Pattern/Workflow sections (6 items)
-        # Router skills get N/A for detailed content checks
-        if self.is_router:
-            for check_id, desc in [
-                ("2.3.1", "Workflow/Pattern structure"), ("2.3.2", "3-tier examples"),
-                ("2.3.3", "When to Use guidance"), ("2.3.4", "No duplicate patterns"),
-                ("2.3.5", "Patterns in logical order"), ("2.3.6", "Comparison table"),
-            ]:
-                checks.append(CheckResult(check_id, desc, True, "N/A (router skill)"))
-        else:
-            # Support both legacy "Pattern N:" and new "Workflow:" structure
-            has_workflow = bool(re.search(r'^##\s+Workflow:', self.content, re.MULTILINE))
-            
-            # 2.3.1 Patterns have "Overview" OR Workflow has "Step N" subsections
-            if has_workflow:
-                step_count = len(re.findall(r'^###\s+Step\s+\d+', self.content, re.MULTILINE))
-                checks.append(CheckResult(
-                    "2.3.1",
-                    'Workflow has Step subsections (or Patterns have Overview)',
-                    step_count >= 3,
-                    f"Found {step_count} steps"
-                ))
-            else:
-                overview_count = self.count_sections(r'^###\s+.*Overview')
-                checks.append(CheckResult(
-                    "2.3.1",
-                    'Patterns have "Overview" subsection',
-                    overview_count >= 5,
-                    f"Found {overview_count} overviews"
-                ))
+    # --- 2.3 Pattern/Workflow sections (6 items), N/A for router skills ---
+    # Support both legacy "Pattern N:" and new "Workflow:" structure
+
+    @check("2.3.1", router="Workflow/Pattern structure")
+    def _check_steps_or_overviews(self) -> CheckResult:
+        # 2.3.1 Patterns have "Overview" OR Workflow has "Step N" subsections
+        has_workflow = any(h.title.startswith('Workflow:') for h in self.doc.headings_at(2))
+        if has_workflow:
+            return CheckResult(
+                "2.3.1",
+                'Workflow has Step subsections (or Patterns have Overview)',
+                self.step_count >= 3,
+                f"Found {self.step_count} steps"
+            )
+        overview_count = self.count_sections(RE_OVERVIEW_HEADING)
+        return CheckResult(
+            "2.3.1",
+            'Patterns have "Overview" subsection',
+            overview_count >= 5,
+            f"Found {overview_count} overviews"
+        )
 
-            # 2.3.2 Minimum 3-tier examples (Basic/Intermediate/Advanced) OR step-based examples
-            if self.is_workflow:
-                # New-style: Steps use inline examples instead of 3-tier structure
-                step_count = len(re.findall(r'^###\s+Step\s+\d+', self.content, re.MULTILINE))
-                code_block_count = len(re.findall(r'```', self.content))
-                checks.append(CheckResult(
-                    "2.3.2",
-                    "Steps have code examples",
-                    code_block_count >= step_count,
-                    f"{code_block_count} code blocks for {step_count} steps"
-                ))
-            else:
-                basic_count = len(re.findall(r'basic|simple|beginner', self.content, re.IGNORECASE))
-                intermediate_count = len(re.findall(r'intermediate', self.content, re.IGNORECASE))
-                advanced_count = len(re.findall(r'advanced|production', self.content, re.IGNORECASE))
-                has_tiers = basic_count >= 1 and intermediate_count >= 1 and advanced_count >= 1
-                checks.append(CheckResult(
-                    "2.3.2",
-                    "3-tier examples (Basic/Intermediate/Advanced)",
-                    has_tiers,
-                    f"B:{basic_count} I:{intermediate_count} A:{advanced_count}"
-                ))
+    @check("2.3.2", cost='scan', router="3-tier examples")
+    def _check_tiered_examples(self) -> CheckResult:
+        # 2.3.2 Minimum 3-tier examples (Basic/Intermediate/Advanced) OR step-based examples
+        if self.is_workflow:
+            # New-style: Steps use inline examples instead of 3-tier structure
+            code_block_count = self.content.count('```')
+            return CheckResult(
+                "2.3.2",
+                "Steps have code examples",
+                code_block_count >= self.step_count,
+                f"{code_block_count} code blocks for {self.step_count} steps"
+            )
+        basic_count = len(RE_TIER_BASIC.findall(self.content))
+        intermediate_count = len(RE_TIER_INTERMEDIATE.findall(self.content))
+        advanced_count = len(RE_TIER_ADVANCED.findall(self.content))
+        has_tiers = basic_count >= 1 and intermediate_count >= 1 and advanced_count >= 1
+        return CheckResult(
+            "2.3.2",
+            "3-tier examples (Basic/Intermediate/Advanced)",
+            has_tiers,
+            f"B:{basic_count} I:{intermediate_count} A:{advanced_count}"
+        )
 
-            # 2.3.3 Patterns have "When to Use" guidance OR Steps have inline guidance
-            if self.is_workflow:
-                # New-style: Steps use "Use when" or "**When**" inline
-                use_guidance = len(re.findall(r'(?:use when|when to use|\*\*when\*\*)', self.content, re.IGNORECASE))
-                checks.append(CheckResult(
-                    "2.3.3",
-                    'Steps have usage guidance',
-                    use_guidance >= 2,
-                    f"Found {use_guidance} guidance instances"
-                ))
-            else:
-                when_to_use_count = len(re.findall(r'when to use', self.content, re.IGNORECASE))
-                checks.append(CheckResult(
-                    "2.3.3",
-                    'Patterns have "When to Use" guidance',
-                    when_to_use_count >= 3,
-                    f"Found {when_to_use_count} instances"
-                ))
+    @check("2.3.3", cost='scan', router="When to Use guidance")
+    def _check_usage_guidance(self) -> CheckResult:
+        # 2.3.3 Patterns have "When to Use" guidance OR Steps have inline guidance
+        if self.is_workflow:
+            # New-style: Steps use "Use when" or "**When**" inline
+            use_guidance = len(RE_USE_GUIDANCE.findall(self.content))
+            return CheckResult(
+                "2.3.3",
+                'Steps have usage guidance',
+                use_guidance >= 2,
+                f"Found {use_guidance} guidance instances"
+            )
+        when_to_use_count = len(RE_WHEN_TO_USE.findall(self.content))
+        return CheckResult(
+            "2.3.3",
+            'Patterns have "When to Use" guidance',
+            when_to_use_count >= 3,
+            f"Found {when_to_use_count} instances"
+        )
 
-            # 2.3.4 No pattern duplication (heuristic check)
-            checks.append(CheckResult(
-                "2.3.4",
-                "No duplicate patterns (manual review recommended)",
-                True,
-                "Heuristic check"
-            ))
+    @check("2.3.4", inputs=(), router="No duplicate patterns")
+    def _check_no_duplicates(self) -> CheckResult:
+        # 2.3.4 No pattern duplication (heuristic check)
+        return CheckResult(
+            "2.3.4",
+            "No duplicate patterns (manual review recommended)",
+            True,
+            "Heuristic check"
+        )
 
-            # 2.3.5 Logical pattern order (heuristic)
-            checks.append(CheckResult(
-                "2.3.5",
-                "Patterns in logical order (manual review recommended)",
-                True,
-                "Heuristic check"
-            ))
+    @check("2.3.5", inputs=(), router="Patterns in logical order")
+    def _check_logical_order(self) -> CheckResult:
+        # 2.3.5 Logical pattern order (heuristic)
+        return CheckResult(
+            "2.3.5",
+            "Patterns in logical order (manual review recommended)",
+            True,
+            "Heuristic check"
+        )
 
-            # 2.3.6 At least one comparison table
-            has_comparison_table = bool(re.search(r'\|[^|]+\|[^|]+\|', self.content))
-            checks.append(CheckResult(
-                "2.3.6",
-                "At least one comparison table",
-                has_comparison_table
-            ))
+    @check("2.3.6", router="Comparison table")
+    def _check_comparison_table(self) -> CheckResult:
+        # 2.3.6 At least one comparison table
+        has_comparison_table = any(table.columns >= 2 for table in self.doc.tables)
+        return CheckResult(
+            "2.3.6",
+            "At least one comparison table",
+            has_comparison_table
+        )
 
-        # 2.4 Problem-Solution structure (2 items)
-        # Router skills: relax marker requirements
+    # --- 2.4 Problem-Solution structure (2 items) ---
+
+    @check("2.4.1", cost='scan')
+    def _check_example_markers(self) -> CheckResult:
         # 2.4.1 ❌/✅ markers for bad/good examples
+        # Router skills: relax marker requirements
         bad_marker_count = self.content.count('❌')
         good_marker_count = self.content.count('✅')
         if self.is_router:
@@ -637,539 +1339,553 @@ class ContentValidator(SkillValidator):
         else:
             has_markers = bad_marker_count >= 3 and good_marker_count >= 3
             detail = f"❌:{bad_marker_count} ✅:{good_marker_count}"
-        checks.append(CheckResult(
+        return CheckResult(
             "2.4.1",
             "❌/✅ markers for bad/good example pairs",
             has_markers,
             detail
-        ))
+        )
 
+    @check("2.4.2", cost='scan')
+    def _check_why_explanations(self) -> CheckResult:
         # 2.4.2 "Why" explanations present
-        why_count = len(re.findall(r'\bwhy\b', self.content, re.IGNORECASE))
-        checks.append(CheckResult(
+        why_count = len(RE_WHY.findall(self.content))
+        return CheckResult(
             "2.4.2",
             '"Why" explanations for approaches',
             why_count >= 5,
             f"Found {why_count} 'why' explanations"
-        ))
-
-        # 2.5 Anti-Patterns & Pitfalls (3 items) — N/A for router skills
-        if self.is_router:
-            for check_id, desc in [
-                ("2.5.1", "Anti-Patterns address architecture-level issues"),
-                ("2.5.2", "Pitfalls address implementation-level issues"),
-                ("2.5.3", "Issues have fixes/solutions"),
-            ]:
-                checks.append(CheckResult(check_id, desc, True, "N/A (router skill)"))
-        else:
-            # Extract all Anti-Patterns and Pitfalls sections (there may be multiple)
-            antipatterns_sections = re.findall(
-                r'^##\s+Anti-Patterns.*?\n(.*?)(?=^##\s|\Z)',
-                self.content, re.MULTILINE | re.DOTALL | re.IGNORECASE
-            )
-            pitfalls_sections = re.findall(
-                r'^##\s+.*Pitfalls.*?\n(.*?)(?=^##\s|\Z)',
-                self.content, re.MULTILINE | re.DOTALL | re.IGNORECASE
-            )
-            
-            # Combine all sections
-            all_antipatterns = "\n".join(antipatterns_sections)
-            all_pitfalls = "\n".join(pitfalls_sections)
-
-            # 2.5.1 Anti-Patterns address architecture-level issues
-            has_architecture_terms = any(term in all_antipatterns.lower() 
-                                        for term in ['architecture', 'design', 'structure', 'layer'])
-            checks.append(CheckResult(
-                "2.5.1",
-                "Anti-Patterns address architecture-level issues",
-                has_architecture_terms or len(all_antipatterns) > 100
-            ))
+        )
 
-            # 2.5.2 Pitfalls address implementation-level issues
-            has_implementation_terms = any(term in all_pitfalls.lower() 
-                                          for term in ['implement', 'code', 'method', 'function'])
-            checks.append(CheckResult(
-                "2.5.2",
-                "Pitfalls address implementation-level issues",
-                has_implementation_terms or len(all_pitfalls) > 100
-            ))
+    # --- 2.5 Anti-Patterns & Pitfalls (3 items), N/A for router skills ---
+
+    def _h2_bodies(self, keep) -> str:
+        """All H2 sections whose lowercased title passes keep (there may be several)"""
+        return "\n".join(self.doc.h2_body(h) for h in self.doc.headings_at(2) if keep(h.title.lower()))
+
+    @check("2.5.1", router="Anti-Patterns address architecture-level issues")
+    def _check_antipatterns_scope(self) -> CheckResult:
+        # 2.5.1 Anti-Patterns address architecture-level issues
+        all_antipatterns = self._h2_bodies(lambda title: title.startswith('anti-patterns'))
+        has_architecture_terms = any(term in all_antipatterns.lower()
+                                    for term in ['architecture', 'design', 'structure', 'layer'])
+        return CheckResult(
+            "2.5.1",
+            "Anti-Patterns address architecture-level issues",
+            has_architecture_terms or len(all_antipatterns) > 100
+        )
 
-            # 2.5.3 Each issue has fix/solution
-            content_no_code = re.sub(r'^```.*?^```', '', self.content, flags=re.DOTALL | re.MULTILINE)
-            fix_count = len(re.findall(r'\b(fix|solution|instead|correct)\b', 
-                                       content_no_code, re.IGNORECASE))
-            checks.append(CheckResult(
-                "2.5.3",
-                "Issues have fixes/solutions",
-                fix_count >= 3,
-                f"Found {fix_count} fix indicators"
-            ))
+    @check("2.5.2", router="Pitfalls address implementation-level issues")
+    def _check_pitfalls_scope(self) -> CheckResult:
+        # 2.5.2 Pitfalls address implementation-level issues
+        all_pitfalls = self._h2_bodies(lambda title: 'pitfalls' in title)
+        has_implementation_terms = any(term in all_pitfalls.lower()
+                                      for term in ['implement', 'code', 'method', 'function'])
+        return CheckResult(
+            "2.5.2",
+            "Pitfalls address implementation-level issues",
+            has_implementation_terms or len(all_pitfalls) > 100
+        )
 
-        # 2.6 Quick Reference (2 items)
-        quick_ref = self.get_section_content("Quick Reference") or \
-                   self.get_section_content("Decision Tree") or ""
+    @check("2.5.3", cost='scan', router="Issues have fixes/solutions")
+    def _check_fixes(self) -> CheckResult:
+        # 2.5.3 Each issue has fix/solution
+        fix_count = len(RE_FIX.findall(self.doc.prose))
+        return CheckResult(
+            "2.5.3",
+            "Issues have fixes/solutions",
+            fix_count >= 3,
+            f"Found {fix_count} fix indicators"
+        )
 
-        # 2.6.1 Decision support table/flowchart
-        has_decision_support = (
-            bool(re.search(r'\|[^|]+\|[^|]+\|', quick_ref)) or
+    # --- 2.6 Quick Reference (2 items) ---
+
+    @cached_property
+    def quick_reference(self) -> Tuple[Optional[Tuple[int, int]], str]:
+        """(range, text) of the Quick Reference section, else of the Decision Tree"""
+        quick_ref_range = self.get_section_range("Quick Reference")
+        quick_ref = self.get_section_content("Quick Reference")
+        if not quick_ref:
+            quick_ref_range = self.get_section_range("Decision Tree")
+            quick_ref = self.get_section_content("Decision Tree") or ""
+        return quick_ref_range, quick_ref
+
+    @cached_property
+    def has_decision_support(self) -> bool:
+        quick_ref_range, quick_ref = self.quick_reference
+        return (
+            any(table.columns >= 2 for table in self.tables_in(quick_ref_range)) or
             'flowchart' in quick_ref.lower() or
             'decision' in quick_ref.lower()
         )
-        checks.append(CheckResult(
+
+    @check("2.6.1")
+    def _check_decision_support(self) -> CheckResult:
+        # 2.6.1 Decision support table/flowchart
+        return CheckResult(
             "2.6.1",
             "Decision support table/flowchart",
-            has_decision_support
-        ))
+            self.has_decision_support
+        )
 
+    @check("2.6.2")
+    def _check_scannable(self) -> CheckResult:
         # 2.6.2 Scannable (can understand patterns at a glance)
-        is_scannable = len(quick_ref) > 50 and has_decision_support
-        checks.append(CheckResult(
+        is_scannable = len(self.quick_reference[1]) > 50 and self.has_decision_support
+        return CheckResult(
             "2.6.2",
             "Scannable (main patterns understandable at glance)",
             is_scannable
-        ))
-
-        return checks
+        )
 
 
 class CodeQualityValidator(SkillValidator):
-    """Validates code quality requirements (15 items)"""
-
-    def validate(self) -> List[CheckResult]:
-        checks = []
+    """Validates code quality requirements (15 items)
 
-        # Router skills: skip most code quality checks (they have minimal code)
-        if self.is_router:
-            check_ids = [
-                ("3.1.1", "Code compilable or marked as pseudocode"),
-                ("3.1.2", "Using/import statements included"),
-                ("3.1.3", "Dependencies documented"),
-                ("3.2.1", "Simple → Intermediate → Advanced progression"),
-                ("3.2.2", "Evolution rationale explained"),
-                ("3.2.3", "Advanced examples production-ready"),
-                ("3.3.1", "✅/❌ markers used consistently"),
-                ("3.3.2", 'Comments explain "WHY" not "HOW"'),
-                ("3.3.3", "Comments concise (≤50 chars)"),
-                ("3.3.4", "No redundant comments"),
-                ("3.4.1", "DI configuration examples"),
-                ("3.4.2", "Configuration file examples"),
-                ("3.4.3", "Error handling examples"),
-                ("3.4.4", "Async/await properly implemented"),
-                ("3.4.5", "Resource management"),
-            ]
-            for check_id, desc in check_ids:
-                checks.append(CheckResult(check_id, desc, True, "N/A (router skill)"))
-            return checks
+    Router skills skip every code quality check (they have minimal code).
+    """
+    CATEGORY = "Code Quality"
 
-        # Extract code blocks
-        code_blocks = re.findall(r'```[\w]*\n(.*?)```', self.content, re.DOTALL)
+    # --- 3.1 Compilability (3 items) ---
 
-        # 3.1 Compilability (3 items)
+    @check("3.1.1", inputs=('en', 'code'), cost='scan', router="Code compilable or marked as pseudocode")
+    def _check_compilable(self) -> CheckResult:
         # 3.1.1 Code is compilable or marked as pseudocode
+        code_blocks = self.doc.code_blocks
         has_pseudocode_marker = 'pseudocode' in self.content.lower()
         has_code = len(code_blocks) > 0
-        checks.append(CheckResult(
+        return CheckResult(
             "3.1.1",
             "Code compilable or marked as pseudocode",
             has_code or has_pseudocode_marker,
             f"{len(code_blocks)} code blocks found"
-        ))
+        )
 
+    @check("3.1.2", inputs=('code',), router="Using/import statements included")
+    def _check_imports(self) -> CheckResult:
         # 3.1.2 Using statements included (relax for workflow skills with CLI examples)
+        code_blocks = self.doc.code_blocks
         has_using = any('using ' in block or 'import ' in block for block in code_blocks)
-        has_imports = has_using
         if self.is_workflow:
             # Workflow skills may only use CLI commands — import not required
-            checks.append(CheckResult(
+            return CheckResult(
                 "3.1.2",
                 "Using/import statements included",
-                has_imports or True,
-                "Found" if has_imports else "N/A (workflow skill)"
-            ))
-        else:
-            checks.append(CheckResult(
-                "3.1.2",
-                "Using/import statements included",
-                has_using or not has_code,
-                "Found" if has_using else "Check if needed"
-            ))
+                True,
+                "Found" if has_using else "N/A (workflow skill)"
+            )
+        return CheckResult(
+            "3.1.2",
+            "Using/import statements included",
+            has_using or not code_blocks,
+            "Found" if has_using else "Check if needed"
+        )
 
+    @check("3.1.3", inputs=('en', 'code'), cost='scan', router="Dependencies documented")
+    def _check_dependencies(self) -> CheckResult:
         # 3.1.3 Dependencies documented
-        has_dependencies = any(term in self.content.lower() 
-                             for term in ['nuget', 'package', 'dependency', 'dependencies', 'npm', 'pip'])
-        checks.append(CheckResult(
+        has_dependencies = self.doc.scan_terms(VOCABULARY_SCANNER).count('3.1.3.dependencies') > 0
+        return CheckResult(
             "3.1.3",
             "Dependencies documented",
-            has_dependencies or len(code_blocks) == 0
-        ))
+            has_dependencies or len(self.doc.fences) == 0
+        )
 
-        # 3.2 Progressive evolution (3 items)
-        # For workflow skills: Steps provide progression, not Basic/Intermediate/Advanced
+    # --- 3.2 Progressive evolution (3 items) ---
+    # For workflow skills: Steps provide progression, not Basic/Intermediate/Advanced
+
+    @check("3.2.1", inputs=('en', 'code'), cost='scan', router="Simple → Intermediate → Advanced progression")
+    def _check_progression(self) -> CheckResult:
         if self.is_workflow:
-            step_count = len(re.findall(r'^###\s+Step\s+\d+', self.content, re.MULTILINE))
-            checks.append(CheckResult(
+            return CheckResult(
                 "3.2.1",
                 "Steps provide sequential progression",
-                step_count >= 3,
-                f"{step_count} steps found"
-            ))
+                self.step_count >= 3,
+                f"{self.step_count} steps found"
+            )
+        simple_idx = self.content.lower().find('simple')
+        inter_idx = self.content.lower().find('intermediate')
+        adv_idx = self.content.lower().find('advanced')
+
+        has_progression = False
+        if simple_idx != -1 and inter_idx != -1 and adv_idx != -1:
+            has_progression = simple_idx < inter_idx < adv_idx
+
+        return CheckResult(
+            "3.2.1",
+            "Simple → Intermediate → Advanced progression",
+            has_progression or len(self.doc.fences) < 3,
+            "Found progression" if has_progression else "Check code examples"
+        )
+
+    @check("3.2.2", cost='scan', router="Evolution rationale explained")
+    def _check_rationale(self) -> CheckResult:
+        if self.is_workflow:
             # Evolution rationale — check for "why" / "reason" explanations
             evolution_terms = ['why', 'because', 'reason', 'values']
             has_rationale = sum(1 for term in evolution_terms if term in self.content.lower()) >= 2
-            checks.append(CheckResult("3.2.2", "Rationale explained", has_rationale))
+            return CheckResult("3.2.2", "Rationale explained", has_rationale)
+        # 3.2.2 Evolution rationale explained
+        evolution_terms = ['evolve', 'improve', 'enhance', 'why', 'because', 'reason']
+        has_rationale = sum(1 for term in evolution_terms if term in self.content.lower()) >= 3
+        return CheckResult(
+            "3.2.2",
+            "Evolution rationale explained",
+            has_rationale
+        )
+
+    @check("3.2.3", inputs=('en', 'code'), cost='scan', router="Advanced examples production-ready")
+    def _check_production_ready(self) -> CheckResult:
+        if self.is_workflow:
             # Production-ready — N/A for process-oriented workflows
-            checks.append(CheckResult(
+            return CheckResult(
                 "3.2.3",
                 "Examples are practical and usable",
-                len(code_blocks) >= 3,
-                f"{len(code_blocks)} code blocks"
-            ))
-        else:
-            simple_idx = self.content.lower().find('simple')
-            inter_idx = self.content.lower().find('intermediate')
-            adv_idx = self.content.lower().find('advanced')
-            
-            has_progression = False
-            if simple_idx != -1 and inter_idx != -1 and adv_idx != -1:
-                has_progression = simple_idx < inter_idx < adv_idx
-            
-            checks.append(CheckResult(
-                "3.2.1",
-                "Simple → Intermediate → Advanced progression",
-                has_progression or len(code_blocks) < 3,
-                "Found progression" if has_progression else "Check code examples"
-            ))
-
-            # 3.2.2 Evolution rationale explained
-            evolution_terms = ['evolve', 'improve', 'enhance', 'why', 'because', 'reason']
-            has_rationale = sum(1 for term in evolution_terms if term in self.content.lower()) >= 3
-            checks.append(CheckResult(
-                "3.2.2",
-                "Evolution rationale explained",
-                has_rationale
-            ))
+                len(self.doc.fences) >= 3,
+                f"{len(self.doc.fences)} code blocks"
+            )
+        # 3.2.3 Advanced examples are production-ready
+        has_error_handling = any(term in self.content.lower()
+                                for term in ['try', 'catch', 'exception', 'error handling'])
+        return CheckResult(
+            "3.2.3",
+            "Advanced examples production-ready (error handling)",
+            has_error_handling
+        )
 
-            # 3.2.3 Advanced examples are production-ready
-            has_error_handling = any(term in self.content.lower() 
-                                    for term in ['try', 'catch', 'exception', 'error handling'])
-            checks.append(CheckResult(
-                "3.2.3",
-                "Advanced examples production-ready (error handling)",
-                has_error_handling
-            ))
+    # --- 3.3 Markers and comments (4 items) ---
 
-        # 3.3 Markers and comments (4 items)
+    @check("3.3.1", cost='scan', router="✅/❌ markers used consistently")
+    def _check_markers(self) -> CheckResult:
         # 3.3.1 ✅/❌ markers used consistently
         marker_count = self.content.count('✅') + self.content.count('❌')
         min_markers = 2 if self.is_workflow else 6
-        checks.append(CheckResult(
+        return CheckResult(
             "3.3.1",
             "✅/❌ markers used consistently",
             marker_count >= min_markers,
             f"{marker_count} markers found"
-        ))
+        )
 
+    @check("3.3.2", inputs=('code',), router='Comments explain "WHY" not "HOW"')
+    def _check_comment_count(self) -> CheckResult:
         # 3.3.2 Comments explain WHY not HOW
+        code_blocks = self.doc.code_blocks
         comment_count = sum(block.count('//') + block.count('#') for block in code_blocks)
-        checks.append(CheckResult(
+        return CheckResult(
             "3.3.2",
             'Comments explain "WHY" not "HOW"',
             comment_count >= 3 or len(code_blocks) == 0,
             f"{comment_count} inline comments"
-        ))
+        )
 
+    @check("3.3.3", inputs=(), router="Comments concise (≤50 chars)")
+    def _check_concise_comments(self) -> CheckResult:
         # 3.3.3 Concise comments (≤50 chars per line)
         # Heuristic check
-        checks.append(CheckResult(
+        return CheckResult(
             "3.3.3",
             "Comments concise (≤50 chars)",
             True,
             "Manual review recommended"
-        ))
+        )
 
+    @check("3.3.4", inputs=(), router="No redundant comments")
+    def _check_redundant_comments(self) -> CheckResult:
         # 3.3.4 No redundant comments
-        checks.append(CheckResult(
+        return CheckResult(
             "3.3.4",
             "No redundant comments",
             True,
             "Manual review recommended"
-        ))
+        )
 
-        # 3.4 Completeness (5 items)
-        # Workflow skills focused on process/CLI don't require DI/config/error patterns
-        if self.is_workflow:
-            # 3.4.1-3.4.5: relaxed for workflow skills
-            checks.append(CheckResult("3.4.1", "DI configuration examples (if applicable)", True, "N/A (workflow skill)"))
-            has_config = any(term in self.content.lower()
-                            for term in ['config', 'configuration', '.yml', '.yaml', '.json'])
-            checks.append(CheckResult("3.4.2", "Configuration file examples (if applicable)", has_config or True, "N/A (workflow skill)"))
-            checks.append(CheckResult("3.4.3", "Error handling examples", True, "N/A (workflow skill)"))
-            checks.append(CheckResult("3.4.4", "Async/await properly implemented", True, "N/A (workflow skill)"))
-            checks.append(CheckResult("3.4.5", "Resource management", True, "N/A (workflow skill)"))
-        else:
-            has_di = any(term in self.content.lower() 
-                        for term in ['dependency injection', 'addscoped', 'addsingleton', 
-                                    'addtransient', 'configure services'])
-            checks.append(CheckResult(
-                "3.4.1",
-                "DI configuration examples (if applicable)",
-                has_di or 'N/A' in self.content,
-                "Found" if has_di else "Check if applicable"
-            ))
+    # --- 3.4 Completeness (5 items) ---
+    # Workflow skills focused on process/CLI don't require DI/config/error patterns
 
-            # 3.4.2 Configuration file examples
-            has_config = any(term in self.content.lower() 
-                            for term in ['appsettings.json', 'config', 'configuration', 
-                                        'app.config', 'web.config'])
-            checks.append(CheckResult(
-                "3.4.2",
-                "Configuration file examples (if applicable)",
-                has_config or len(code_blocks) < 3,
-                "Found" if has_config else "Check if applicable"
-            ))
+    @check("3.4.1", cost='scan', router="DI configuration examples")
+    def _check_di_examples(self) -> CheckResult:
+        if self.is_workflow:
+            return CheckResult("3.4.1", "DI configuration examples (if applicable)", True, "N/A (workflow skill)")
+        has_di = self.doc.scan_terms(VOCABULARY_SCANNER).count('3.4.1.di') > 0
+        return CheckResult(
+            "3.4.1",
+            "DI configuration examples (if applicable)",
+            has_di or 'N/A' in self.content,
+            "Found" if has_di else "Check if applicable"
+        )
 
-            # 3.4.3 Error handling examples
-            has_error_handling_34 = any(term in self.content.lower() 
-                                       for term in ['try', 'catch', 'exception', 'error handling'])
-            checks.append(CheckResult(
-                "3.4.3",
-                "Error handling examples",
-                has_error_handling_34,
-                "Found" if has_error_handling_34 else "Missing"
-            ))
+    @check("3.4.2", inputs=('en', 'code'), cost='scan', router="Configuration file examples")
+    def _check_config_examples(self) -> CheckResult:
+        if self.is_workflow:
+            return CheckResult("3.4.2", "Configuration file examples (if applicable)", True, "N/A (workflow skill)")
+        # 3.4.2 Configuration file examples
+        has_config = any(term in self.content.lower()
+                        for term in ['appsettings.json', 'config', 'configuration',
+                                    'app.config', 'web.config'])
+        return CheckResult(
+            "3.4.2",
+            "Configuration file examples (if applicable)",
+            has_config or len(self.doc.fences) < 3,
+            "Found" if has_config else "Check if applicable"
+        )
 
-            # 3.4.4 Async properly implemented
-            has_async = any(term in self.content.lower() 
-                           for term in ['async', 'await', 'task<', 'cancellationtoken'])
-            checks.append(CheckResult(
-                "3.4.4",
-                "Async/await properly implemented",
-                has_async or not any('async' in block.lower() for block in code_blocks),
-                "Found" if has_async else "N/A or missing"
-            ))
+    @check("3.4.3", cost='scan', router="Error handling examples")
+    def _check_error_handling(self) -> CheckResult:
+        if self.is_workflow:
+            return CheckResult("3.4.3", "Error handling examples", True, "N/A (workflow skill)")
+        # 3.4.3 Error handling examples
+        has_error_handling_34 = any(term in self.content.lower()
+                                   for term in ['try', 'catch', 'exception', 'error handling'])
+        return CheckResult(
+            "3.4.3",
+            "Error handling examples",
+            has_error_handling_34,
+            "Found" if has_error_handling_34 else "Missing"
+        )
 
-            # 3.4.5 Resource management (using, Dispose)
-            has_resource_mgmt = any(term in self.content.lower() 
-                                   for term in ['using', 'dispose', 'idisposable'])
-            checks.append(CheckResult(
-                "3.4.5",
-                "Resource management (using, Dispose)",
-                has_resource_mgmt or len(code_blocks) < 3,
-                "Found" if has_resource_mgmt else "Check if applicable"
-            ))
+    @check("3.4.4", inputs=('en', 'code'), cost='scan', router="Async/await properly implemented")
+    def _check_async(self) -> CheckResult:
+        if self.is_workflow:
+            return CheckResult("3.4.4", "Async/await properly implemented", True, "N/A (workflow skill)")
+        # 3.4.4 Async properly implemented
+        has_async = any(term in self.content.lower()
+                       for term in ['async', 'await', 'task<', 'cancellationtoken'])
+        return CheckResult(
+            "3.4.4",
+            "Async/await properly implemented",
+            has_async or not any('async' in block.lower() for block in self.doc.code_blocks),
+            "Found" if has_async else "N/A or missing"
+        )
 
-        return checks
+    @check("3.4.5", inputs=('en', 'code'), cost='scan', router="Resource management")
+    def _check_resource_management(self) -> CheckResult:
+        if self.is_workflow:
+            return CheckResult("3.4.5", "Resource management", True, "N/A (workflow skill)")
+        # 3.4.5 Resource management (using, Dispose)
+        has_resource_mgmt = any(term in self.content.lower()
+                               for term in ['using', 'dispose', 'idisposable'])
+        return CheckResult(
+            "3.4.5",
+            "Resource management (using, Dispose)",
+            has_resource_mgmt or len(self.doc.fences) < 3,
+            "Found" if has_resource_mgmt else "Check if applicable"
+        )
 
 
 class LanguageValidator(SkillValidator):
     """Validates language and expression requirements (10 items)"""
+    CATEGORY = "Language"
 
-    def validate(self) -> List[CheckResult]:
-        checks = []
+    # --- 4.1 Writing style (4 items) ---
 
-        # 4.1 Writing style (4 items)
+    @check("4.1.1", cost='scan')
+    def _check_active_voice(self) -> CheckResult:
         # 4.1.1 Active voice (minimal passive)
-        passive_indicators = ['is recommended', 'is used', 'is implemented', 
-                             'are required', 'was created', 'were designed']
-        passive_count = sum(self.content.lower().count(p) for p in passive_indicators)
+        terms = self.doc.scan_terms(VOCABULARY_SCANNER)
+        passive_count = terms.count('4.1.1.passive')
         sentence_count = self.content.count('.')
         passive_ratio = passive_count / max(sentence_count, 1)
-        
-        checks.append(CheckResult(
+
+        return CheckResult(
             "4.1.1",
             "Active voice (passive < 20%)",
             passive_ratio < 0.2,
             f"{passive_count} passive indicators in {sentence_count} sentences"
-        ))
+            + _line_refs(terms.lines('4.1.1.passive'))
+        )
 
+    @check("4.1.2", cost='scan')
+    def _check_short_sentences(self) -> CheckResult:
         # 4.1.2 Short sentences
         # Heuristic: check for overly long lines in prose sections
-        prose_lines = [line for line in self.lines 
-                      if line.strip() and not line.startswith('#') 
+        prose_lines = [line for line in self.lines
+                      if line.strip() and not line.startswith('#')
                       and not line.startswith('```')
                       and not line.startswith('|')]
         long_sentences = sum(1 for line in prose_lines if len(line) > 200)
-        checks.append(CheckResult(
+        return CheckResult(
             "4.1.2",
             "Short sentences (≤20 words in English, ≤50 chars in Japanese)",
             long_sentences < len(prose_lines) * 0.2,
             f"{long_sentences} potentially long sentences"
-        ))
+        )
 
+    @check("4.1.3")
+    def _check_imperative_mood(self) -> CheckResult:
         # 4.1.3 Imperative mood
-        imperative_count = sum(1 for line in self.lines 
-                              if re.match(r'^[-*]\s+(Use|Implement|Create|Define|Apply|Avoid|Consider)', line))
-        checks.append(CheckResult(
+        imperative_count = sum(1 for item in self.doc.list_items
+                              if item.indent == 0 and item.marker in ('-', '*')
+                              and RE_IMPERATIVE.match(item.text))
+        return CheckResult(
             "4.1.3",
             'Imperative mood ("Use", "Implement" vs "You should")',
             imperative_count >= 5,
             f"{imperative_count} imperative statements"
-        ))
+        )
 
+    @check("4.1.4", cost='scan')
+    def _check_vague_terms(self) -> CheckResult:
         # 4.1.4 No vague terms
-        vague_terms = ['may', 'might', 'possibly', 'perhaps', 'sometimes', 'often']
-        vague_count = sum(self.content.lower().count(term) for term in vague_terms)
-        checks.append(CheckResult(
+        terms = self.doc.scan_terms(VOCABULARY_SCANNER)
+        vague_count = terms.count('4.1.4.vague')
+        return CheckResult(
             "4.1.4",
             'Minimal vague terms ("may", "might", "possibly")',
             vague_count < 10,
-            f"{vague_count} vague terms found"
-        ))
+            f"{vague_count} vague terms found" + _line_refs(terms.lines('4.1.4.vague'))
+        )
 
-        # 4.2 Term consistency (3 items)
+    # --- 4.2 Term consistency (3 items) ---
+
+    @check("4.2.1", inputs=())
+    def _check_consistent_terms(self) -> CheckResult:
         # 4.2.1 Same concept, same term
         # Heuristic: look for synonym pairs
-        checks.append(CheckResult(
+        return CheckResult(
             "4.2.1",
             "Consistent terminology (manual review recommended)",
             True,
             "Heuristic check"
-        ))
+        )
 
+    @check("4.2.2", cost='scan')
+    def _check_definitions(self) -> CheckResult:
         # 4.2.2 Terms defined on first use
         # Check for bold definitions
-        definition_count = len(re.findall(r'\*\*[A-Z][^*]+\*\*:', self.content))
+        definition_count = len(RE_DEFINITION.findall(self.content))
         min_definitions = 1 if self.is_workflow else 3
-        checks.append(CheckResult(
+        return CheckResult(
             "4.2.2",
             "Technical terms defined on first use",
             definition_count >= min_definitions,
             f"{definition_count} definitions found"
-        ))
+        )
 
+    @check("4.2.3", cost='scan')
+    def _check_acronyms(self) -> CheckResult:
         # 4.2.3 Acronyms expanded
         # Look for pattern: ACRONYM (Full Form) or Full Form (ACRONYM)
-        acronym_pattern = r'\b[A-Z]{2,}\b\s*\([^)]+\)|\([A-Z]{2,}\)'
-        acronym_count = len(re.findall(acronym_pattern, self.content))
-        checks.append(CheckResult(
+        acronym_count = len(RE_ACRONYM.findall(self.content))
+        return CheckResult(
             "4.2.3",
             "Acronyms expanded on first use",
             acronym_count >= 1,
             f"{acronym_count} expanded acronyms"
-        ))
+        )
+
+    # --- 4.3 Scannability (3 items) ---
 
-        # 4.3 Scannability (3 items)
+    @check("4.3.1")
+    def _check_headings(self) -> CheckResult:
         # 4.3.1 Headings reveal structure
-        heading_count = self.count_sections(r'^#{2,3}\s+')
-        checks.append(CheckResult(
+        heading_count = len(self.doc.headings_at(2, 3))
+        return CheckResult(
             "4.3.1",
             "Headings reveal document structure",
             heading_count >= 10,
             f"{heading_count} headings (H2/H3)"
-        ))
+        )
 
+    @check("4.3.2")
+    def _check_readable_tables(self) -> CheckResult:
         # 4.3.2 Tables readable (3-6 columns, 5-10 rows)
-        tables = re.findall(r'(\|[^\n]+\|\n)+', self.content)
-        readable_tables = True
-        for table in tables:
-            cols = table.split('\n')[0].count('|') - 1
-            rows = len(table.split('\n'))
-            if not (3 <= cols <= 6) or rows > 15:
-                readable_tables = False
-                break
-        checks.append(CheckResult(
+        tables = self.doc.tables
+        readable_tables = all(3 <= table.columns <= 6 and table.row_count <= 15 for table in tables)
+        return CheckResult(
             "4.3.2",
             "Tables readable (3-6 cols, reasonable rows)",
             readable_tables or len(tables) == 0,
             f"{len(tables)} tables found"
-        ))
+        )
 
+    @check("4.3.3", cost='scan')
+    def _check_highlighting(self) -> CheckResult:
         # 4.3.3 Important info highlighted
+        tables = self.doc.tables
         bold_count = self.content.count('**')
         has_tables = len(tables) > 0
-        checks.append(CheckResult(
+        return CheckResult(
             "4.3.3",
             "Important info highlighted (bold, tables)",
             bold_count >= 20 and has_tables,
             f"{bold_count//2} bold items, {len(tables)} tables"
-        ))
-
-        return checks
+        )
 
 
-class WarningValidator:
+class WarningValidator(_RegistersChecks):
     """Generates warning-level checks (EN/JA parity, Values, safety risks, Japanese leak)"""
+    CATEGORY = "Warnings"
 
-    def __init__(self, content: str, file_path: str):
+    def __init__(self, content: str, file_path: str, document: Optional[MarkdownDocument] = None,
+                 profiler: Optional['Profiler'] = None, inputs: Optional[SkillInputs] = None,
+                 selection: Optional[CheckSelection] = None, gate: Optional[_Gate] = None):
+        self.doc = document or MarkdownDocument(content)
         self.content = content
         self.file_path = file_path
-        self.lines = content.split('\n')
-
-    def _find_ja_file(self) -> Optional[Path]:
-        """Locate Japanese version file"""
-        skill_dir = Path(self.file_path).parent
-        for candidate in [
-            skill_dir / "references" / "SKILL.ja.md",
-            skill_dir / "SKILL.ja.md",
-        ]:
-            if candidate.exists():
-                return candidate
-        return None
+        self.lines = self.doc.lines
+        self.profiler = profiler
+        self._inputs = inputs
+        self.selection = selection or ALL_CHECKS
+        self.gate = gate or _Gate(NO_EARLY_EXIT, self.selection)
+
+    @property
+    def inputs(self) -> SkillInputs:
+        """Inputs given by the caller, else resolved from disk on first use"""
+        if self._inputs is None:
+            self._inputs = load_inputs(Path(self.file_path))
+        return self._inputs
 
     @staticmethod
-    def _strip_fenced_code(text: str) -> str:
-        """Remove fenced code blocks (CommonMark: up to 3 leading spaces, ``` or ~~~)."""
-        lines = text.split('\n')
-        result: List[str] = []
-        in_fence = False
-        fence_char = ''
-        fence_len = 0
-
-        for line in lines:
-            fence_match = re.match(r'^ {0,3}([`~]{3,})', line)
-            if fence_match:
-                marker = fence_match.group(1)
-                if not in_fence:
-                    in_fence = True
-                    fence_char = marker[0]
-                    fence_len = len(marker)
-                elif marker[0] == fence_char and len(marker) >= fence_len:
-                    in_fence = False
-                continue
-            if not in_fence:
-                result.append(line)
-
-        return '\n'.join(result)
-
-    def _extract_headings(self, text: str) -> List[Tuple[int, str]]:
+    def _extract_headings(doc: MarkdownDocument) -> List[Tuple[int, str]]:
         """Extract (level, title) pairs outside code blocks"""
-        cleaned = self._strip_fenced_code(text)
-        return [
-            (len(m.group(1)), m.group(2).strip())
-            for m in re.finditer(r'^(#{2,3})\s+(.+)', cleaned, re.MULTILINE)
-        ]
+        return [(h.level, h.title) for h in doc.headings_at(2, 3)]
+
+    @staticmethod
+    def _step_headings(doc: MarkdownDocument) -> List[Heading]:
+        """Workflow step headings (supports both ## and ### levels)"""
+        return [h for h in doc.headings_at(2, 3) if RE_STEP_TITLE_ANYCASE.match(h.title)]
 
-    def _count_steps(self, text: str) -> int:
+    def _count_steps(self, doc: MarkdownDocument) -> int:
         """Count workflow step headings (supports both ## and ### levels)"""
-        cleaned = self._strip_fenced_code(text)
-        return len(re.findall(r'^#{2,3}\s+Step\s+\d+', cleaned, re.MULTILINE | re.IGNORECASE))
+        return len(self._step_headings(doc))
 
-    def _has_decision_table(self, text: str) -> bool:
+    @staticmethod
+    def _has_decision_table(doc: MarkdownDocument) -> bool:
         """Check for decision table presence"""
-        cleaned = self._strip_fenced_code(text)
-        return bool(re.search(r'decision\s+table|判断テーブル|判断表', cleaned, re.IGNORECASE))
+        return bool(RE_DECISION_TABLE.search(doc.prose))
 
     def validate(self) -> List[WarningResult]:
         warnings: List[WarningResult] = []
-        warnings.extend(self._check_en_ja_parity())
-        warnings.extend(self._check_step_values())
-        warnings.extend(self._check_ja_safety_risks())
-        warnings.extend(self._check_glossary_freshness())
-        warnings.extend(self._check_en_japanese_leak())
+        for spec in self.CHECKS:
+            if not self.selection.includes(spec):
+                continue
+            self.gate.current = spec.id
+            run = getattr(self, spec.method)
+            try:
+                if self.profiler is None:
+                    warnings.extend(run())
+                else:
+                    with self.profiler.timed(self.file_path, type(self).__name__, spec.id):
+                        warnings.extend(run())
+            except CheckTimeout:
+                self.gate.time_out()
+                break
+            if self.gate.out_of_time(spec.id):
+                break
         return warnings
 
     # --- W1: EN/JA structural parity ---
 
+    @check("W1", inputs=('en', 'ja'), cost='cross-file')
     def _check_en_ja_parity(self) -> List[WarningResult]:
         warnings: List[WarningResult] = []
-        ja_path = self._find_ja_file()
-        if ja_path is None:
+        ja_doc = self.inputs.ja_document
+        if ja_doc is None:
             return warnings  # no JA file → already caught by fail check 1.12
 
-        ja_content = ja_path.read_text(encoding='utf-8')
-
-        en_headings = self._extract_headings(self.content)
-        ja_headings = self._extract_headings(ja_content)
+        en_headings = self._extract_headings(self.doc)
+        ja_headings = self._extract_headings(ja_doc)
 
         # W1.1 H2 count
         en_h2 = [h for lv, h in en_headings if lv == 2]
@@ -1192,8 +1908,8 @@ class WarningValidator:
             ))
 
         # W1.3 Step count
-        en_steps = self._count_steps(self.content)
-        ja_steps = self._count_steps(ja_content)
+        en_steps = self._count_steps(self.doc)
+        ja_steps = self._count_steps(ja_doc)
         if en_steps != ja_steps:
             warnings.append(WarningResult(
                 "W1.3",
@@ -1202,8 +1918,8 @@ class WarningValidator:
             ))
 
         # W1.4 Decision table parity
-        en_dt = self._has_decision_table(self.content)
-        ja_dt = self._has_decision_table(ja_content)
+        en_dt = self._has_decision_table(self.doc)
+        ja_dt = self._has_decision_table(ja_doc)
         if en_dt != ja_dt:
             warnings.append(WarningResult(
                 "W1.4",
@@ -1211,52 +1927,69 @@ class WarningValidator:
                 f"EN: {'present' if en_dt else 'absent'}, JA: {'present' if ja_dt else 'absent'}"
             ))
 
+        # W1.5 Table shape parity (columns x data rows, table by table)
+        en_tables, ja_tables = self.doc.tables, ja_doc.tables
+        mismatches = table_shape_mismatches(en_tables, ja_tables)
+        if len(en_tables) != len(ja_tables) or mismatches:
+            details = [f"EN has {len(en_tables)} tables, JA has {len(ja_tables)}"] \
+                if len(en_tables) != len(ja_tables) else []
+            details += [
+                f"table {number} (EN L{en.start + 1}): EN {en.columns}x{en.row_count}, "
+                f"JA {ja.columns}x{ja.row_count}"
+                for number, en, ja in mismatches[:5]
+            ]
+            warnings.append(WarningResult(
+                "W1.5",
+                "EN/JA table shape mismatch (columns x rows)",
+                "; ".join(details),
+                [SourceSpan(en.start + 1, 1, len(en.rows[0]) + 1) for _, en, _ in mismatches],
+            ))
+
         return warnings
 
     # --- W2: Workflow Step Values presence ---
 
+    @check("W2")
     def _check_step_values(self) -> List[WarningResult]:
         warnings: List[WarningResult] = []
-        cleaned = self._strip_fenced_code(self.content)
-        step_matches = list(re.finditer(r'^#{2,3}\s+(Step\s+\d+[^\n]*)', cleaned, re.MULTILINE | re.IGNORECASE))
-
-        for i, match in enumerate(step_matches):
-            step_title = match.group(1).strip()
-            start = match.end()
-            end = step_matches[i + 1].start() if i + 1 < len(step_matches) else len(cleaned)
-            section = cleaned[start:end]
+        step_headings = self._step_headings(self.doc)
+
+        for i, heading in enumerate(step_headings):
+            step_title = heading.title
+            end = step_headings[i + 1].line if i + 1 < len(step_headings) else len(self.lines)
+            has_values = any(
+                heading.line < quote.line < end and quote.text.lstrip().startswith('**Values**')
+                for quote in self.doc.blockquotes
+            )
 
-            if not re.search(r'>\s*\*\*Values\*\*', section):
+            if not has_values:
+                heading_line = self.lines[heading.line]
                 warnings.append(WarningResult(
                     f"W2.{i + 1}",
                     f"Step missing Values marker: {step_title}",
-                    "Expected '> **Values**: ...' at end of step section"
+                    "Expected '> **Values**: ...' at end of step section",
+                    [SourceSpan(heading.line + 1, 1, len(heading_line) + 1)],
                 ))
 
         return warnings
 
     # --- W3: JP safety-risk vocabulary alignment ---
 
-    SAFETY_KEYWORDS_JA = [
-        'セキュリティ', '認証', '認可', '削除', '破壊的', '秘密',
-        '機密', 'トークン', 'パスワード', 'クレデンシャル', '危険',
-        '禁止', '絶対にしない', '必ず確認',
-    ]
-    NEGATION_PATTERNS_JA = [
-        r'しない', r'してはいけない', r'禁止', r'不可',
-        r'使わない', r'避ける', r'やめる',
-    ]
+    SAFETY_KEYWORDS_JA = SAFETY_KEYWORDS_JA
+    NEGATION_PATTERNS_JA = NEGATION_PATTERNS_JA
 
+    @check("W3", inputs=('ja',), cost='cross-file')
     def _check_ja_safety_risks(self) -> List[WarningResult]:
         warnings: List[WarningResult] = []
-        ja_path = self._find_ja_file()
-        if ja_path is None:
+        ja_doc = self.inputs.ja_document
+        if ja_doc is None:
             return warnings
 
-        ja_content = ja_path.read_text(encoding='utf-8')
+        terms = ja_doc.scan_terms(VOCABULARY_SCANNER)
 
         # W3.1 Safety keywords in JA
-        found_keywords = [kw for kw in self.SAFETY_KEYWORDS_JA if kw in ja_content]
+        found = terms.found('W3.1.safety')
+        found_keywords = [kw for kw in self.SAFETY_KEYWORDS_JA if kw in found]
         if found_keywords:
             warnings.append(WarningResult(
                 "W3.1",
@@ -1266,7 +1999,8 @@ class WarningValidator:
             ))
 
         # W3.2 Negation patterns in JA (meaning reversal risk)
-        found_negations = [p for p in self.NEGATION_PATTERNS_JA if re.search(p, ja_content)]
+        found = terms.found('W3.2.negation')
+        found_negations = [p for p in self.NEGATION_PATTERNS_JA if p in found]
         if found_negations:
             warnings.append(WarningResult(
                 "W3.2",
@@ -1278,34 +2012,17 @@ class WarningValidator:
 
     # --- W4: Glossary freshness check ---
 
+    @check("W4", inputs=('repo',), cost='cross-file')
     def _check_glossary_freshness(self) -> List[WarningResult]:
         """Warn if the glossary in copilot-instructions.md is older than this skill file."""
         warnings: List[WarningResult] = []
 
-        # Walk up from skill file to find repo root (contains .github/)
-        skill_path = Path(self.file_path).resolve()
-        repo_root = skill_path.parent
-        while repo_root != repo_root.parent:
-            if (repo_root / ".github" / "copilot-instructions.md").exists():
-                break
-            repo_root = repo_root.parent
-        else:
-            return warnings
-
-        instructions_path = repo_root / ".github" / "copilot-instructions.md"
-        if not instructions_path.exists():
-            return warnings
-
-        try:
-            instructions_text = instructions_path.read_text(encoding='utf-8')
-        except OSError:
+        context = self.inputs.context
+        if context.glossary_path is None:
             return warnings
 
-        # Extract "Glossary Last Updated: YYYY-MM-DD"
-        date_match = re.search(
-            r'Glossary Last Updated[:\s]*(\d{4}-\d{2}-\d{2})', instructions_text
-        )
-        if not date_match:
+        glossary_date = context.glossary_date
+        if glossary_date is None:
             warnings.append(WarningResult(
                 "W4",
                 "Glossary date not found in copilot-instructions.md",
@@ -1313,12 +2030,10 @@ class WarningValidator:
             ))
             return warnings
 
-        from datetime import datetime
-
-        glossary_date = datetime.strptime(date_match.group(1), '%Y-%m-%d').date()
-
-        # Compare with skill file modification time
-        skill_mtime = datetime.fromtimestamp(skill_path.stat().st_mtime).date()
+        # Compare with skill file modification date (in-memory content may have none)
+        skill_mtime = self.inputs.modified
+        if skill_mtime is None:
+            return warnings
 
         if skill_mtime > glossary_date:
             warnings.append(WarningResult(
@@ -1331,155 +2046,553 @@ class WarningValidator:
 
     # --- W5: Japanese leak detection in EN files ---
 
+    @check("W5", inputs=('en', 'repo'), cost='cross-file')
     def _check_en_japanese_leak(self) -> List[WarningResult]:
         """W5: Detect Japanese text leaking into EN SKILL.md (outside allowed contexts)."""
-        warnings: List[WarningResult] = []
-
         # Only check EN files (not JA files)
         file_name = Path(self.file_path).name
         if file_name.endswith('.ja.md'):
-            return warnings
-
-        # Strip fenced code blocks (Japanese in code examples is OK)
-        cleaned = self._strip_fenced_code(self.content)
-
-        # Also strip frontmatter (Japanese in frontmatter metadata is OK)
-        cleaned = re.sub(r'^---\s*\n.*?\n---\s*\n', '', cleaned, count=1, flags=re.DOTALL)
-
-        # Also strip Values blockquotes (Japanese Values names like 基礎と型 are OK)
-        cleaned = re.sub(r'^>\s*\*\*Values\*\*.*$', '', cleaned, flags=re.MULTILINE)
-
-        # Strip parenthetical Values references — e.g. (基礎と型), (成長の複利)
-        # Uses regex to catch full and abbreviated Values names
-        cleaned = re.sub(
-            r'[（(](?:温故知新|継続は力|基礎と型の追求|基礎と型|成長の複利|'
-            r'ニュートラルな視点|ニュートラル|余白の設計)[)）]',
-            '', cleaned
-        )
-        # Strip lines containing Values markers with Japanese names
-        cleaned = re.sub(
-            r'^.*\*\*Values\*\*\s*[:：].*$', '', cleaned, flags=re.MULTILINE
-        )
-
-        # Check for Japanese characters (Hiragana, Katakana, CJK Unified Ideographs)
-        japanese_pattern = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]')
-
-        # Build original line lookup for accurate line number reporting
-        original_lines = self.content.split('\n')
+            return []
+        return self._japanese_leak_warnings(self._japanese_leak_spans())
+
+    def _japanese_leak_spans(self) -> List[SourceSpan]:
+        """Every Japanese run outside frontmatter, code fences and Values references"""
+        # Fast path: most EN files contain no Japanese at all
+        if not RE_JAPANESE.search(self.content):
+            return []
+
+        # Japanese in code examples and frontmatter metadata is OK
+        skipped_lines = set(range(self.doc.body_start))
+        for fence in self.doc.fences:
+            skipped_lines.update(range(fence.start, fence.end + 1))
+
+        values_pattern = self.inputs.context.values_pattern
+        locations: List[SourceSpan] = []
+        for idx, line in enumerate(self.lines):
+            if idx in skipped_lines:
+                continue
+            # Values blockquotes and "**Values**:" lines name Values in Japanese (基礎と型 etc.)
+            if RE_W5_VALUES_BLOCKQUOTE.match(line) or RE_W5_VALUES_LINE.search(line):
+                continue
+            # Blank out parenthetical Values references — e.g. (基礎と型) — keeping columns intact
+            masked = values_pattern.sub(lambda m: ' ' * len(m.group(0)), line)
+            # Japanese characters: Hiragana, Katakana, CJK Unified Ideographs
+            locations.extend(
+                SourceSpan(idx + 1, m.start() + 1, m.end() + 1)
+                for m in RE_JAPANESE.finditer(masked)
+            )
+        return locations
 
+    def _japanese_leak_warnings(self, locations: List[SourceSpan]) -> List[WarningResult]:
+        """Fold leak spans into the single W5 warning (one details entry per line)"""
+        warnings: List[WarningResult] = []
         found_lines = []
-        for _i, line in enumerate(cleaned.split('\n'), 1):
-            if japanese_pattern.search(line):
-                excerpt = line.strip()[:60]
-                # Find the actual line number in the original file
-                orig_num = None
-                for oi, ol in enumerate(original_lines, 1):
-                    if ol.strip() == line.strip():
-                        orig_num = oi
-                        break
-                label = f"L{orig_num}" if orig_num else "L?"
-                found_lines.append(f"{label}: {excerpt}")
+        seen_lines = set()
+        for span in locations:
+            if span.line not in seen_lines:
+                seen_lines.add(span.line)
+                found_lines.append(f"L{span.line}:C{span.column}: {self.lines[span.line - 1].strip()[:60]}")
 
         if found_lines:
             warnings.append(WarningResult(
                 "W5",
                 "EN SKILL.md contains Japanese text — verify intentional or move to JA version",
-                f"Found in {len(found_lines)} line(s): {'; '.join(found_lines[:5])}"
+                f"Found in {len(found_lines)} line(s): {'; '.join(found_lines[:5])}",
+                locations,
             ))
 
         return warnings
 
 
-def validate_skill_file(file_path: str) -> ValidationReport:
-    """Main validation function"""
+# Every registered check; the default selection
+ALL_CHECKS = CheckSelection()
+
+
+def find_glossary_file(skill_path: Path) -> Optional[Path]:
+    """Walk up from a skill file to the repo root's .github/copilot-instructions.md"""
+    if _indexed(skill_path):
+        glossary = REPO_INDEX.glossary_for(skill_path)
+        return Path(glossary) if glossary else None
+    repo_root = skill_path.parent
+    while repo_root != repo_root.parent:
+        instructions_path = repo_root / ".github" / "copilot-instructions.md"
+        if instructions_path.exists():
+            return instructions_path
+        repo_root = repo_root.parent
+    return None
+
+
+def find_philosophy_file(skill_path: Path) -> Optional[Path]:
+    """Walk up from a skill file to the nearest PHILOSOPHY.md (the Values source)"""
+    if _indexed(skill_path):
+        philosophy = REPO_INDEX.philosophy_for(skill_path)
+        return Path(philosophy) if philosophy else None
+    repo_root = skill_path.parent
+    while repo_root != repo_root.parent:
+        philosophy_path = repo_root / "PHILOSOPHY.md"
+        if philosophy_path.exists():
+            return philosophy_path
+        repo_root = repo_root.parent
+    return None
+
+
+def report_from_dict(data: Dict) -> ValidationReport:
+    """Rebuild a ValidationReport from dataclasses.asdict() output"""
+    categories = [
+        CategoryResult(**{**cat, 'checks': [CheckResult(**c) for c in cat['checks']]})
+        for cat in data['categories']
+    ]
+    warnings = [
+        WarningResult(**{**w, 'locations': [SourceSpan(**loc) for loc in w.get('locations') or []]})
+        for w in data.get('warnings') or []
+    ]
+    return ValidationReport(**{**data, 'categories': categories, 'warnings': warnings})
+
+
+@lru_cache(maxsize=1)
+def _validator_digest() -> str:
+    """Hash of this script, so local edits to the validator never serve stale cached results"""
+    digest = hashlib.sha256()
+    for source in (Path(__file__), Path(__file__).with_name('skill_corpus.py')):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Persistent on-disk cache of validation reports, keyed by content hash.
+
+    The key covers everything a report depends on: validator version and source,
+    the skill path, SKILL.md, its JA companion, and the W4 glossary inputs.
+    Entries are JSON files; a hit refreshes the file mtime, and writes evict
+    the least recently used entries once the directory exceeds max_bytes.
+    """
+
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def default_directory() -> Path:
+        base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        return Path(base) / 'skill-quality-validation'
+
+    def key_for(self, path: Path, content: bytes) -> str:
+        digest = hashlib.sha256()
+
+        def feed(label: str, data: bytes) -> None:
+            digest.update(f"{label}:{len(data)}:".encode('utf-8'))
+            digest.update(data)
+
+        feed('version', VALIDATOR_VERSION.encode('utf-8'))
+        feed('validator', _validator_digest().encode('utf-8'))
+        feed('path', str(path).encode('utf-8'))
+        feed('skill', content)
+        ja_path = find_ja_file(path)
+        feed('ja', read_bytes(ja_path) if ja_path else b'\0missing')
+
+        # W4 compares the glossary date against the skill's modification date
+        glossary = find_glossary_file(path.resolve())
+        feed('glossary', read_bytes(glossary) if glossary else b'\0missing')
+        # W5 takes its Values allow-list from PHILOSOPHY.md
+        philosophy = find_philosophy_file(path.resolve())
+        feed('philosophy', read_bytes(philosophy) if philosophy else b'\0missing')
+        if glossary:
+            feed('mtime', str(modified_date(path)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ValidationReport]:
+        entry = self._entry(key)
+        try:
+            data = json.loads(entry.read_text(encoding='utf-8'))
+            os.utime(entry)  # LRU: a hit marks the entry as recently used
+        except (OSError, ValueError):
+            return None
+        try:
+            return report_from_dict(data)
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, key: str, report: ValidationReport) -> None:
+        """Store report; a cache that cannot be written is skipped (the next run misses)"""
+        entry = self._entry(key)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(asdict(report), ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp, entry)  # atomic: concurrent workers never see partial entries
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        try:
+            listing = list(self.directory.glob('*.json'))
+        except OSError:
+            return
+        for entry in listing:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+            total -= size
+
+
+# --- Profiling (opt-in via --profile) ---
+
+
+@dataclass
+class ProfileSample:
+    """Wall time spent in one frame of one file's validation.
+
+    frames is the call path below the file, e.g. ("tokenize",),
+    ("StructureValidator",) for a validator total, or
+    ("StructureValidator", "1.7") for a single check.
+    """
+    file_path: str
+    frames: Tuple[str, ...]
+    seconds: float
+
+
+class Profiler:
+    """Collects per-file, per-validator and per-check timings across a run.
+
+    Checks are lap-timed: the time attributed to a check is everything the
+    validator did since the previous check was recorded, so shared set-up
+    work is charged to the first check that uses it.
+    """
+
+    def __init__(self):
+        self.samples: List[ProfileSample] = []
+
+    def record(self, file_path: str, frames: Tuple[str, ...], seconds: float) -> None:
+        self.samples.append(ProfileSample(file_path, frames, seconds))
+
+    def merge(self, samples: List[ProfileSample]) -> None:
+        self.samples.extend(samples)
+
+    @contextmanager
+    def timed(self, file_path: str, *frames: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(file_path, frames, time.perf_counter() - started)
+
+    def _totals(self, keep) -> List[Tuple[Tuple[str, ...], float, int]]:
+        totals: Dict[Tuple[str, ...], List[float]] = {}
+        for sample in self.samples:
+            key = keep(sample)
+            if key is None:
+                continue
+            entry = totals.setdefault(key, [0.0, 0])
+            entry[0] += sample.seconds
+            entry[1] += 1
+        return sorted(((k, v[0], v[1]) for k, v in totals.items()), key=lambda t: t[1], reverse=True)
+
+    def by_check(self) -> List[Tuple[Tuple[str, ...], float, int]]:
+        """((validator, check_id), seconds, calls), slowest first, summed over files"""
+        return self._totals(lambda s: s.frames if len(s.frames) == 2 else None)
+
+    def by_stage(self) -> List[Tuple[Tuple[str, ...], float, int]]:
+        """((stage,), seconds, calls) for validators and read/tokenize/cache phases"""
+        return self._totals(lambda s: s.frames if len(s.frames) == 1 else None)
+
+    def by_file(self) -> List[Tuple[Tuple[str, ...], float, int]]:
+        """((file_path,), seconds, 1) for whole-file validation time"""
+        return self._totals(lambda s: (s.file_path,) if not s.frames else None)
+
+    def collapsed_stacks(self, root: str = "validate_skill") -> str:
+        """Flame-graph "collapsed stack" lines (frame;frame;... microseconds) with self times only"""
+        children: Dict[Tuple[str, ...], float] = {}
+        for (frames, seconds, _) in self.by_check():
+            children[frames[:1]] = children.get(frames[:1], 0.0) + seconds
+        lines = []
+        for (frames, seconds, _) in self.by_stage():
+            self_seconds = max(0.0, seconds - children.get(frames, 0.0))
+            lines.append((";".join((root,) + frames), self_seconds))
+        for (frames, seconds, _) in self.by_check():
+            lines.append((";".join((root,) + frames), seconds))
+        # Per-file overhead outside the timed stages (report assembly etc.)
+        stage_total = sum(seconds for _, seconds, _ in self.by_stage())
+        file_total = sum(seconds for _, seconds, _ in self.by_file())
+        lines.append((root, max(0.0, file_total - stage_total)))
+        return "\n".join(
+            f"{stack} {int(round(seconds * 1_000_000))}" for stack, seconds in sorted(lines)
+        ) + "\n"
+
+
+class _LapList(list):
+    """CheckResult list that charges the time since the previous append to each appended check"""
+
+    def __init__(self, profiler: Profiler, file_path: str, validator_name: str):
+        super().__init__()
+        self._profiler = profiler
+        self._file_path = file_path
+        self._validator_name = validator_name
+        self._last = time.perf_counter()
+
+    def append(self, check: CheckResult) -> None:
+        now = time.perf_counter()
+        self._profiler.record(self._file_path, (self._validator_name, check.id), now - self._last)
+        super().append(check)
+        self._last = time.perf_counter()
+
+
+def format_profile_report(profiler: Profiler, top: int = 10) -> str:
+    """Top-N slowest validators, checks and files"""
+    files = profiler.by_file()
+    total = sum(seconds for _, seconds, _ in files)
+    lines = []
+    lines.append("=" * 60)
+    lines.append(f"Profile: {len(files)} file(s), {total * 1000:.1f} ms total")
+    lines.append("=" * 60)
+    lines.append("")
+    lines.append("[Stages]")
+    for (stage,), seconds, _ in profiler.by_stage():
+        share = seconds / total * 100 if total else 0
+        lines.append(f"  {stage:<24} {seconds * 1000:>9.1f} ms  {share:>5.1f}%")
+    lines.append("")
+    lines.append(f"[Slowest checks] (top {top}, summed over files)")
+    for (validator, check_id), seconds, calls in profiler.by_check()[:top]:
+        lines.append(
+            f"  {check_id:<8} {validator:<22} {seconds * 1000:>9.2f} ms  "
+            f"({seconds / calls * 1_000_000:.0f} µs/file)"
+        )
+    lines.append("")
+    lines.append(f"[Slowest files] (top {top})")
+    for (file_path,), seconds, _ in files[:top]:
+        lines.append(f"  {seconds * 1000:>9.2f} ms  {file_path}")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def validate_skill_file(file_path: str, cache: Optional[ResultCache] = None,
+                        profiler: Optional[Profiler] = None,
+                        selection: Optional[CheckSelection] = None,
+                        early_exit: EarlyExit = NO_EARLY_EXIT) -> ValidationReport:
+    """Main validation function
+
+    With a partial selection only the selected checks run, and the cache is
+    bypassed (it only stores full reports). early_exit may stop the run at
+    the first decisive failure or when the time budget is spent.
+    """
+    selection = selection or ALL_CHECKS
+    if not selection.is_full:
+        cache = None
+
+    cache_key: Optional[str] = None
+
+    def run(gate: _Gate) -> ValidationReport:
+        nonlocal cache_key
+        report, cache_key = _validate_skill_file(file_path, cache, profiler, selection, gate)
+        return report
+
+    def validate() -> ValidationReport:
+        report = _run_gated(file_path, selection, early_exit, run)
+        # Written once the alarm is disarmed, so a timeout cannot leave a half-written
+        # entry; a run cut short is not the file's report
+        if cache_key is not None and not report.stopped:
+            cache.put(cache_key, report)
+        return report
+
+    if profiler is not None:
+        with profiler.timed(file_path):
+            return validate()
+    return validate()
+
+
+def _run_gated(file_path: str, selection: CheckSelection, early_exit: EarlyExit,
+               run) -> ValidationReport:
+    """run(gate) under the --time-budget alarm; a timeout outside the checks still gives a report
+
+    The alarm is cancelled before returning, and CheckTimeout is caught around
+    the whole armed region, so a late alarm never escapes to the caller.
+    """
+    gate = _Gate(early_exit, selection)
+    try:
+        with gate.armed():
+            report = run(gate)
+            gate.disarm()
+        return report
+    except CheckTimeout:
+        gate.time_out()
+    return _assemble_report(file_path, [], [], selection.describe(), gate.stopped)
+
+
+@contextmanager
+def _stage(profiler: Optional[Profiler], file_path: str, name: str):
+    if profiler is None:
+        yield
+    else:
+        with profiler.timed(file_path, name):
+            yield
+
+
+def _validate_skill_file(file_path: str, cache: Optional[ResultCache], profiler: Optional[Profiler],
+                         selection: CheckSelection, gate: _Gate) -> Tuple[ValidationReport, Optional[str]]:
+    """(report, cache key to store it under); the key is None on a cache hit or without a cache"""
     path = Path(file_path)
     
-    if not path.exists():
+    indexed = _indexed(path) and REPO_INDEX.skill(path) is not None
+    if not indexed and not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    content = path.read_text(encoding='utf-8')
+    with _stage(profiler, file_path, "read"):
+        raw = read_bytes(path)
+    cache_key = None
+    if cache is not None:
+        with _stage(profiler, file_path, "cache"):
+            cache_key = cache.key_for(path, raw)
+            cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, None
+    
+    # Tokenize once (memoized per path and mtime); every validator reads the same parsed document
+    with _stage(profiler, file_path, "tokenize"):
+        document = load_document(path)
+        inputs = _load_selected_inputs(path, selection)
+    report = _validate_document(document, file_path, profiler, inputs, selection, gate)
+    return report, cache_key
+
+
+def validate_skill_content(content: str, file_path: str,
+                           profiler: Optional[Profiler] = None,
+                           selection: Optional[CheckSelection] = None,
+                           early_exit: EarlyExit = NO_EARLY_EXIT) -> ValidationReport:
+    """Validate in-memory SKILL.md content (e.g. an unsaved editor buffer).
+
+    file_path names where the content lives; checks that look at neighbouring
+    files (1.12, W1, W3, W4) still resolve them relative to it.
+    """
+    selection = selection or ALL_CHECKS
+    return _run_gated(file_path, selection, early_exit, lambda gate: _validate_document(
+        MarkdownDocument(content), file_path, profiler,
+        _load_selected_inputs(Path(file_path), selection), selection, gate))
+
+
+def validate_skill_in_memory(content: str, ja_content: Optional[str] = None,
+                             context: Optional[RepoContext] = None,
+                             file_path: str = "SKILL.md",
+                             modified: Optional[date] = None,
+                             selection: Optional[CheckSelection] = None,
+                             early_exit: EarlyExit = NO_EARLY_EXIT) -> ValidationReport:
+    """Validate SKILL.md content without touching the filesystem.
+
+    ja_content stands in for references/SKILL.ja.md (None: no JA version),
+    context for the repository glossary, and modified for the file date W4
+    compares against it. file_path is only used for the report and the folder
+    name check (1.3). Safe to call from many threads at once.
+    """
+    inputs = SkillInputs(
+        ja_document=MarkdownDocument(ja_content) if ja_content is not None else None,
+        modified=modified,
+        context=context or RepoContext(),
+    )
+    selection = selection or ALL_CHECKS
+    return _run_gated(file_path, selection, early_exit, lambda gate: _validate_document(
+        MarkdownDocument(content), file_path, None, inputs, selection, gate))
+
+
+def _validate_document(document: MarkdownDocument, file_path: str,
+                       profiler: Optional[Profiler], inputs: SkillInputs,
+                       selection: Optional[CheckSelection] = None,
+                       gate: Optional[_Gate] = None) -> ValidationReport:
+    selection = selection or ALL_CHECKS
+    gate = gate or _Gate(NO_EARLY_EXIT, selection)
+    categories = _validate_categories(document, file_path, profiler, inputs, selection, gate)
+    
+    # Warning checks (do not affect pass/fail)
+    warnings: List[WarningResult] = []
+    if selection.any_of(WarningValidator.CHECKS) and not gate.stopped:
+        warning_validator = WarningValidator(document.content, file_path, document=document,
+                                             profiler=profiler, inputs=inputs, selection=selection,
+                                             gate=gate)
+        with _stage(profiler, file_path, "WarningValidator"):
+            warnings = warning_validator.validate()
+    
+    return _assemble_report(file_path, categories, warnings, selection.describe(), gate.stopped)
+
+
+# Scored categories in report order
+SCORED_VALIDATORS = (StructureValidator, ContentValidator, CodeQualityValidator, LanguageValidator)
+
+
+def _validate_categories(document: MarkdownDocument, file_path: str,
+                         profiler: Optional[Profiler], inputs: SkillInputs,
+                         selection: Optional[CheckSelection] = None,
+                         gate: Optional[_Gate] = None) -> List[CategoryResult]:
+    """Run the four scored validators (Structure, Content, Code Quality, Language)
+
+    A validator with no selected check is not run and its category is left out.
+    Once the gate stops, the remaining validators are not run either.
+    """
+    selection = selection or ALL_CHECKS
+    gate = gate or _Gate(NO_EARLY_EXIT, selection)
+    content = document.content
     
     # Detect router skills (description contains "router" or first 500 chars mention "router skill")
-    frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    frontmatter = frontmatter_match.group(1) if frontmatter_match else ''
+    frontmatter = document.frontmatter or ''
     is_router = 'router' in frontmatter.lower() or 'router skill' in content[:500].lower()
-    is_workflow = bool(re.search(r'^##\s+Workflow:', content, re.MULTILINE)) and not is_router
+    is_workflow = any(h.title.startswith('Workflow:') for h in document.headings_at(2)) and not is_router
     
-    # Run all validators
-    structure = StructureValidator(content, file_path, is_router=is_router, is_workflow=is_workflow)
-    content_validator = ContentValidator(content, file_path, is_router=is_router, is_workflow=is_workflow)
-    code_quality = CodeQualityValidator(content, file_path, is_router=is_router, is_workflow=is_workflow)
-    language = LanguageValidator(content, file_path, is_router=is_router, is_workflow=is_workflow)
+    validator_args = dict(is_router=is_router, is_workflow=is_workflow, document=document,
+                          profiler=profiler, inputs=inputs, selection=selection, gate=gate)
     
-    # Collect results
+    # Each category: dynamic item count, 80% threshold
     categories = []
-    
-    # Structure (dynamic item count, 80% threshold)
-    structure_checks = structure.validate()
-    structure_max = len(structure_checks)
-    structure_score = sum(1 for c in structure_checks if c.passed)
-    structure_result = CategoryResult(
-        name="Structure",
-        checks=structure_checks,
-        score=structure_score,
-        max_score=structure_max,
-        percentage=structure_score / structure_max * 100 if structure_max > 0 else 0,
-        passed=structure_score >= structure_max * 0.8
-    )
-    categories.append(structure_result)
-    
-    # Content (20 items, 80% threshold)
-    content_checks = content_validator.validate()
-    content_max = len(content_checks)
-    content_score = sum(1 for c in content_checks if c.passed)
-    content_result = CategoryResult(
-        name="Content",
-        checks=content_checks,
-        score=content_score,
-        max_score=content_max,
-        percentage=content_score / content_max * 100 if content_max > 0 else 0,
-        passed=content_score >= content_max * 0.8
-    )
-    categories.append(content_result)
-    
-    # Code Quality (15 items, 80% threshold)
-    code_checks = code_quality.validate()
-    code_max = len(code_checks)
-    code_score = sum(1 for c in code_checks if c.passed)
-    code_result = CategoryResult(
-        name="Code Quality",
-        checks=code_checks,
-        score=code_score,
-        max_score=code_max,
-        percentage=code_score / code_max * 100 if code_max > 0 else 0,
-        passed=code_score >= code_max * 0.8
-    )
-    categories.append(code_result)
-    
-    # Language (10 items, 80% threshold)
-    language_checks = language.validate()
-    language_max = len(language_checks)
-    language_score = sum(1 for c in language_checks if c.passed)
-    language_result = CategoryResult(
-        name="Language",
-        checks=language_checks,
-        score=language_score,
-        max_score=language_max,
-        percentage=language_score / language_max * 100 if language_max > 0 else 0,
-        passed=language_score >= language_max * 0.8
-    )
-    categories.append(language_result)
-    
+    for validator_class in SCORED_VALIDATORS:
+        if gate.stopped:
+            break
+        if not selection.any_of(validator_class.CHECKS):
+            continue
+        validator = validator_class(content, file_path, **validator_args)
+        with _stage(profiler, file_path, validator_class.__name__):
+            checks = validator.validate()
+        score = sum(1 for c in checks if c.passed)
+        # Checks a stop left unrun count as not passed
+        max_score = gate.totals[validator_class.CATEGORY] if gate.stopped else len(checks)
+        categories.append(CategoryResult(
+            name=validator_class.CATEGORY,
+            checks=checks,
+            score=score,
+            max_score=max_score,
+            percentage=score / max_score * 100 if max_score > 0 else 0,
+            passed=score >= max_score * 0.8
+        ))
+    return categories
+
+
+def _assemble_report(file_path: str, categories: List[CategoryResult],
+                     warnings: List[WarningResult], selection: str = "",
+                     stopped: str = "") -> ValidationReport:
+    """Total the category scores and apply the overall 85% threshold (a stopped run fails)"""
     # Overall
     total_score = sum(c.score for c in categories)
     total_max = sum(c.max_score for c in categories)
-    overall_percentage = total_score / total_max * 100 if total_max > 0 else 0
-    overall_passed = overall_percentage >= 85 and all(c.passed for c in categories)
+    # A selection of warnings only scores nothing, and so fails nothing
+    overall_percentage = total_score / total_max * 100 if total_max > 0 else 100.0
+    overall_passed = overall_percentage >= 85 and all(c.passed for c in categories) and not stopped
     
-    # Warning checks (do not affect pass/fail)
-    warning_validator = WarningValidator(content, file_path)
-    warnings = warning_validator.validate()
-
     return ValidationReport(
         file_path=file_path,
         categories=categories,
@@ -1487,10 +2600,278 @@ def validate_skill_file(file_path: str) -> ValidationReport:
         total_max_score=total_max,
         overall_percentage=overall_percentage,
         overall_passed=overall_passed,
-        warnings=warnings
+        warnings=warnings,
+        selection=selection,
+        stopped=stopped
     )
 
 
+def find_skill_files(paths: List[str], recursive: bool = False,
+                     index: Optional[RepoIndex] = None) -> List[Path]:
+    """Resolve CLI paths to SKILL.md files.
+
+    Files are taken as-is. A directory contributes its own SKILL.md, or every
+    SKILL.md beneath it when recursive (references/ and hidden dirs skipped).
+    Directories covered by index are listed from it instead of walked.
+    """
+    found: List[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if not path.is_dir():
+            found.append(path)
+        elif not recursive:
+            found.append(path / "SKILL.md")
+        elif index is not None and index.covers(path):
+            root = os.path.abspath(path)
+            found.extend(
+                path / os.path.relpath(skill_file, root) for skill_file in index.skill_files_under(root)
+            )
+        else:
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(
+                    d for d in dirnames
+                    if d != 'references' and not d.startswith('.')
+                )
+                if 'SKILL.md' in filenames:
+                    found.append(Path(dirpath) / 'SKILL.md')
+
+    # De-duplicate while keeping discovery order
+    unique: Dict[str, Path] = {}
+    for path in found:
+        unique.setdefault(str(path.resolve()), path)
+    return list(unique.values())
+
+
+def _validate_for_batch(file_path: str, cache: Optional[ResultCache] = None,
+                        selection: Optional[CheckSelection] = None,
+                        early_exit: EarlyExit = NO_EARLY_EXIT
+                        ) -> Tuple[str, Optional[ValidationReport], Optional[str]]:
+    """Process-pool worker: never raises, so one bad file cannot sink the batch"""
+    try:
+        report = validate_skill_file(file_path, cache=cache, selection=selection, early_exit=early_exit)
+        return file_path, report, None
+    except FileNotFoundError as e:
+        return file_path, None, str(e)
+    except Exception as e:  # reported per file in the batch summary
+        return file_path, None, f"Unexpected error: {e}"
+
+
+def _profile_for_batch(file_path: str, cache: Optional[ResultCache] = None,
+                       selection: Optional[CheckSelection] = None,
+                       early_exit: EarlyExit = NO_EARLY_EXIT
+                       ) -> Tuple[str, Optional[ValidationReport], Optional[str], List[ProfileSample]]:
+    """Process-pool worker for --profile: also returns this file's timing samples"""
+    profiler = Profiler()
+    try:
+        report, error = validate_skill_file(file_path, cache=cache, profiler=profiler,
+                                            selection=selection, early_exit=early_exit), None
+    except FileNotFoundError as e:
+        report, error = None, str(e)
+    except Exception as e:  # reported per file in the batch summary
+        report, error = None, f"Unexpected error: {e}"
+    return file_path, report, error, profiler.samples
+
+
+def iter_validate(file_paths: List[str], workers: Optional[int] = None,
+                  cache: Optional[ResultCache] = None, profiler: Optional[Profiler] = None,
+                  selection: Optional[CheckSelection] = None,
+                  early_exit: EarlyExit = NO_EARLY_EXIT
+                  ) -> Iterator[Tuple[str, Optional[ValidationReport], Optional[str]]]:
+    """Yield (path, report, error) per file, in input order, as soon as each is ready.
+
+    The validators are pure CPU work, so separate processes scale across cores.
+    workers <= 1 (or a single file) runs in-process without a pool. With a
+    profiler, each worker's timing samples are merged into it.
+    """
+    for result in _iter_results(file_paths, workers, cache, profiler is not None, selection, early_exit):
+        if profiler is not None:
+            file_path, report, error, samples = result
+            profiler.merge(samples)
+            yield file_path, report, error
+        else:
+            yield result
+
+
+def _iter_results(file_paths: List[str], workers: Optional[int],
+                  cache: Optional[ResultCache], profile: bool,
+                  selection: Optional[CheckSelection] = None,
+                  early_exit: EarlyExit = NO_EARLY_EXIT) -> Iterator[Tuple]:
+    worker = _profile_for_batch if profile else _validate_for_batch
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(file_paths) <= 1:
+        for file_path in file_paths:
+            yield worker(file_path, cache, selection, early_exit)
+        return
+
+    workers = min(workers, len(file_paths))
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=use_repo_index,
+                             initargs=(REPO_INDEX,)) as executor:
+        yield from executor.map(
+            worker, file_paths, [cache] * len(file_paths), [selection] * len(file_paths),
+            [early_exit] * len(file_paths), chunksize=chunksize
+        )
+
+
+def validate_many(file_paths: List[str], workers: Optional[int] = None,
+                  cache: Optional[ResultCache] = None, profiler: Optional[Profiler] = None,
+                  selection: Optional[CheckSelection] = None,
+                  early_exit: EarlyExit = NO_EARLY_EXIT) -> BatchReport:
+    """Validate many SKILL.md files, fanning out over a process pool"""
+    results = list(iter_validate(file_paths, workers=workers, cache=cache, profiler=profiler,
+                                 selection=selection, early_exit=early_exit))
+    reports = [report for _, report, _ in results if report is not None]
+    errors = [(path, error) for path, _, error in results if error is not None]
+    return BatchReport(reports=reports, errors=errors)
+
+
+def validate_changes(changes: ChangeSet, selection: Optional[CheckSelection] = None,
+                     early_exit: EarlyExit = NO_EARLY_EXIT) -> BatchReport:
+    """Validate the skills of a ChangeSet from their git blobs (no file is opened).
+
+    Reports carry absolute paths like a normal run; W4 still compares against
+    the working-tree modification date, as the committed date is not known yet.
+    """
+    contexts: Dict[Tuple[Optional[str], Optional[str]], RepoContext] = {}
+    reports: List[ValidationReport] = []
+    errors: List[Tuple[str, str]] = []
+    for skill in changes.skills:
+        file_path = changes.absolute(skill.skill_file)
+        key = (skill.glossary_file, skill.philosophy_file)
+        if key not in contexts:
+            contexts[key] = RepoContext.from_texts(
+                glossary_text=skill.glossary_content, philosophy_text=skill.philosophy_content,
+                glossary_path=changes.absolute(skill.glossary_file) if skill.glossary_file else None,
+                philosophy_path=changes.absolute(skill.philosophy_file) if skill.philosophy_file else None,
+            )
+        try:
+            reports.append(validate_skill_in_memory(
+                skill.content, skill.ja_content, context=contexts[key],
+                file_path=file_path, modified=modified_date(Path(file_path)), selection=selection,
+                early_exit=early_exit,
+            ))
+        except Exception as e:  # reported per file in the batch summary
+            errors.append((file_path, f"Unexpected error: {e}"))
+    return BatchReport(reports=reports, errors=errors)
+
+
+def skill_file_for(path: Path) -> Path:
+    """Map SKILL.md or its JA companion to the EN SKILL.md that owns the report"""
+    if path.name == 'SKILL.ja.md':
+        skill_dir = path.parent.parent if path.parent.name == 'references' else path.parent
+        return skill_dir / 'SKILL.md'
+    return path
+
+
+class SkillWatcher:
+    """Polls skill trees with stat/mtime and revalidates only the skills that changed.
+
+    Reports from the previous run stay in memory so each change is reported
+    as a diff against the last result for that skill.
+    """
+
+    WATCHED_NAMES = ('SKILL.md', 'SKILL.ja.md')
+
+    def __init__(self, roots: List[str], cache: Optional[ResultCache] = None,
+                 selection: Optional[CheckSelection] = None, early_exit: EarlyExit = NO_EARLY_EXIT):
+        self.roots = [Path(r) for r in roots]
+        self.cache = cache
+        self.selection = selection
+        self.early_exit = early_exit
+        self.stamps: Dict[Path, Tuple[int, int]] = {}
+        self.reports: Dict[Path, ValidationReport] = {}
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """Stat every watched file below the roots: path -> (mtime_ns, size)"""
+        stamps: Dict[Path, Tuple[int, int]] = {}
+        for root in self.roots:
+            if root.is_file():
+                candidates = [root]
+            else:
+                candidates = []
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+                    candidates.extend(Path(dirpath) / n for n in filenames if n in self.WATCHED_NAMES)
+            for path in candidates:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def start(self, workers: Optional[int] = None) -> BatchReport:
+        """Record the initial stamps and validate every skill once"""
+        self.stamps = self.scan()
+        skill_files = sorted({skill_file_for(p) for p in self.stamps if skill_file_for(p).exists()})
+        batch = validate_many([str(p) for p in skill_files], workers=workers, cache=self.cache,
+                              selection=self.selection, early_exit=self.early_exit)
+        self.reports = {Path(r.file_path): r for r in batch.reports}
+        return batch
+
+    def poll(self) -> List[Tuple[Path, Optional[ValidationReport], Optional[ValidationReport]]]:
+        """Revalidate skills whose EN or JA file changed: [(skill_file, previous, current)]"""
+        stamps = self.scan()
+        changed = {p for p in set(stamps) | set(self.stamps) if stamps.get(p) != self.stamps.get(p)}
+        self.stamps = stamps
+
+        results = []
+        for skill_file in sorted({skill_file_for(p) for p in changed}):
+            previous = self.reports.pop(skill_file, None)
+            current = None
+            try:
+                current = validate_skill_file(str(skill_file), cache=self.cache, selection=self.selection,
+                                              early_exit=self.early_exit)
+                self.reports[skill_file] = current
+            except (OSError, UnicodeDecodeError):
+                pass  # deleted or mid-write; the next poll picks it up again
+            results.append((skill_file, previous, current))
+        return results
+
+
+def format_watch_diff(skill_file: Path, previous: Optional[ValidationReport],
+                      current: Optional[ValidationReport]) -> str:
+    """Describe how a skill's report changed since the previous run"""
+    if current is None:
+        return f"🗑️  {skill_file}: removed"
+
+    status = "✅ PASS" if current.overall_passed else "❌ FAIL"
+    if previous is None:
+        return f"🆕 {skill_file}: {current.overall_percentage:.1f}% {status}"
+
+    lines = []
+    before = "✅ PASS" if previous.overall_passed else "❌ FAIL"
+    transition = status if before == status else f"{before} → {status}"
+    lines.append(f"🔄 {skill_file}: {previous.overall_percentage:.1f}% → "
+                 f"{current.overall_percentage:.1f}% {transition}")
+
+    def check_map(report: ValidationReport) -> Dict[str, CheckResult]:
+        return {c.id: c for category in report.categories for c in category.checks}
+
+    old_checks, new_checks = check_map(previous), check_map(current)
+    for check_id, check in new_checks.items():
+        old = old_checks.get(check_id)
+        if not check.passed and (old is None or old.passed):
+            detail = f" - {check.details}" if check.details else ""
+            lines.append(f"  ❌ {check_id} {check.description}{detail}")
+        elif check.passed and old is not None and not old.passed:
+            lines.append(f"  ✅ {check_id} {check.description} (fixed)")
+
+    old_warnings = {(w.id, w.details): w for w in previous.warnings}
+    new_warnings = {(w.id, w.details): w for w in current.warnings}
+    for key, w in new_warnings.items():
+        if key not in old_warnings:
+            detail = f" - {w.details}" if w.details else ""
+            lines.append(f"  ⚠️  + {w.id} {w.description}{detail}")
+    for key, w in old_warnings.items():
+        if key not in new_warnings:
+            lines.append(f"  ➖ {w.id} {w.description} (resolved)")
+
+    if len(lines) == 1:
+        lines.append("  (no check or warning changes)")
+    return "\n".join(lines)
+
+
 def format_text_report(report: ValidationReport) -> str:
     """Format validation report as text"""
     lines = []
@@ -1498,6 +2879,10 @@ def format_text_report(report: ValidationReport) -> str:
     lines.append("=== Skill Quality Validation Report ===")
     lines.append("=" * 60)
     lines.append(f"File: {report.file_path}")
+    if report.selection:
+        lines.append(f"Checks: {report.selection}")
+    if report.stopped:
+        lines.append(f"⏹️  Stopped: {report.stopped}")
     lines.append("")
     
     for category in report.categories:
@@ -1540,8 +2925,8 @@ def format_text_report(report: ValidationReport) -> str:
     return "\n".join(lines)
 
 
-def format_json_report(report: ValidationReport) -> str:
-    """Format validation report as JSON"""
+def report_to_dict(report: ValidationReport) -> Dict:
+    """Convert a validation report into the JSON-serializable report structure"""
     data = {
         "file_path": report.file_path,
         "overall": {
@@ -1553,6 +2938,10 @@ def format_json_report(report: ValidationReport) -> str:
         },
         "categories": []
     }
+    if report.selection:
+        data["selection"] = report.selection
+    if report.stopped:
+        data["stopped"] = report.stopped
     
     for category in report.categories:
         cat_data = {
@@ -1578,14 +2967,130 @@ def format_json_report(report: ValidationReport) -> str:
         {
             "id": w.id,
             "description": w.description,
-            "details": w.details
+            "details": w.details,
+            "locations": [asdict(loc) for loc in w.locations]
         }
         for w in (report.warnings or [])
     ]
     
+    return data
+
+
+def format_check_list(selection: Optional[CheckSelection] = None) -> str:
+    """One line per registered check: selected mark, ID, category, cost class and inputs"""
+    selection = selection or ALL_CHECKS
+    lines = []
+    for spec in CHECK_REGISTRY.values():
+        mark = "✅" if selection.includes(spec) else "➖"
+        lines.append(f"  {mark} {spec.id:<6} {spec.category:<13} {spec.cost:<10} "
+                     f"{', '.join(spec.inputs) or '-'}")
+    lines.append(f"{len(selection.ids)}/{len(CHECK_REGISTRY)} checks selected")
+    return "\n".join(lines)
+
+
+def format_json_report(report: ValidationReport) -> str:
+    """Format validation report as JSON"""
+    return json.dumps(report_to_dict(report), indent=2, ensure_ascii=False)
+
+
+def format_batch_text_report(batch: BatchReport) -> str:
+    """Format an aggregated batch report as text (one line per file)"""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("=== Skill Quality Validation Summary ===")
+    lines.append("=" * 60)
+
+    for report in batch.reports:
+        status = "✅" if report.overall_passed else "❌"
+        warning_note = f" ⚠️ {len(report.warnings)}" if report.warnings else ""
+        lines.append(f"  {status} {report.overall_percentage:5.1f}%  {report.file_path}{warning_note}")
+        if not report.overall_passed:
+            failed_ids = [c.id for category in report.categories for c in category.checks if not c.passed]
+            if failed_ids:
+                lines.append(f"       Failed: {', '.join(failed_ids)}")
+            if report.stopped:
+                lines.append(f"       Stopped: {report.stopped}")
+
+    for file_path, error in batch.errors:
+        lines.append(f"  💥 ERROR   {file_path}")
+        lines.append(f"       {error}")
+
+    lines.append("")
+    lines.append("-" * 60)
+    lines.append(f"Total: {len(batch.reports) + len(batch.errors)}  "
+                 f"✅ PASS: {batch.passed_count}  ❌ FAIL: {batch.failed_count}  "
+                 f"💥 ERROR: {len(batch.errors)}")
+    overall_status = "✅ PASS" if batch.all_passed else "❌ FAIL"
+    lines.append(f"Overall: {overall_status}")
+    lines.append("-" * 60)
+
+    return "\n".join(lines)
+
+
+def format_batch_json_report(batch: BatchReport) -> str:
+    """Format an aggregated batch report as JSON"""
+    data = {
+        "summary": {
+            "total": len(batch.reports) + len(batch.errors),
+            "passed": batch.passed_count,
+            "failed": batch.failed_count,
+            "errors": len(batch.errors),
+            "all_passed": batch.all_passed
+        },
+        "files": [report_to_dict(report) for report in batch.reports],
+        "errors": [
+            {"file_path": file_path, "error": error}
+            for file_path, error in batch.errors
+        ]
+    }
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+def jsonl_records(file_path: str, report: Optional[ValidationReport], error: Optional[str],
+                  per_check: bool = False) -> Iterator[Dict]:
+    """JSON Lines records for one validated file: a "file" record (or "error"),
+    optionally preceded by one "check" record per check"""
+    if report is None:
+        yield {"record": "error", "file_path": file_path, "error": error}
+        return
+    if per_check:
+        for category in report.categories:
+            for check in category.checks:
+                yield {
+                    "record": "check",
+                    "file_path": report.file_path,
+                    "category": category.name,
+                    "id": check.id,
+                    "description": check.description,
+                    "passed": check.passed,
+                    "details": check.details
+                }
+    yield {"record": "file", **report_to_dict(report)}
+
+
+def write_jsonl_stream(results: Iterator[Tuple[str, Optional[ValidationReport], Optional[str]]],
+                       stream, per_check: bool = False) -> Dict[str, int]:
+    """Write one compact JSON line per record as each file finishes; reports are not retained.
+
+    Ends with a "summary" record and returns its counts.
+    """
+    summary = {"total": 0, "passed": 0, "failed": 0, "errors": 0}
+    for file_path, report, error in results:
+        for record in jsonl_records(file_path, report, error, per_check=per_check):
+            stream.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        stream.flush()
+        summary["total"] += 1
+        if report is None:
+            summary["errors"] += 1
+        elif report.overall_passed:
+            summary["passed"] += 1
+        else:
+            summary["failed"] += 1
+    stream.write(json.dumps({"record": "summary", **summary}, separators=(',', ':')) + "\n")
+    stream.flush()
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate SKILL.md against quality checklist (supports legacy + single-workflow)",
@@ -1596,12 +3101,122 @@ Examples:
   uv run python validate_skill.py path/to/SKILL.md --json
   uv run python validate_skill.py path/to/SKILL.md --output report.txt
   uv run python validate_skill.py path/to/SKILL.md --json --output report.json
+  uv run python validate_skill.py skills/ dotnet/ python/ --recursive
+  uv run python validate_skill.py skills/ --recursive --workers 4 --json
+  uv run python validate_skill.py skills/ archive/ --recursive --jsonl > reports.jsonl
+  uv run python validate_skill.py skills/ --recursive --profile --profile-stacks stacks.txt
+  uv run python validate_skill.py --changed-since origin/main
+  uv run python validate_skill.py --staged
+  uv run python validate_skill.py --staged --max-cost cheap
+  uv run python validate_skill.py path/to/SKILL.md --only 1.*,W5
+  uv run python validate_skill.py skills/ --recursive --skip W4
+  uv run python validate_skill.py --list-checks
+  uv run python validate_skill.py --staged --fail-fast --time-budget 200
         """
     )
     
     parser.add_argument(
-        'skill_file',
-        help='Path to SKILL.md file to validate'
+        'skill_files',
+        nargs='*',
+        metavar='PATH',
+        help='SKILL.md file(s) or skill directories to validate '
+             '(with --changed-since/--staged: limit to changes under these paths)'
+    )
+    
+    parser.add_argument(
+        '--changed-since',
+        metavar='REF',
+        help='Validate only skills whose SKILL.md or SKILL.ja.md changed between REF and HEAD'
+    )
+    
+    parser.add_argument(
+        '--staged',
+        action='store_true',
+        help='Validate only skills with staged changes, reading the staged blobs (pre-commit)'
+    )
+    
+    parser.add_argument(
+        '--only',
+        metavar='IDS',
+        help='Run only these checks: comma-separated IDs or globs (e.g. "1.*,W5"; "2.1" covers 2.1.x)'
+    )
+    
+    parser.add_argument(
+        '--skip',
+        metavar='IDS',
+        help='Do not run these checks (same syntax as --only)'
+    )
+    
+    parser.add_argument(
+        '--max-cost',
+        choices=COST_CLASSES,
+        help='Run only checks up to this cost class (cheap: outline only, scan: full text, '
+             'cross-file: JA file and repo context)'
+    )
+    
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop a file at the first failure after which a category cannot reach 80%% '
+             'or the overall score 85%%'
+    )
+    
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='MS',
+        help='Per-file time budget in milliseconds; a file over budget fails, naming the check '
+             'that was running'
+    )
+    
+    parser.add_argument(
+        '--list-checks',
+        action='store_true',
+        help='List the registered checks with their inputs and cost class, then exit'
+    )
+    
+    parser.add_argument(
+        '--recursive', '-r',
+        action='store_true',
+        help='Search directories recursively for SKILL.md files'
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for batch validation (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and revalidate skills whenever SKILL.md or SKILL.ja.md changes'
+    )
+    
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='Polling interval in seconds for --watch (default: 1.0)'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse stored reports for unchanged skills (default dir: ~/.cache/skill-quality-validation)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache directory (implies --cache)'
+    )
+    
+    parser.add_argument(
+        '--cache-max-mb',
+        type=float,
+        default=ResultCache.DEFAULT_MAX_BYTES / (1024 * 1024),
+        help='Cache size cap in MB; least recently used entries are evicted (default: 50)'
     )
     
     parser.add_argument(
@@ -1610,6 +3225,37 @@ Examples:
         help='Output report in JSON format'
     )
     
+    parser.add_argument(
+        '--jsonl',
+        action='store_true',
+        help='Stream one compact JSON record per file as it finishes (JSON Lines)'
+    )
+    
+    parser.add_argument(
+        '--jsonl-checks',
+        action='store_true',
+        help='With --jsonl, also emit one record per check (implies --jsonl)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time every check, validator and file; print the slowest to stderr'
+    )
+    
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=10,
+        help='Number of slowest checks/files listed by --profile (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--profile-stacks',
+        metavar='FILE',
+        help='Write collapsed-stack timings for flame graph tools (implies --profile)'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         help='Write report to file instead of stdout'
@@ -1624,11 +3270,66 @@ Examples:
     args = parser.parse_args()
     
     try:
+        args.selection = CheckSelection.parse(args.only, args.skip, args.max_cost)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    if args.list_checks:
+        print(format_check_list(args.selection))
+        exit(0)
+    
+    if args.watch and (args.changed_since or args.staged):
+        parser.error('--watch cannot be combined with --changed-since or --staged')
+    if not args.skill_files and not (args.changed_since or args.staged):
+        parser.error('at least one PATH is required unless --changed-since or --staged is given')
+    
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error('--time-budget must be positive')
+    args.early_exit = EarlyExit(
+        fail_fast=args.fail_fast,
+        time_budget=args.time_budget / 1000 if args.time_budget is not None else None,
+    )
+    
+    args.result_cache = None
+    if args.cache or args.cache_dir:
+        args.result_cache = ResultCache(
+            Path(args.cache_dir) if args.cache_dir else ResultCache.default_directory(),
+            max_bytes=int(args.cache_max_mb * 1024 * 1024),
+        )
+    
+    args.profiler = Profiler() if args.profile or args.profile_stacks else None
+    
+    if args.watch:
+        run_watch(args)
+    
+    if args.changed_since or args.staged:
+        run_changed(args)
+    
+    # One scandir pass answers every JA/glossary/mtime lookup of this run
+    roots = [p if os.path.isdir(p) else os.path.dirname(os.path.abspath(p)) for p in args.skill_files]
+    use_repo_index(RepoIndex.scan(roots))
+    if args.verbose:
+        print(f"Indexed {len(REPO_INDEX.skills)} skills in {REPO_INDEX.directories_scanned} directories")
+    
+    skill_files = find_skill_files(args.skill_files, recursive=args.recursive, index=REPO_INDEX)
+    if not skill_files:
+        print("Error: No SKILL.md files found", file=sys.stderr)
+        exit(2)
+    
+    if args.jsonl or args.jsonl_checks:
+        run_jsonl(args, [str(p) for p in skill_files])
+    
+    if len(skill_files) > 1 or args.recursive:
+        run_batch(args, [str(p) for p in skill_files])
+    
+    try:
+        skill_file = str(skill_files[0])
         if args.verbose:
-            print(f"Validating: {args.skill_file}")
+            print(f"Validating: {skill_file}")
             print("Running checks...")
         
-        report = validate_skill_file(args.skill_file)
+        report = validate_skill_file(skill_file, cache=args.result_cache, profiler=args.profiler,
+                                     selection=args.selection, early_exit=args.early_exit)
         
         if args.json:
             output = format_json_report(report)
@@ -1640,6 +3341,7 @@ Examples:
             print(f"Report written to: {args.output}")
         else:
             print(output)
+        emit_profile(args)
         
         # Exit with appropriate code
         exit(0 if report.overall_passed else 1)
@@ -1655,6 +3357,121 @@ Examples:
         exit(3)
 
 
+def run_changed(args: argparse.Namespace) -> None:
+    """Validate only the skills touched since --changed-since (or staged), read from git"""
+    try:
+        changes = collect_changes('.', since=args.changed_since, staged=args.staged)
+    except GitError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        exit(2)
+    
+    if args.skill_files:
+        prefixes = [os.path.abspath(p) for p in args.skill_files]
+        changes.skills = [
+            skill for skill in changes.skills
+            if any(changes.absolute(skill.skill_file) == p
+                   or changes.absolute(skill.skill_file).startswith(p + os.sep) for p in prefixes)
+        ]
+    if args.verbose:
+        source = 'staged' if args.staged else f'{args.changed_since}..HEAD'
+        print(f"{len(changes.paths)} changed paths ({source}), {len(changes.skills)} skills, "
+              f"{changes.blobs_read} blobs read")
+    if not changes.skills:
+        print("No changed SKILL.md files")
+        exit(0)
+    
+    batch = validate_changes(changes, selection=args.selection, early_exit=args.early_exit)
+    if args.json:
+        output = format_batch_json_report(batch)
+    else:
+        output = format_batch_text_report(batch)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Report written to: {args.output}")
+    else:
+        print(output)
+    
+    if batch.errors:
+        exit(2)
+    exit(0 if batch.all_passed else 1)
+
+
+def run_batch(args: argparse.Namespace, skill_files: List[str]) -> None:
+    """Validate many files in one process pool and emit one aggregated report"""
+    if args.verbose:
+        print(f"Validating {len(skill_files)} files...")
+    
+    batch = validate_many(skill_files, workers=args.workers, cache=args.result_cache,
+                          profiler=args.profiler, selection=args.selection, early_exit=args.early_exit)
+    
+    if args.json:
+        output = format_batch_json_report(batch)
+    else:
+        output = format_batch_text_report(batch)
+    
+    if args.output:
+        Path(args.output).write_text(output, encoding='utf-8')
+        print(f"Report written to: {args.output}")
+    else:
+        print(output)
+    emit_profile(args)
+    
+    # Errors (unreadable files) outrank quality failures
+    if batch.errors:
+        exit(2)
+    exit(0 if batch.all_passed else 1)
+
+
+def emit_profile(args: argparse.Namespace) -> None:
+    """Print the --profile report to stderr (stdout may carry JSON) and write --profile-stacks"""
+    if args.profiler is None:
+        return
+    print(format_profile_report(args.profiler, top=args.profile_top), file=sys.stderr)
+    if args.profile_stacks:
+        Path(args.profile_stacks).write_text(args.profiler.collapsed_stacks(), encoding='utf-8')
+        print(f"Collapsed stacks written to: {args.profile_stacks}", file=sys.stderr)
+
+
+def run_jsonl(args: argparse.Namespace, skill_files: List[str]) -> None:
+    """Stream JSON Lines records to stdout (or --output) while the batch runs"""
+    results = iter_validate(skill_files, workers=args.workers, cache=args.result_cache,
+                            profiler=args.profiler, selection=args.selection, early_exit=args.early_exit)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            summary = write_jsonl_stream(results, stream, per_check=args.jsonl_checks)
+        print(f"Report written to: {args.output}", file=sys.stderr)
+    else:
+        summary = write_jsonl_stream(results, sys.stdout, per_check=args.jsonl_checks)
+    emit_profile(args)
+    
+    if summary["errors"]:
+        exit(2)
+    exit(0 if summary["failed"] == 0 else 1)
+
+
+def run_watch(args: argparse.Namespace) -> None:
+    """Validate everything once, then poll and print per-skill diffs until interrupted"""
+    watcher = SkillWatcher(args.skill_files, cache=args.result_cache, selection=args.selection,
+                           early_exit=args.early_exit)
+    batch = watcher.start(workers=args.workers)
+    print(format_batch_text_report(batch))
+    print(f"\n👀 Watching {len(watcher.stamps)} files (Ctrl+C to stop)...")
+    
+    try:
+        while True:
+            time.sleep(args.interval)
+            started = time.perf_counter()
+            changes = watcher.poll()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            for skill_file, previous, current in changes:
+                print(format_watch_diff(skill_file, previous, current), flush=True)
+            if changes and args.verbose:
+                print(f"  (revalidated in {elapsed_ms:.0f} ms)", flush=True)
+    except KeyboardInterrupt:
+        exit(0)
+
+
 if __name__ == "__main__":
     import sys
     main()
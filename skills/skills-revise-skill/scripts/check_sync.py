@@ -9,6 +9,10 @@ Usage:
     python scripts/check_sync.py path/to/skill-directory/
     python scripts/check_sync.py path/to/skill-directory/ --strict
     python scripts/check_sync.py path/to/skill-directory/ --json
+    python scripts/check_sync.py --all
+    python scripts/check_sync.py path/to/repo/ --all --workers 4 --json
+    python scripts/check_sync.py --changed-since origin/main
+    python scripts/check_sync.py --staged
 """
 
 import argparse
@@ -17,14 +21,23 @@ import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Shared tokenizer and per-process document memo (also used by validate_skill.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "skill-quality-validation" / "scripts"))
+
+from skill_corpus import (
+    ChangeSet, GitError, MarkdownDocument, TableBlock, collect_changes, load_document,
+    table_shape_mismatches,
+)
+
 
 class SkillDocument:
     """Represents a parsed SKILL.md document"""
     
-    def __init__(self, filepath: Path):
+    def __init__(self, filepath: Path, content: Optional[str] = None):
         self.filepath = filepath
         self.content = ""
         self.frontmatter = {}
@@ -32,15 +45,21 @@ class SkillDocument:
         self.pattern_count = 0
         self.good_examples = 0
         self.bad_examples = 0
-        self.tables = []
+        self.tables: List[TableBlock] = []
+        self.document: Optional[MarkdownDocument] = None
+        # content: the file as stored in git (see --staged); None reads filepath
+        self._exists = content is not None or filepath.exists()
         
-        if filepath.exists():
+        if content is not None:
+            self.document = MarkdownDocument(content)
+            self._parse()
+        elif self._exists:
+            self.document = load_document(self.filepath)
             self._parse()
     
     def _parse(self):
-        """Parse the SKILL.md file"""
-        with open(self.filepath, 'r', encoding='utf-8') as f:
-            self.content = f.read()
+        """Parse the SKILL.md file (read and tokenized once per process via skill_corpus)"""
+        self.content = self.document.content
         
         self._parse_frontmatter()
         self._parse_sections()
@@ -78,13 +97,8 @@ class SkillDocument:
                 ]
     
     def _parse_sections(self):
-        """Extract H2 section headers"""
-        # Remove frontmatter first
-        content_without_fm = re.sub(r'^---\n.*?\n---\n', '', self.content, flags=re.DOTALL)
-        
-        # Find all H2 headers
-        section_matches = re.finditer(r'^##\s+(.+)$', content_without_fm, re.MULTILINE)
-        self.sections = [match.group(1).strip() for match in section_matches]
+        """Extract H2 section headers (frontmatter and fenced code excluded)"""
+        self.sections = [heading.title for heading in self.document.headings_at(2)]
     
     def _count_patterns(self):
         """Count Pattern 1, Pattern 2, etc."""
@@ -97,41 +111,23 @@ class SkillDocument:
         self.bad_examples = len(re.findall(r'❌', self.content))
     
     def _parse_tables(self):
-        """Extract table structures"""
-        # Find markdown tables (lines with |)
-        lines = self.content.split('\n')
-        in_table = False
-        current_table = []
-        
-        for line in lines:
-            stripped = line.strip()
-            if '|' in stripped and stripped.startswith('|'):
-                if not in_table:
-                    in_table = True
-                    current_table = []
-                current_table.append(line)
-            else:
-                if in_table and current_table:
-                    self.tables.append(current_table)
-                    current_table = []
-                in_table = False
-        
-        if current_table:
-            self.tables.append(current_table)
+        """Table structures, shared with validate_skill.py (fenced code excluded)"""
+        self.tables = self.document.tables
     
     def exists(self) -> bool:
         """Check if the file exists"""
-        return self.filepath.exists()
+        return self._exists
 
 
 class SyncChecker:
     """Checks synchronization between EN and JA versions"""
     
-    def __init__(self, skill_dir: Path, strict: bool = False):
+    def __init__(self, skill_dir: Path, strict: bool = False,
+                 en_content: Optional[str] = None, ja_content: Optional[str] = None):
         self.skill_dir = skill_dir
         self.strict = strict
-        self.en_doc = SkillDocument(skill_dir / "SKILL.md")
-        self.ja_doc = SkillDocument(skill_dir / "references" / "SKILL.ja.md")
+        self.en_doc = SkillDocument(skill_dir / "SKILL.md", en_content)
+        self.ja_doc = SkillDocument(skill_dir / "references" / "SKILL.ja.md", ja_content)
         self.issues = []
         self.warnings = []
         self.successes = []
@@ -279,6 +275,19 @@ class SyncChecker:
             self.successes.append(('tables', f'Table count: {en_tables}/{ja_tables} match'))
         else:
             self.warnings.append(('tables', f'Table count differs: EN={en_tables}, JA={ja_tables}'))
+        
+        # Shape (columns x data rows) of each table pair, in document order
+        mismatches = table_shape_mismatches(self.en_doc.tables, self.ja_doc.tables)
+        if not mismatches:
+            compared = min(en_tables, ja_tables)
+            if compared:
+                self.successes.append(('tables', f'Table shapes: {compared} table(s) match'))
+        for number, en, ja in mismatches:
+            self.warnings.append((
+                'tables',
+                f'Table {number} shape differs: EN={en.columns}x{en.row_count} (line {en.start + 1}), '
+                f'JA={ja.columns}x{ja.row_count} (line {ja.start + 1})'
+            ))
     
     def _get_overall_status(self) -> str:
         """Determine overall synchronization status"""
@@ -325,6 +334,10 @@ class SyncChecker:
                     recommendations.append("Review good example markers (✅) in both versions")
                 else:
                     recommendations.append("Review bad example markers (❌) in both versions")
+            
+            elif 'shape differs' in message:
+                table = re.search(r'Table (\d+)', message).group(1)
+                recommendations.append(f"Align columns/rows of table {table} in references/SKILL.ja.md")
         
         return recommendations
 
@@ -393,9 +406,15 @@ def print_text_report(result: Dict, skill_dir: Path):
             print(f"{i}. {rec}")
 
 
-def print_json_report(result: Dict, skill_dir: Path):
-    """Print JSON report"""
-    output = {
+def result_to_dict(result: Dict, skill_dir: Path) -> Dict:
+    """Convert a check() result to the JSON report structure"""
+    if result['status'] == 'ERROR':
+        return {
+            'directory': str(skill_dir.absolute()),
+            'status': result['status'],
+            'message': result['message']
+        }
+    return {
         'directory': str(skill_dir.absolute()),
         'status': result['status'],
         'is_system_skill': result['is_system_skill'],
@@ -404,9 +423,141 @@ def print_json_report(result: Dict, skill_dir: Path):
         'successes': [{'category': c, 'message': m} for c, m in result['successes']],
         'recommendations': result['recommendations']
     }
+
+
+def print_json_report(result: Dict, skill_dir: Path):
+    """Print JSON report"""
+    print(json.dumps(result_to_dict(result, skill_dir), indent=2, ensure_ascii=False))
+
+
+def exit_code_for(status: str, strict: bool) -> int:
+    """0 = in sync, 1 = out of sync (warnings count in strict mode), 2 = error"""
+    if status == 'ERROR':
+        return 2
+    if status == 'PARTIAL SYNC':
+        return 1
+    if status == 'SYNC WITH WARNINGS' and strict:
+        return 1
+    return 0
+
+
+# --- Repository-wide mode ---
+
+STATUS_SEVERITY = {'FULL SYNC': 0, 'SYNC WITH WARNINGS': 1, 'PARTIAL SYNC': 2, 'ERROR': 3}
+
+
+def find_skill_directories(root: Path) -> List[Path]:
+    """Find every skill directory under root that has references/SKILL.ja.md.
+
+    Hidden directories and references/ folders are not descended into.
+    """
+    skill_dirs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith('.') and d != 'references'
+        )
+        if 'SKILL.md' in filenames and os.path.isfile(os.path.join(dirpath, 'references', 'SKILL.ja.md')):
+            skill_dirs.append(Path(dirpath))
+    return skill_dirs
+
+
+def _check_for_pool(skill_dir: Path, strict: bool) -> Tuple[Path, Dict]:
+    """Process-pool worker: run one SyncChecker (module-level so it can be pickled)"""
+    try:
+        return skill_dir, SyncChecker(skill_dir, strict=strict).check()
+    except (OSError, UnicodeDecodeError) as e:
+        return skill_dir, {'status': 'ERROR', 'message': str(e)}
+
+
+def check_many(skill_dirs: List[Path], strict: bool = False,
+               workers: Optional[int] = None) -> List[Tuple[Path, Dict]]:
+    """Run SyncChecker over many skill directories in a process pool (input order kept)"""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(skill_dirs) <= 1:
+        return [_check_for_pool(d, strict) for d in skill_dirs]
+    workers = min(workers, len(skill_dirs))
+    chunksize = max(1, len(skill_dirs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            _check_for_pool, skill_dirs, [strict] * len(skill_dirs), chunksize=chunksize
+        ))
+
+
+def check_changes(changes: ChangeSet, strict: bool = False) -> List[Tuple[Path, Dict]]:
+    """Run SyncChecker on the touched skills from their git blobs (no file is opened).
+
+    Like --all, only skills with references/SKILL.ja.md are checked.
+    """
+    results = []
+    for skill in changes.skills:
+        skill_dir = Path(changes.absolute(skill.skill_file)).parent
+        ja_content = skill.ja_content if skill.ja_file and skill.ja_file.endswith('references/SKILL.ja.md') else None
+        if ja_content is None:
+            continue
+        checker = SyncChecker(skill_dir, strict=strict, en_content=skill.content, ja_content=ja_content)
+        results.append((skill_dir, checker.check()))
+    return results
+
+
+def worst_status(results: List[Tuple[Path, Dict]]) -> str:
+    """Most severe status across all results (FULL SYNC when there are none)"""
+    statuses = [result['status'] for _, result in results] or ['FULL SYNC']
+    return max(statuses, key=STATUS_SEVERITY.__getitem__)
+
+
+def print_summary_table(results: List[Tuple[Path, Dict]], root: Path):
+    """Print one row per skill directory, most severe first, then totals"""
+    icons = {'FULL SYNC': '✅', 'SYNC WITH WARNINGS': '⚠️ ', 'PARTIAL SYNC': '❌', 'ERROR': '💥'}
+    print("=== EN/JA Synchronization Check (repository) ===")
+    print(f"Root: {root.absolute()}\n")
+    
+    rows = sorted(
+        results,
+        key=lambda item: (-STATUS_SEVERITY[item[1]['status']], str(item[0]))
+    )
+    name_width = max([len(_relative(d, root)) for d, _ in rows] + [5])
+    print(f"   {'Skill':<{name_width}}  {'Status':<18}  {'Issues':>6}  {'Warnings':>8}")
+    print(f"   {'-' * name_width}  {'-' * 18}  {'-' * 6}  {'-' * 8}")
+    for skill_dir, result in rows:
+        status = result['status']
+        issues = len(result.get('issues', []))
+        warnings = len(result.get('warnings', []))
+        print(f"{icons[status]} {_relative(skill_dir, root):<{name_width}}  {status:<18}  {issues:>6}  {warnings:>8}")
+    
+    counts = defaultdict(int)
+    for _, result in results:
+        counts[result['status']] += 1
+    print()
+    print(f"[Summary] {len(results)} skill(s): " + ", ".join(
+        f"{status} {counts[status]}" for status in STATUS_SEVERITY if counts[status]
+    ))
+    print(f"Worst status: {worst_status(results)}")
+
+
+def print_summary_json(results: List[Tuple[Path, Dict]], root: Path):
+    """Print combined JSON report for repository-wide mode"""
+    counts = defaultdict(int)
+    for _, result in results:
+        counts[result['status']] += 1
+    output = {
+        'root': str(root.absolute()),
+        'summary': {
+            'total': len(results),
+            'worst_status': worst_status(results),
+            'by_status': {status: counts[status] for status in STATUS_SEVERITY}
+        },
+        'skills': [result_to_dict(result, skill_dir) for skill_dir, result in results]
+    }
     print(json.dumps(output, indent=2, ensure_ascii=False))
 
 
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Check synchronization between EN and JA SKILL.md files',
@@ -416,13 +567,44 @@ Examples:
   python scripts/check_sync.py path/to/skill-directory/
   python scripts/check_sync.py path/to/skill-directory/ --strict
   python scripts/check_sync.py path/to/skill-directory/ --json
+  python scripts/check_sync.py --all
+  python scripts/check_sync.py path/to/repo/ --all --workers 4 --json
+  python scripts/check_sync.py --changed-since origin/main
+  python scripts/check_sync.py --staged
         """
     )
     
     parser.add_argument(
         'skill_directory',
         type=str,
-        help='Path to the skill directory containing SKILL.md'
+        nargs='?',
+        help='Path to the skill directory containing SKILL.md '
+             '(with --all: root to scan, with --changed-since/--staged: repository, default: .)'
+    )
+    
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Check every skill directory with references/SKILL.ja.md under the given root'
+    )
+    
+    parser.add_argument(
+        '--changed-since',
+        metavar='REF',
+        help='Check only skills whose SKILL.md or SKILL.ja.md changed between REF and HEAD'
+    )
+    
+    parser.add_argument(
+        '--staged',
+        action='store_true',
+        help='Check only skills with staged changes, reading the staged blobs (pre-commit)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for --all (default: CPU count)'
     )
     
     parser.add_argument(
@@ -445,6 +627,15 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.changed_since or args.staged:
+        run_changed(args)
+    
+    if args.all:
+        run_all(args)
+    
+    if args.skill_directory is None:
+        parser.error('skill_directory is required unless --all is given')
+    
     skill_dir = Path(args.skill_directory)
     
     if not skill_dir.exists():
@@ -466,14 +657,49 @@ Examples:
         print_text_report(result, skill_dir)
     
     # Exit code
-    if result['status'] == 'ERROR':
+    sys.exit(exit_code_for(result['status'], args.strict))
+
+
+def run_changed(args: argparse.Namespace):
+    """Changed-only mode: check the skills touched since --changed-since (or staged), read from git"""
+    try:
+        changes = collect_changes(args.skill_directory or '.', since=args.changed_since, staged=args.staged)
+    except GitError as e:
+        print(f"❌ ERROR: {e}", file=sys.stderr)
         sys.exit(2)
-    elif result['status'] == 'PARTIAL SYNC':
-        sys.exit(1)
-    elif result['status'] == 'SYNC WITH WARNINGS' and args.strict:
+    
+    results = check_changes(changes, strict=args.strict)
+    root = Path(changes.repo_root)
+    if args.json:
+        print_summary_json(results, root)
+    elif results:
+        print_summary_table(results, root)
+    else:
+        print("No changed skills with references/SKILL.ja.md")
+    
+    sys.exit(max([exit_code_for(result['status'], args.strict) for _, result in results] + [0]))
+
+
+def run_all(args: argparse.Namespace):
+    """Repository-wide mode: check all skill directories in parallel, exit with the worst status"""
+    root = Path(args.skill_directory or '.')
+    if not root.is_dir():
+        print(f"❌ ERROR: Directory not found: {root}", file=sys.stderr)
         sys.exit(1)
+    
+    skill_dirs = find_skill_directories(root)
+    if not skill_dirs:
+        print(f"❌ ERROR: No skill directories with references/SKILL.ja.md under {root}", file=sys.stderr)
+        sys.exit(2)
+    
+    results = check_many(skill_dirs, strict=args.strict, workers=args.workers)
+    
+    if args.json:
+        print_summary_json(results, root)
     else:
-        sys.exit(0)
+        print_summary_table(results, root)
+    
+    sys.exit(max(exit_code_for(result['status'], args.strict) for _, result in results))
 
 
 if __name__ == '__main__':